@@ -1,14 +1,17 @@
 """OpenAPI spec validator module."""
 
 from openapi_spec_validator.shortcuts import validate
+from openapi_spec_validator.shortcuts import validate_many
 from openapi_spec_validator.shortcuts import validate_spec
 from openapi_spec_validator.shortcuts import validate_spec_url
 from openapi_spec_validator.shortcuts import validate_url
+from openapi_spec_validator.validation import IncrementalSpecValidator
 from openapi_spec_validator.validation import OpenAPIV2SpecValidator
 from openapi_spec_validator.validation import OpenAPIV3SpecValidator
 from openapi_spec_validator.validation import OpenAPIV30SpecValidator
 from openapi_spec_validator.validation import OpenAPIV31SpecValidator
 from openapi_spec_validator.validation import OpenAPIV32SpecValidator
+from openapi_spec_validator.validation import SpecValidationEngine
 from openapi_spec_validator.validation import openapi_v2_spec_validator
 from openapi_spec_validator.validation import openapi_v3_spec_validator
 from openapi_spec_validator.validation import openapi_v30_spec_validator
@@ -32,7 +35,10 @@ __all__ = [
     "OpenAPIV30SpecValidator",
     "OpenAPIV31SpecValidator",
     "OpenAPIV32SpecValidator",
+    "SpecValidationEngine",
+    "IncrementalSpecValidator",
     "validate",
+    "validate_many",
     "validate_url",
     "validate_spec",
     "validate_spec_url",
@@ -12,12 +12,12 @@ from openapi_spec_validator import schemas
 from openapi_spec_validator.readers import read_from_filename
 from openapi_spec_validator.readers import read_from_stdin
 from openapi_spec_validator.shortcuts import get_validator_cls
-from openapi_spec_validator.shortcuts import validate
 from openapi_spec_validator.validation import OpenAPIV2SpecValidator
 from openapi_spec_validator.validation import OpenAPIV30SpecValidator
 from openapi_spec_validator.validation import OpenAPIV31SpecValidator
 from openapi_spec_validator.validation import OpenAPIV32SpecValidator
 from openapi_spec_validator.validation import SpecValidator
+from openapi_spec_validator.validation.timings import KeywordTimings
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -70,6 +70,20 @@ def print_validationerror(
             )
 
 
+def print_timings(filename: str, timings: KeywordTimings) -> None:
+    print(f"{filename}: Timings")
+    print(
+        f"{'keyword':<24} {'calls':>8} {'errors':>8} "
+        f"{'total [s]':>10} {'self [s]':>10}"
+    )
+    for keyword, timing in timings.as_dict().items():
+        print(
+            f"{keyword:<24} {timing['calls']:>8} {timing['errors']:>8} "
+            f"{timing['total_seconds']:>10.4f} "
+            f"{timing['self_seconds']:>10.4f}"
+        )
+
+
 def should_warn_deprecated() -> bool:
     return os.getenv("OPENAPI_SPEC_VALIDATOR_WARN_DEPRECATED", "1") != "0"
 
@@ -100,6 +114,28 @@ def main(args: Sequence[str] | None = None) -> None:
         help="""Control validation errors count. Defaults to "first", """
         """use "all" to get all validation errors.""",
     )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=None,
+        metavar="N",
+        help="""Stop validation after N errors with "--validation-errors all".""",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="PATTERN",
+        help="""Validate only matching paths and components, with schemas """
+        """they reference. PATTERN is a path template ("/pets/{petId}"), """
+        """a JSON pointer prefix ("#/components/schemas") or a component """
+        """name ("Pet"). Can be repeated.""",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="""Print calls, errors and time of keyword validators, """
+        """such as "paths", "operation" or "schema".""",
+    )
     parser.add_argument(
         "--errors",
         "--error",
@@ -131,6 +167,8 @@ def main(args: Sequence[str] | None = None) -> None:
         version=f"%(prog)s {__version__}",
     )
     args_parsed = parser.parse_args(args)
+    if args_parsed.max_errors is not None and args_parsed.max_errors < 1:
+        parser.error("argument --max-errors: expected a positive number")
 
     subschema_errors = args_parsed.subschema_errors
     if args_parsed.deprecated_subschema_errors is not None:
@@ -181,12 +219,21 @@ def main(args: Sequence[str] | None = None) -> None:
         validator_cls = validators[args_parsed.schema]
 
         # validate
+        timings: KeywordTimings | None = None
         try:
+            if validator_cls is None:
+                validator_cls = get_validator_cls(spec)
+            validator = validator_cls(
+                spec,
+                base_uri=base_uri,
+                include=args_parsed.only,
+                timings=args_parsed.timings,
+            )
+            timings = validator.keyword_timings
             if args_parsed.validation_errors == "all":
-                if validator_cls is None:
-                    validator_cls = get_validator_cls(spec)
-                validator = validator_cls(spec, base_uri=base_uri)
-                errors = list(validator.iter_errors())
+                errors = list(
+                    validator.iter_errors(max_errors=args_parsed.max_errors)
+                )
                 if errors:
                     for idx, err in enumerate(errors, start=1):
                         print_validationerror(
@@ -198,12 +245,17 @@ def main(args: Sequence[str] | None = None) -> None:
                                 supports_subschema_details
                             ),
                         )
-                    print(f"{filename}: {len(errors)} validation errors found")
+                    summary = (
+                        f"{filename}: {len(errors)} validation errors found"
+                    )
+                    if len(errors) == args_parsed.max_errors:
+                        summary += " (--max-errors reached)"
+                    print(summary)
                     sys.exit(1)
                 print_ok(filename)
                 continue
 
-            validate(spec, base_uri=base_uri, cls=validator_cls)
+            validator.validate()
         except ValidationError as exc:
             print_validationerror(
                 filename,
@@ -217,6 +269,10 @@ def main(args: Sequence[str] | None = None) -> None:
             sys.exit(2)
         else:
             print_ok(filename)
+        finally:
+            # also printed if validation failed
+            if timings is not None:
+                print_timings(filename, timings)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,94 @@
+import json
+import mmap
+import re
 import sys
 from os import path
 from pathlib import Path
+from typing import Any
+from typing import cast
 
-from jsonschema_path.handlers import all_urls_handler
 from jsonschema_path.handlers import file_handler
 from jsonschema_path.typing import Schema
 
+# JSON documents are objects or arrays, optionally after a BOM
+JSON_START_RE = re.compile(r"\ufeff?\s*[\[{]")
+JSON_START_BYTES_RE = re.compile(rb"(?:\xef\xbb\xbf)?\s*[\[{]")
+
+
+def is_json_like(data: str | bytes) -> bool:
+    """Check if the document starts like JSON, without decoding it."""
+    if isinstance(data, bytes):
+        return JSON_START_BYTES_RE.match(data) is not None
+    return JSON_START_RE.match(data) is not None
+
+
+def reject_constant(name: str) -> Any:
+    # not JSON, the YAML loader reads them as strings
+    raise ValueError(f"Invalid JSON constant: {name}")
+
+
+def load_json(data: str | bytes) -> Schema:
+    return cast(Schema, json.loads(data, parse_constant=reject_constant))
+
+
+def load_spec(data: str | bytes) -> Schema:
+    """Load a JSON or YAML document.
+
+    JSON is detected by its content and parsed with a JSON parser, other
+    documents (and YAML flow mappings that look like JSON) are loaded with
+    the YAML loader.
+    """
+    if is_json_like(data):
+        try:
+            return load_json(data)
+        except ValueError:
+            pass
+    return file_handler(data)  # type: ignore
+
 
 def read_from_stdin(filename: str) -> tuple[Schema, str]:
-    return file_handler(sys.stdin), ""  # type: ignore
+    return load_spec(sys.stdin.read()), ""
 
 
-def read_from_filename(filename: str) -> tuple[Schema, str]:
+def decode_json(buf: mmap.mmap) -> str | None:
+    """Decode a JSON-like buffer, ``None`` if it is not JSON-like."""
+    if JSON_START_BYTES_RE.match(buf) is None:
+        return None
+    try:
+        return str(buf, json.detect_encoding(buf[:4]))
+    except UnicodeDecodeError:
+        return None
+
+
+def get_file_uri(filename: str) -> tuple[str, str]:
     if not path.isfile(filename):
         raise OSError(f"No such file: {filename}")
 
     filename = path.abspath(filename)
-    uri = Path(filename).as_uri()
-    return all_urls_handler(uri), uri
+    return filename, Path(filename).as_uri()
+
+
+def read_from_filename(filename: str) -> tuple[Schema, str]:
+    filename, uri = get_file_uri(filename)
+    with open(filename, "rb") as f:
+        data = f.read()
+    return load_spec(data), uri
+
+
+def read_from_mmap(filename: str) -> tuple[Schema, str]:
+    """Read a spec file through a memory map.
+
+    The file is not copied into a bytes object. JSON is decoded straight
+    from the map, which is closed before parsing, and YAML is streamed
+    from the map to the YAML loader.
+    """
+    filename, uri = get_file_uri(filename)
+    with open(filename, "rb") as f:
+        # empty files can not be mapped
+        if not path.getsize(filename):
+            return load_spec(b""), uri
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            text = decode_json(buf)
+            if text is None:
+                return file_handler(buf), uri  # type: ignore
+    return load_spec(text), uri
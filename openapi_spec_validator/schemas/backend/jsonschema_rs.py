@@ -6,6 +6,8 @@ and the existing jsonschema (Python) validator interface.
 """
 
 import importlib
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Iterator
 from typing import TYPE_CHECKING
 from typing import Any
@@ -112,6 +114,10 @@ class JsonschemaRsValidatorWrapper:
         # Note: jsonschema-rs error format may differ - adjust as needed
         instance_path = getattr(rust_error, "instance_path", [])
         schema_path = getattr(rust_error, "schema_path", [])
+        kwargs: dict[str, Any] = {}
+        # the schema path ends with the failed keyword
+        if schema_path and isinstance(schema_path[-1], str):
+            kwargs["validator"] = schema_path[-1]
 
         return JsonschemaRsValidatorError(
             message=message,
@@ -119,6 +125,7 @@ class JsonschemaRsValidatorWrapper:
             schema_path=list(schema_path) if schema_path else [],
             instance=instance,
             schema=self.schema,
+            **kwargs,
         )
 
     def _convert_rust_error_exception(
@@ -153,6 +160,37 @@ def create_validator(schema: dict[str, Any]) -> JsonschemaRsValidatorWrapper:
     return JsonschemaRsValidatorWrapper(schema, validator=validator)
 
 
+def create_schema_checker(
+    meta_schema: dict[str, Any],
+    resources: Iterable[tuple[str, Any]] = (),
+) -> Callable[[Any], None]:
+    """
+    Factory function to create Rust-backed check of schemas.
+
+    Args:
+        meta_schema: Metaschema to check schemas against
+        resources: (URI, contents) pairs of referenced metaschemas
+
+    Returns:
+        Function raising ValidationError for the first metaschema error
+    """
+    module = _get_jsonschema_rs_module()
+    registry = module.Registry(list(resources))
+    validator_cls: Any = module.validator_cls_for(meta_schema)
+
+    validator = validator_cls(
+        meta_schema, registry=registry, validate_formats=True
+    )
+    wrapper = JsonschemaRsValidatorWrapper(meta_schema, validator)
+
+    def check_schema(schema: Any) -> None:
+        # converted with paths, unlike errors raised by validate()
+        for error in wrapper.iter_errors(schema):
+            raise error
+
+    return check_schema
+
+
 # Convenience function to check if Rust validators are available
 def has_jsonschema_rs_validators() -> bool:
     """Check if jsonschema-rs is available."""
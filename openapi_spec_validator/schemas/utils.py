@@ -8,8 +8,8 @@ from jsonschema_path.readers import FilePathReader
 from jsonschema_path.typing import Schema
 
 
-def get_schema(version: str) -> tuple[Schema, str]:
-    schema_path = f"resources/schemas/v{version}/schema.json"
+def get_schema(version: str, name: str = "schema") -> tuple[Schema, str]:
+    schema_path = f"resources/schemas/v{version}/{name}.json"
     ref = files("openapi_spec_validator") / schema_path
     with as_file(ref) as resource_path:
         schema_path_full = path.join(path.dirname(__file__), resource_path)
@@ -19,3 +19,9 @@ def get_schema(version: str) -> tuple[Schema, str]:
 def get_schema_content(version: str) -> Schema:
     content, _ = get_schema(version)
     return content
+
+
+def get_meta_schema_content(version: str) -> Schema:
+    """Return metaschema of the OAS vocabulary of the version."""
+    content, _ = get_schema(version, "meta")
+    return content
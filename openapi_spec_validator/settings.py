@@ -6,6 +6,8 @@ from pydantic_settings import SettingsConfigDict
 
 ENV_PREFIX = "OPENAPI_SPEC_VALIDATOR_"
 RESOLVED_CACHE_MAXSIZE_DEFAULT = 128
+RESULT_CACHE_MAXSIZE_DEFAULT = 64 * 1024 * 1024
+SUBSCHEMA_CACHE_MAXSIZE_DEFAULT = 0
 SCHEMA_VALIDATOR_BACKEND_DEFAULT = "auto"
 SCHEMA_VALIDATOR_BACKEND_ALLOWED = {
     "auto",
@@ -22,6 +24,9 @@ class OpenAPISpecValidatorSettings(BaseSettings):
 
     resolved_cache_maxsize: int = RESOLVED_CACHE_MAXSIZE_DEFAULT
     schema_validator_backend: str = SCHEMA_VALIDATOR_BACKEND_DEFAULT
+    result_cache_dir: str | None = None
+    result_cache_maxsize: int = RESULT_CACHE_MAXSIZE_DEFAULT
+    subschema_cache_maxsize: int = SUBSCHEMA_CACHE_MAXSIZE_DEFAULT
 
     @field_validator("resolved_cache_maxsize", mode="before")
     @classmethod
@@ -44,6 +49,55 @@ class OpenAPISpecValidatorSettings(BaseSettings):
 
         return parsed_value
 
+    @field_validator("result_cache_dir", mode="before")
+    @classmethod
+    def normalize_result_cache_dir(cls, value: str | None) -> str | None:
+        if not value:
+            return None
+        return value
+
+    @field_validator("result_cache_maxsize", mode="before")
+    @classmethod
+    def normalize_result_cache_maxsize(cls, value: int | str | None) -> int:
+        if value is None:
+            return RESULT_CACHE_MAXSIZE_DEFAULT
+
+        if isinstance(value, int):
+            parsed_value = value
+        elif isinstance(value, str):
+            try:
+                parsed_value = int(value)
+            except ValueError:
+                return RESULT_CACHE_MAXSIZE_DEFAULT
+        else:
+            return RESULT_CACHE_MAXSIZE_DEFAULT
+
+        if parsed_value < 0:
+            return RESULT_CACHE_MAXSIZE_DEFAULT
+
+        return parsed_value
+
+    @field_validator("subschema_cache_maxsize", mode="before")
+    @classmethod
+    def normalize_subschema_cache_maxsize(cls, value: int | str | None) -> int:
+        if value is None:
+            return SUBSCHEMA_CACHE_MAXSIZE_DEFAULT
+
+        if isinstance(value, int):
+            parsed_value = value
+        elif isinstance(value, str):
+            try:
+                parsed_value = int(value)
+            except ValueError:
+                return SUBSCHEMA_CACHE_MAXSIZE_DEFAULT
+        else:
+            return SUBSCHEMA_CACHE_MAXSIZE_DEFAULT
+
+        if parsed_value < 0:
+            return SUBSCHEMA_CACHE_MAXSIZE_DEFAULT
+
+        return parsed_value
+
     @field_validator("schema_validator_backend", mode="before")
     @classmethod
     def normalize_schema_validator_backend(cls, value: str | None) -> str:
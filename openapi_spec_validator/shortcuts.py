@@ -1,21 +1,37 @@
 """OpenAPI spec validator shortcuts module."""
 
+import os
+import pickle
 import warnings
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures import wait
+from time import perf_counter
 
-from jsonschema_path import SchemaPath
 from jsonschema_path.handlers import all_urls_handler
 from jsonschema_path.typing import Schema
 
-from openapi_spec_validator.settings import OpenAPISpecValidatorSettings
+from openapi_spec_validator.readers import read_from_filename
 from openapi_spec_validator.validation import OpenAPIV2SpecValidator
 from openapi_spec_validator.validation import OpenAPIV30SpecValidator
 from openapi_spec_validator.validation import OpenAPIV31SpecValidator
 from openapi_spec_validator.validation import OpenAPIV32SpecValidator
+from openapi_spec_validator.validation import SpecValidationEngine
+from openapi_spec_validator.validation.datatypes import SpecValidationResult
 from openapi_spec_validator.validation.exceptions import ValidatorDetectError
+from openapi_spec_validator.validation.exceptions import WorkerError
 from openapi_spec_validator.validation.protocols import SupportsValidation
+from openapi_spec_validator.validation.reports import ErrorRecord
 from openapi_spec_validator.validation.types import SpecValidatorType
+from openapi_spec_validator.validation.validators import EXECUTORS
 from openapi_spec_validator.validation.validators import SpecValidator
+from openapi_spec_validator.validation.validators import check_max_errors
 from openapi_spec_validator.versions import consts as versions
 from openapi_spec_validator.versions.datatypes import SpecVersion
 from openapi_spec_validator.versions.exceptions import OpenAPIVersionNotFound
@@ -28,6 +44,12 @@ SPEC2VALIDATOR: Mapping[SpecVersion, SpecValidatorType] = {
     versions.OPENAPIV32: OpenAPIV32SpecValidator,
 }
 
+# number of specs queued per worker, to bound memory of large batches
+BATCH_PENDING_PER_WORKER = 4
+
+# engines of validate_many, one per validator class and process
+_engines: dict[SpecValidatorType, SpecValidationEngine] = {}
+
 
 def get_validator_cls(spec: Schema) -> SpecValidatorType:
     try:
@@ -45,13 +67,7 @@ def validate(
 ) -> None:
     if cls is None:
         cls = get_validator_cls(spec)
-    settings = OpenAPISpecValidatorSettings()
-    sp = SchemaPath.from_dict(
-        spec,
-        base_uri=base_uri,
-        resolved_cache_maxsize=settings.resolved_cache_maxsize,
-    )
-    v = cls(sp)
+    v = cls(spec, base_uri=base_uri)
     return v.validate()
 
 
@@ -63,6 +79,126 @@ def validate_url(
     return validate(spec, base_uri=spec_url, cls=cls)
 
 
+def validate_many(
+    specs: Iterable[Schema | str | os.PathLike[str]],
+    workers: int | None = None,
+    executor: str = "process",
+    cls: SpecValidatorType | None = None,
+    max_errors: int | None = None,
+) -> Iterator[SpecValidationResult]:
+    """Validate specs (dicts or file paths) and yield their results.
+
+    With ``workers`` specs are read and validated in a pool of worker
+    processes, or threads with ``executor="thread"``, and results are
+    yielded as they complete. Otherwise they are validated in order.
+    With ``max_errors`` validation of a spec stops after that many errors.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Unknown executor: {executor!r}. "
+            "Expected one of: process, thread."
+        )
+    if max_errors is not None:
+        check_max_errors(max_errors)
+    if workers is None or workers <= 1:
+        for index, source in enumerate(specs):
+            yield _validate_source(index, source, cls, max_errors)
+        return
+
+    pool: ProcessPoolExecutor | ThreadPoolExecutor
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+        validate_source = _validate_source
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        validate_source = _validate_source_in_worker
+    try:
+        pending: set[Future[SpecValidationResult]] = set()
+        for index, source in enumerate(specs):
+            pending.add(
+                pool.submit(validate_source, index, source, cls, max_errors)
+            )
+            if len(pending) < workers * BATCH_PENDING_PER_WORKER:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _get_engine(cls: SpecValidatorType) -> SpecValidationEngine:
+    try:
+        return _engines[cls]
+    except KeyError:
+        return _engines.setdefault(cls, SpecValidationEngine(cls))
+
+
+def _validate_source(
+    index: int,
+    source: Schema | str | os.PathLike[str],
+    cls: SpecValidatorType | None = None,
+    max_errors: int | None = None,
+) -> SpecValidationResult:
+    result = SpecValidationResult(index=index)
+    started = perf_counter()
+    try:
+        if isinstance(source, Mapping):
+            spec, base_uri = source, ""
+        else:
+            result.source = os.fspath(source)
+            spec, base_uri = read_from_filename(result.source)
+        if cls is None:
+            cls = get_validator_cls(spec)
+        result.validator_cls = cls
+    except Exception as exc:
+        result.exception = exc
+        return result
+    finally:
+        result.read_seconds = perf_counter() - started
+
+    started = perf_counter()
+    try:
+        engine = _get_engine(cls)
+        # errors found before an exception are kept
+        for error in engine.iter_errors(
+            spec, base_uri=base_uri, max_errors=max_errors
+        ):
+            result.errors.append(error)
+    except Exception as exc:
+        result.exception = exc
+    finally:
+        result.validate_seconds = perf_counter() - started
+    return result
+
+
+def _validate_source_in_worker(
+    index: int,
+    source: Schema | str | os.PathLike[str],
+    cls: SpecValidatorType | None = None,
+    max_errors: int | None = None,
+) -> SpecValidationResult:
+    """Validate the source in a worker process.
+
+    Exceptions that can not be sent back to the parent process are
+    replaced with their picklable form.
+    """
+    result = _validate_source(index, source, cls, max_errors)
+    if result.exception is not None:
+        try:
+            pickle.dumps(result.exception)
+        except Exception:
+            exc_cls = type(result.exception)
+            result.exception = WorkerError(
+                f"{exc_cls.__module__}.{exc_cls.__qualname__}",
+                str(result.exception),
+                [ErrorRecord.create_from(error) for error in result.errors],
+            )
+    return result
+
+
 def validate_spec(
     spec: Schema,
     base_uri: str = "",
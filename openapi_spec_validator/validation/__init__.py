@@ -1,3 +1,7 @@
+from openapi_spec_validator.validation.engines import SpecValidationEngine
+from openapi_spec_validator.validation.incremental import (
+    IncrementalSpecValidator,
+)
 from openapi_spec_validator.validation.proxies import DetectValidatorProxy
 from openapi_spec_validator.validation.proxies import SpecValidatorProxy
 from openapi_spec_validator.validation.validators import OpenAPIV2SpecValidator
@@ -25,6 +29,8 @@ __all__ = [
     "OpenAPIV31SpecValidator",
     "OpenAPIV32SpecValidator",
     "SpecValidator",
+    "SpecValidationEngine",
+    "IncrementalSpecValidator",
 ]
 
 # v2.0 spec
@@ -1,10 +1,72 @@
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
 from collections.abc import Iterable
 from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
 from typing import Generic
+from typing import NamedTuple
 from typing import TypeVar
+from urllib.parse import urlsplit
+
+from jsonschema.exceptions import ValidationError
+
+import openapi_spec_validator
+from openapi_spec_validator.settings import OpenAPISpecValidatorSettings
+from openapi_spec_validator.validation.exceptions import (
+    DuplicateOperationIDError,
+)
+from openapi_spec_validator.validation.exceptions import ExtraParametersError
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from openapi_spec_validator.validation.exceptions import (
+    ParameterDuplicateError,
+)
+from openapi_spec_validator.validation.exceptions import (
+    UnresolvableParameterError,
+)
+from openapi_spec_validator.validation.exceptions import ValidationTimeoutError
+from openapi_spec_validator.validation.pointers import resolve_pointer
 
 T = TypeVar("T")
 
+# keywords that make subschema results depend on other documents parts
+REFERENCE_KEYWORDS = (b"$ref", b"$dynamicRef", b"$recursiveRef")
+
+# error classes of result cache entries by name
+RESULT_CACHE_ERROR_CLASSES: dict[str, type[ValidationError]] = {
+    error_cls.__name__: error_cls
+    for error_cls in (
+        ValidationError,
+        OpenAPIValidationError,
+        ExtraParametersError,
+        ParameterDuplicateError,
+        UnresolvableParameterError,
+        DuplicateOperationIDError,
+        ValidationTimeoutError,
+    )
+}
+
+# error fields that are not set, the default of the error fields
+_UNSET = inspect.signature(ValidationError).parameters["validator"].default
+
+log = logging.getLogger(__name__)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
 
 class CachedIterable(Iterable[T], Generic[T]):
     """
@@ -62,3 +124,352 @@ class CachedIterator(Iterator[T], Generic[T]):
 
         self.position += 1
         return item
+
+
+def get_content_digest(contents: Any) -> str:
+    """Digest of a document contents.
+
+    JSON keeps the key order, which also determines the order of
+    validation errors, and equal documents always dump into equal JSON.
+    Documents that do not load back from JSON into equal contents, for
+    example with non-string keys or dates, are pickled instead.
+    """
+    try:
+        data = json.dumps(
+            contents, allow_nan=False, separators=(",", ":")
+        ).encode()
+    except (TypeError, ValueError):
+        data = None
+    if data is None or json.loads(data) != contents:
+        data = pickle.dumps(contents, protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_subschema_digest(schema_value: Any) -> tuple[str, bool] | None:
+    """Digest of a subschema contents and whether it may have references.
+
+    References are detected from the serialized contents, so any string
+    equal to a reference keyword counts. Returns None if the contents can
+    not be serialized.
+    """
+    try:
+        data = pickle.dumps(schema_value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    has_refs = any(keyword in data for keyword in REFERENCE_KEYWORDS)
+    return hashlib.sha256(data).hexdigest(), has_refs
+
+
+class SubschemaResultCache:
+    """
+    In-memory cache of subschema results by contents, shared by all spec
+    validators of a process, so identical subschemas of different specs
+    are validated once. Least recently used entries are evicted over
+    ``maxsize`` entries.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self._hits, self._misses, self.maxsize, len(self._entries)
+        )
+
+
+_subschema_result_cache: SubschemaResultCache | None = None
+_subschema_result_cache_lock = threading.Lock()
+
+
+def get_subschema_result_cache() -> SubschemaResultCache:
+    """Return the process subschema results cache.
+
+    The cache is created with the size from settings on first use.
+    """
+    global _subschema_result_cache
+    with _subschema_result_cache_lock:
+        if _subschema_result_cache is None:
+            settings = OpenAPISpecValidatorSettings()
+            _subschema_result_cache = SubschemaResultCache(
+                settings.subschema_cache_maxsize
+            )
+        return _subschema_result_cache
+
+
+class RecordingHandler:
+    """Resolver handler wrapper that records digests of retrieved documents."""
+
+    def __init__(self, handler: Any, documents: dict[str, str]):
+        self.handler = handler
+        self.documents = documents
+
+    def __call__(self, uri: str) -> Any:
+        contents = self.handler(uri)
+        self.documents[uri] = get_content_digest(contents)
+        return contents
+
+
+@dataclass
+class ResultCacheEntry:
+    # retrieved external documents (URI -> contents digest)
+    documents: dict[str, str]
+    errors: list[ValidationError]
+
+    def dumps(self, spec: Any) -> bytes:
+        """Serialize the entry to JSON, prefixed with its digest.
+
+        Raises ValueError if the entry can not be serialized, or would not
+        load into equal errors.
+        """
+        contents = {
+            "documents": self.documents,
+            "errors": [dump_error(error, spec) for error in self.errors],
+        }
+        try:
+            data = json.dumps(contents, allow_nan=False).encode()
+        except TypeError as exc:
+            raise ValueError(str(exc)) from exc
+        # for example non-string keys or tuples
+        if json.loads(data) != contents:
+            raise ValueError("Entry does not load into equal errors")
+        return hashlib.sha256(data).hexdigest().encode() + b"\n" + data
+
+    @classmethod
+    def loads(cls, data: bytes, spec: Any) -> "ResultCacheEntry":
+        """Load the entry, raises ValueError if it is not valid."""
+        digest, _, data = data.partition(b"\n")
+        if hashlib.sha256(data).hexdigest().encode() != digest:
+            raise ValueError("Entry digest does not match")
+        try:
+            contents = json.loads(data)
+            documents = contents["documents"]
+            errors = [load_error(error, spec) for error in contents["errors"]]
+        except (LookupError, TypeError) as exc:
+            raise ValueError(str(exc)) from exc
+        if not isinstance(documents, dict):
+            raise ValueError("Invalid entry documents")
+        return cls(documents=documents, errors=errors)
+
+
+def _get_spec_node(spec: Any, path: Iterable[str | int]) -> Any:
+    try:
+        return resolve_pointer(spec, [str(part) for part in path])
+    except LookupError:
+        return _UNSET
+
+
+def dump_error(error: ValidationError, spec: Any) -> dict[str, Any]:
+    """Return the error fields as JSON data.
+
+    The schema is not kept. Instances that are the spec, or its node at
+    the error path, are not kept either and are taken from the spec when
+    the error is loaded, so entries do not grow with the spec.
+    """
+    error_cls = type(error)
+    if RESULT_CACHE_ERROR_CLASSES.get(error_cls.__name__) is not error_cls:
+        raise ValueError(f"Unknown error class: {error_cls.__name__}")
+    data: dict[str, Any] = {
+        "class": error_cls.__name__,
+        "message": error.message,
+        "path": list(error.relative_path),
+        "schema_path": list(error.relative_schema_path),
+        "context": [dump_error(child, spec) for child in error.context or ()],
+    }
+    for name in ("validator", "validator_value"):
+        value = getattr(error, name)
+        if value is not _UNSET:
+            data[name] = value
+    if error.instance is not _UNSET:
+        # metaschema errors of jsonschema-rs have the spec as instance
+        if error.instance is spec or error.instance is _get_spec_node(
+            spec, error.absolute_path
+        ):
+            data["spec_instance"] = True
+        else:
+            data["instance"] = error.instance
+    for name in ("referrers", "unchecked"):
+        if hasattr(error, name):
+            data[name] = list(getattr(error, name))
+    return data
+
+
+def load_error(
+    data: Mapping[str, Any],
+    spec: Any,
+    parent_path: Sequence[str | int] = (),
+) -> ValidationError:
+    """Create an error from its fields dumped by ``dump_error``."""
+    error_cls = RESULT_CACHE_ERROR_CLASSES[data["class"]]
+    path = list(parent_path) + data["path"]
+    kwargs = {
+        name: data[name]
+        for name in ("validator", "validator_value", "instance")
+        if name in data
+    }
+    if data.get("spec_instance"):
+        kwargs["instance"] = _get_spec_node(spec, path)
+    if issubclass(error_cls, OpenAPIValidationError):
+        kwargs["referrers"] = data.get("referrers", ())
+    if issubclass(error_cls, ValidationTimeoutError):
+        kwargs["unchecked"] = data.get("unchecked", ())
+    error = error_cls(
+        data["message"],
+        path=data["path"],
+        schema_path=data["schema_path"],
+        context=[load_error(child, spec, path) for child in data["context"]],
+        **kwargs,
+    )
+    if not issubclass(error_cls, OpenAPIValidationError) and (
+        "referrers" in data
+    ):
+        error.referrers = data["referrers"]
+    return error
+
+
+class ResultCache:
+    """
+    On-disk cache of spec validation errors shared between processes.
+    Entries are JSON data, so loading them never runs code, even if the
+    directory is writable by others. They are written to a temporary
+    file and renamed into place, so readers never see partial entries.
+    Least recently used entries are evicted when the cache directory grows
+    over ``maxsize`` bytes.
+    """
+
+    suffix = ".json"
+
+    def __init__(self, directory: str, maxsize: int):
+        self.directory = directory
+        self.maxsize = maxsize
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, spec: Any, *parts: str) -> str:
+        key_hash = hashlib.sha256()
+        for part in (openapi_spec_validator.__version__,) + parts:
+            key_hash.update(part.encode())
+            key_hash.update(b"\0")
+        key_hash.update(get_content_digest(spec).encode())
+        return key_hash.hexdigest()
+
+    def get(
+        self, key: str, handlers: Mapping[str, Any], spec: Any
+    ) -> list[ValidationError] | None:
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                entry = ResultCacheEntry.loads(f.read(), spec)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            log.warning("Invalid result cache entry: %s", entry_path)
+            self._remove(entry_path)
+            return None
+
+        for uri, digest in entry.documents.items():
+            handler = handlers.get(urlsplit(uri).scheme)
+            if handler is None:
+                return None
+            try:
+                contents = handler(uri)
+            except Exception:
+                return None
+            if get_content_digest(contents) != digest:
+                return None
+
+        # recently used entries are evicted last
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return entry.errors
+
+    def set(
+        self,
+        key: str,
+        documents: dict[str, str],
+        errors: list[ValidationError],
+        spec: Any,
+    ) -> None:
+        entry = ResultCacheEntry(documents=documents, errors=errors)
+        try:
+            data = entry.dumps(spec)
+        except ValueError:
+            log.warning("Validation errors can not be cached")
+            return
+        if len(data) > self.maxsize:
+            return
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.directory, suffix=".tmp", prefix="."
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # atomic, concurrent readers see the old or the new entry
+            os.replace(tmp_path, self._get_entry_path(key))
+            self.evict()
+        except OSError as exc:
+            log.warning("Result cache entry can not be written: %s", exc)
+            if tmp_path is not None:
+                self._remove(tmp_path)
+
+    def evict(self) -> None:
+        """Remove least recently used entries over the size limit."""
+        entries: list[tuple[float, int, str]] = []
+        size = 0
+        with os.scandir(self.directory) as it:
+            for dir_entry in it:
+                if not dir_entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+                size += stat.st_size
+
+        entries.sort()
+        for _, entry_size, entry_path in entries:
+            if size <= self.maxsize:
+                break
+            self._remove(entry_path)
+            size -= entry_size
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from dataclasses import field
+
+from jsonschema.exceptions import ValidationError
+
+from openapi_spec_validator.validation.types import SpecValidatorType
+
+
+@dataclass
+class SpecValidationResult:
+    """
+    Validation result of a single spec validated in a batch.
+    """
+
+    index: int
+    # file path the spec was read from, None for spec dicts
+    source: str | None = None
+    validator_cls: SpecValidatorType | None = None
+    errors: list[ValidationError] = field(default_factory=list)
+    # exception raised while reading, detecting or validating the spec
+    exception: Exception | None = None
+    read_seconds: float = 0.0
+    validate_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None and not self.errors
@@ -7,6 +7,7 @@ from collections.abc import Iterator
 from functools import wraps
 from typing import ParamSpec
 from typing import TypeVar
+from typing import cast
 
 from jsonschema.exceptions import ValidationError
 
@@ -15,6 +16,7 @@ from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
 
 P = ParamSpec("P")
 T = TypeVar("T")
+S = TypeVar("S")
 
 log = logging.getLogger(__name__)
 
@@ -28,7 +30,12 @@ def wraps_errors(
         for err in errors:
             if not isinstance(err, OpenAPIValidationError):
                 # wrap other exceptions with library specific version
-                yield OpenAPIValidationError.create_from(err)
+                wrapped = OpenAPIValidationError.create_from(err)
+                # shared, referrers are added until errors are exhausted
+                referrers = getattr(err, "referrers", None)
+                if referrers is not None:
+                    wrapped.referrers = referrers
+                yield wrapped
             else:
                 yield err
 
@@ -46,6 +53,32 @@ def wraps_cached_iter(
     return wrapper
 
 
+def caches_per_instance(
+    func: Callable[[S], T],
+) -> Callable[[S], T]:
+    """Cache the method result in the instance.
+
+    Unlike ``lru_cache`` the cached result is released together with
+    the instance. It can be dropped earlier with ``clear_instance_cache``.
+    """
+    cache_name = f"_{func.__name__}_cache"
+
+    @wraps(func)
+    def wrapper(self: S) -> T:
+        try:
+            return cast(T, self.__dict__[cache_name])
+        except KeyError:
+            result = self.__dict__[cache_name] = func(self)
+            return result
+
+    return wrapper
+
+
+def clear_instance_cache(instance: object, name: str) -> None:
+    """Drop the result cached by ``caches_per_instance`` for ``name``."""
+    instance.__dict__.pop(f"_{name}_cache", None)
+
+
 def unwraps_iter(
     func: Callable[P, Iterable[T]],
 ) -> Callable[P, Iterator[T]]:
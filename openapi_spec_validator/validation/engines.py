@@ -0,0 +1,107 @@
+"""OpenAPI spec validator validation engines module."""
+
+from collections.abc import Generator
+from contextlib import closing
+from itertools import islice
+from time import monotonic
+from typing import cast
+
+from jsonschema.exceptions import ValidationError
+from jsonschema_path.paths import SchemaPath
+from jsonschema_path.typing import Schema
+
+from openapi_spec_validator.settings import OpenAPISpecValidatorSettings
+from openapi_spec_validator.validation.registries import (
+    KeywordValidatorRegistry,
+)
+from openapi_spec_validator.validation.types import SpecValidatorType
+from openapi_spec_validator.validation.validators import SpecValidator
+from openapi_spec_validator.validation.validators import check_max_errors
+
+
+class SpecValidationEngine:
+    """Validates many specs of one OpenAPI version.
+
+    Keyword validators, together with their dialect validator classes,
+    and settings are created once and kept warm between runs. Only the
+    state collected while validating a spec (visited schemas, operation
+    IDs) is reset for every run.
+    """
+
+    def __init__(self, validator_cls: SpecValidatorType):
+        self.validator_cls = validator_cls
+        self.settings = OpenAPISpecValidatorSettings()
+        # idle registries; a run takes one or creates a new one
+        # if all of them are in use by other runs
+        self._registries: list[KeywordValidatorRegistry] = []
+
+    def validate(self, spec: Schema, base_uri: str = "") -> None:
+        with closing(self.iter_errors(spec, base_uri=base_uri)) as errors:
+            for err in errors:
+                raise err
+
+    def is_valid(self, spec: Schema, base_uri: str = "") -> bool:
+        with closing(self.iter_errors(spec, base_uri=base_uri)) as errors:
+            error = next(errors, None)
+        return error is None
+
+    def iter_errors(
+        self,
+        spec: Schema,
+        base_uri: str = "",
+        max_errors: int | None = None,
+        timeout: float | None = None,
+    ) -> Generator[ValidationError, None, None]:
+        if max_errors is not None:
+            check_max_errors(max_errors)
+        deadline = None
+        if timeout is not None:
+            deadline = monotonic() + timeout
+        return self._iter_errors(spec, base_uri, max_errors, deadline)
+
+    def _iter_errors(
+        self,
+        spec: Schema,
+        base_uri: str,
+        max_errors: int | None,
+        deadline: float | None,
+    ) -> Generator[ValidationError, None, None]:
+        registry = self._acquire_registry()
+        registry.deadline = deadline
+        try:
+            validator = self._create_validator(spec, base_uri, registry)
+            # uncached errors, so closing the run closes the keyword
+            # validators generators before their state is reset
+            errors = cast(
+                Generator[ValidationError, None, None],
+                validator._iter_errors(),
+            )
+            with closing(errors):
+                yield from islice(errors, max_errors)
+        finally:
+            registry.reset()
+            self._registries.append(registry)
+
+    def _acquire_registry(self) -> KeywordValidatorRegistry:
+        try:
+            return self._registries.pop()
+        except IndexError:
+            return KeywordValidatorRegistry(
+                self.validator_cls.keyword_validators
+            )
+
+    def _create_validator(
+        self,
+        spec: Schema,
+        base_uri: str,
+        registry: KeywordValidatorRegistry,
+    ) -> SpecValidator:
+        schema_path = SchemaPath.from_dict(
+            spec,
+            base_uri=base_uri,
+            handlers=self.validator_cls.resolver_handlers,
+            resolved_cache_maxsize=self.settings.resolved_cache_maxsize,
+        )
+        validator = self.validator_cls(schema_path)
+        validator.keyword_validators_registry = registry
+        return validator
@@ -1,14 +1,38 @@
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+
 from jsonschema.exceptions import ValidationError
+from referencing import Resource
+from referencing.exceptions import Unresolvable
 
 from openapi_spec_validator.exceptions import OpenAPISpecValidatorError
 
+if TYPE_CHECKING:
+    from openapi_spec_validator.validation.reports import ErrorRecord
+
 
 class ValidatorDetectError(OpenAPISpecValidatorError):
     pass
 
 
 class OpenAPIValidationError(ValidationError):  # type: ignore
-    pass
+    """Spec validation error.
+
+    ``referrers`` holds JSON pointers of the references to the part of
+    the spec the error was raised for, if it was reached through any.
+    Errors of a referenced part are reported once and other references
+    to it are added to ``referrers`` of the reported error, so the list
+    is complete once the iteration over errors finishes.
+    """
+
+    def __init__(
+        self, *args: Any, referrers: Sequence[str] = (), **kwargs: Any
+    ):
+        # keyword only, unpickling passes the error fields as arguments
+        super().__init__(*args, **kwargs)
+        self.referrers = list(referrers)
 
 
 class ExtraParametersError(OpenAPIValidationError):
@@ -25,3 +49,81 @@ class UnresolvableParameterError(OpenAPIValidationError):
 
 class DuplicateOperationIDError(OpenAPIValidationError):
     pass
+
+
+class ValidationTimeoutError(OpenAPIValidationError):
+    """Validation was stopped at its deadline.
+
+    ``unchecked`` holds JSON pointers of the parts of the document that
+    were not checked, or not completely.
+    """
+
+    def __init__(
+        self, *args: Any, unchecked: Sequence[str] = (), **kwargs: Any
+    ):
+        super().__init__(*args, **kwargs)
+        self.unchecked = list(unchecked)
+
+
+class DeadlineExceeded(OpenAPISpecValidatorError):
+    """Raised by keyword validators to stop validation at its deadline."""
+
+    def __init__(self, parts: Sequence[str | int]):
+        super().__init__(parts)
+        self.parts = tuple(parts)
+
+
+class WorkerError(OpenAPISpecValidatorError):
+    """Picklable form of an exception raised in a worker process.
+
+    Exceptions holding reference resolution state, such as unresolvable
+    reference errors, can not be sent back from worker processes.
+    ``exc_type`` is the qualified name of the exception class, ``message``
+    its message and ``records`` error records of the validation errors
+    found before it was raised.
+    """
+
+    def __init__(
+        self,
+        exc_type: str,
+        message: str,
+        records: Sequence["ErrorRecord"] = (),
+    ):
+        super().__init__(exc_type, message, list(records))
+        self.exc_type = exc_type
+        self.message = message
+        self.records = list(records)
+
+    def __str__(self) -> str:
+        return f"{self.exc_type}: {self.message}"
+
+
+class UnresolvableWorkerError(OpenAPISpecValidatorError):
+    """Picklable form of a reference resolution error of a worker process.
+
+    The resource of the error is replaced with its contents, ``restore()``
+    creates the error of the original class again.
+    """
+
+    def __init__(self, exc_cls: type[Unresolvable], fields: Mapping[str, Any]):
+        super().__init__(exc_cls, dict(fields))
+        self.exc_cls = exc_cls
+        self.fields = dict(fields)
+
+    @classmethod
+    def create_from(cls, exc: Unresolvable) -> "UnresolvableWorkerError":
+        fields: dict[str, Any] = {}
+        for name in ("ref", "resource", "anchor"):
+            if not hasattr(exc, name):
+                continue
+            value = getattr(exc, name)
+            if isinstance(value, Resource):
+                value = value.contents
+            fields[name] = value
+        return cls(type(exc), fields)
+
+    def restore(self) -> Unresolvable:
+        fields = dict(self.fields)
+        if "resource" in fields:
+            fields["resource"] = Resource.opaque(fields["resource"])
+        return self.exc_cls(**fields)
@@ -0,0 +1,149 @@
+"""OpenAPI spec validator validation filters module."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any
+
+from jsonschema_path.typing import Schema
+
+from openapi_spec_validator.validation.pointers import get_dependencies
+from openapi_spec_validator.validation.pointers import get_parts
+from openapi_spec_validator.validation.pointers import get_pointer
+
+
+def get_owner_pointer(pointer: str) -> str | None:
+    """Return pointer of the path or component containing the pointer."""
+    parts = get_parts(pointer)
+    if parts[:1] == ["paths"] and len(parts) >= 2:
+        return get_pointer(parts[:2])
+    if parts[:1] == ["components"] and len(parts) >= 3:
+        return get_pointer(parts[:3])
+    return None
+
+
+@dataclass(frozen=True)
+class SpecFilter:
+    """Selects paths and components of a spec to validate.
+
+    Patterns starting with ``#`` are JSON pointer prefixes (for example
+    ``#/paths/~1pets`` or ``#/components/schemas``), patterns starting
+    with ``/`` are path templates (for example ``/pets/{petId}``) and
+    other patterns are component names. Path templates and component
+    names can use shell-style wildcards.
+
+    A path or component is selected if it matches any of the ``include``
+    patterns (or ``include`` is None) and none of the ``exclude`` ones.
+    """
+
+    include: tuple[str, ...] | None = None
+    exclude: tuple[str, ...] = ()
+
+    def is_path_selected(self, url: str) -> bool:
+        return self._is_selected(get_pointer(("paths", url)), url=url)
+
+    def is_component_selected(self, section: str, name: str) -> bool:
+        pointer = get_pointer(("components", section, name))
+        return self._is_selected(pointer, name=name)
+
+    def select(self, spec: Schema) -> Schema:
+        """Return the spec with only the selected paths and components.
+
+        Paths and components referenced by the selected ones, also
+        transitively, are kept too.
+        """
+        kept = self._get_kept_pointers(spec)
+        selected = dict(spec)
+        paths = spec.get("paths")
+        if isinstance(paths, Mapping):
+            selected["paths"] = {
+                url: path_item
+                for url, path_item in paths.items()
+                if get_pointer(("paths", url)) in kept
+            }
+        components = spec.get("components")
+        if isinstance(components, Mapping):
+            selected["components"] = {
+                section: self._select_components(section, items, kept)
+                for section, items in components.items()
+            }
+        return selected
+
+    def _select_components(
+        self, section: str, items: Any, kept: set[str]
+    ) -> Any:
+        if not isinstance(items, Mapping):
+            return items
+        return {
+            name: item
+            for name, item in items.items()
+            if get_pointer(("components", section, name)) in kept
+        }
+
+    def _get_kept_pointers(self, spec: Schema) -> set[str]:
+        """Return pointers of selected and referenced paths and components."""
+        pending: list[str] = []
+        paths = spec.get("paths")
+        if isinstance(paths, Mapping):
+            pending.extend(
+                get_pointer(("paths", url))
+                for url in paths
+                if self.is_path_selected(url)
+            )
+        components = spec.get("components")
+        if isinstance(components, Mapping):
+            for section, items in components.items():
+                if isinstance(items, Mapping):
+                    pending.extend(
+                        get_pointer(("components", section, name))
+                        for name in items
+                        if self.is_component_selected(section, name)
+                    )
+
+        kept: set[str] = set()
+        refs_cache: dict[str, frozenset[str] | None] = {}
+        while pending:
+            pointer = pending.pop()
+            if pointer in kept:
+                continue
+            kept.add(pointer)
+            dependencies = get_dependencies(
+                spec, pointer, refs_cache, strict=False
+            )
+            for dependency in dependencies or ():
+                owner = get_owner_pointer(dependency)
+                if owner is not None and owner not in kept:
+                    pending.append(owner)
+        return kept
+
+    def _is_selected(
+        self, pointer: str, url: str | None = None, name: str | None = None
+    ) -> bool:
+        if self.include is not None and not any(
+            self._matches(pattern, pointer, url, name)
+            for pattern in self.include
+        ):
+            return False
+        return not any(
+            self._matches(pattern, pointer, url, name)
+            for pattern in self.exclude
+        )
+
+    def _matches(
+        self,
+        pattern: str,
+        pointer: str,
+        url: str | None,
+        name: str | None,
+    ) -> bool:
+        if pattern.startswith("#"):
+            # pointers inside a path or component select all of it
+            prefix = pattern[1:].rstrip("/")
+            return (
+                pointer == prefix
+                or pointer.startswith(f"{prefix}/")
+                or prefix.startswith(f"{pointer}/")
+            )
+        if pattern.startswith("/"):
+            return url is not None and fnmatchcase(url, pattern)
+        return name is not None and fnmatchcase(name, pattern)
@@ -0,0 +1,319 @@
+"""OpenAPI spec validator validation incremental module."""
+
+import sys
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from copy import deepcopy
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from jsonschema.exceptions import ValidationError
+from jsonschema_path.typing import Schema
+
+from openapi_spec_validator.validation.decorators import wraps_errors
+from openapi_spec_validator.validation.pointers import escape_part
+from openapi_spec_validator.validation.pointers import get_dependencies
+from openapi_spec_validator.validation.pointers import get_parts
+from openapi_spec_validator.validation.pointers import get_pointer
+from openapi_spec_validator.validation.pointers import resolve_pointer
+from openapi_spec_validator.validation.shards import ShardResult
+from openapi_spec_validator.validation.shards import get_pointers
+from openapi_spec_validator.validation.shards import get_shards
+from openapi_spec_validator.validation.shards import merge_shard_results
+from openapi_spec_validator.validation.shards import run_shard
+from openapi_spec_validator.validation.types import SpecValidatorType
+from openapi_spec_validator.validation.validators import SpecValidator
+
+# root keywords not read while validating paths and components
+INDEPENDENT_ROOT_KEYWORDS = frozenset(
+    ["info", "tags", "servers", "externalDocs", "security", "webhooks"]
+)
+
+
+@dataclass
+class IncrementalValidationState:
+    """Validation state of a spec, to validate it again after changes.
+
+    Paths and component schemas are validated as separate units. Their
+    results are kept by JSON pointer together with JSON pointers of the
+    parts of the spec they depend on: their own subtree and local
+    references, transitively. Dependencies are None if not known, for
+    example for units with remote references.
+    """
+
+    spec: Schema
+    errors: list[ValidationError] = field(default_factory=list)
+    results: dict[str, ShardResult] = field(default_factory=dict)
+    dependencies: dict[str, frozenset[str] | None] = field(
+        default_factory=dict
+    )
+    # units validated by the run, results of the others were reused
+    validated: list[str] = field(default_factory=list)
+
+
+class IncrementalSpecValidator:
+    """Validates specs again after changes, reusing unchanged results.
+
+    Only paths and component schemas whose dependencies changed are
+    validated again. The metaschema validation and tags are validated
+    on every run. Errors are merged in document order, so they match
+    errors of a complete validation.
+    """
+
+    def __init__(self, validator_cls: SpecValidatorType, base_uri: str = ""):
+        self.validator_cls = validator_cls
+        self.base_uri = base_uri
+
+    def validate(self, spec: Schema) -> IncrementalValidationState:
+        return self._validate(spec)
+
+    def revalidate(
+        self,
+        state: IncrementalValidationState,
+        patch: Sequence[Mapping[str, Any]] | None = None,
+        spec: Schema | None = None,
+    ) -> IncrementalValidationState:
+        """Validate the state spec changed by a JSON Patch or a new spec.
+
+        The state spec is not modified; the patched spec shares unchanged
+        subtrees with it.
+        """
+        if patch is not None and spec is None:
+            spec = apply_patch(state.spec, patch)
+            changed = list(get_patch_pointers(patch))
+        elif spec is not None and patch is None:
+            changed = get_changed_pointers(state.spec, spec)
+        else:
+            raise ValueError("Expected either patch or spec.")
+        return self._validate(spec, state, changed)
+
+    def _validate(
+        self,
+        spec: Schema,
+        previous: IncrementalValidationState | None = None,
+        changed: Sequence[str] = (),
+    ) -> IncrementalValidationState:
+        validator = self.validator_cls(spec, base_uri=self.base_uri)
+        state = IncrementalValidationState(spec)
+        shards = get_shards(spec, sys.maxsize)
+        if shards is None:
+            # spec structure can not be split into units
+            state.errors = list(validator.iter_errors())
+            return state
+
+        state.errors = list(iter_global_errors(validator))
+        if previous is not None and any(map(is_global_pointer, changed)):
+            previous = None
+        pointers: Mapping[int, str] | None = None
+        refs_cache: dict[str, frozenset[str] | None] = {}
+        for shard in shards:
+            (parts,) = shard.iter_parts()
+            key = get_pointer(parts)
+            if previous is not None and key in previous.results:
+                dependencies = previous.dependencies[key]
+                if dependencies is not None and not overlaps(
+                    dependencies, changed
+                ):
+                    state.results[key] = previous.results[key]
+                    state.dependencies[key] = dependencies
+                    continue
+
+            if pointers is None:
+                pointers = get_pointers(spec)
+            # fresh validation state for every unit
+            validator.keyword_validators_registry.reset()
+            state.results[key] = run_shard(validator, shard, pointers)
+            state.dependencies[key] = get_dependencies(spec, key, refs_cache)
+            state.validated.append(key)
+
+        state.errors.extend(iter_unit_errors(state.results.values()))
+        return state
+
+
+@wraps_errors
+def iter_global_errors(validator: SpecValidator) -> Iterator[ValidationError]:
+    yield from validator.schema_validator.iter_errors(
+        validator.selected_schema
+    )
+    yield from validator.root_validator.iter_tags_errors(validator.schema_path)
+
+
+@wraps_errors
+def iter_unit_errors(
+    results: Iterable[ShardResult],
+) -> Iterator[ValidationError]:
+    # results keep raw errors, wrapped again on every merge
+    return merge_shard_results(results)
+
+
+def is_global_pointer(pointer: str) -> bool:
+    """Tell if paths and components may depend on the pointer."""
+    parts = get_parts(pointer)
+    if not parts:
+        return True
+    keyword = parts[0]
+    return not (
+        keyword in ("paths", "components")
+        or keyword in INDEPENDENT_ROOT_KEYWORDS
+        or keyword.startswith("x-")
+    )
+
+
+def overlaps(pointers: Iterable[str], other_pointers: Sequence[str]) -> bool:
+    """Tell if any subtree of the pointers overlaps the other ones."""
+    return any(
+        pointer == other
+        or pointer.startswith(f"{other}/")
+        or other.startswith(f"{pointer}/")
+        for pointer in pointers
+        for other in other_pointers
+    )
+
+
+def get_changed_pointers(old: Any, new: Any) -> list[str]:
+    """Return pointers of the subtrees that differ between documents."""
+    changed = []
+    stack = [(old, new, "")]
+    while stack:
+        old, new, pointer = stack.pop()
+        if old is new:
+            continue
+        if isinstance(old, Mapping) and isinstance(new, Mapping):
+            for key in old.keys() | new.keys():
+                key_pointer = f"{pointer}/{escape_part(key)}"
+                if key in old and key in new:
+                    stack.append((old[key], new[key], key_pointer))
+                else:
+                    changed.append(key_pointer)
+        elif (
+            isinstance(old, list)
+            and isinstance(new, list)
+            and len(old) == len(new)
+        ):
+            stack.extend(
+                (old_item, new_item, f"{pointer}/{index}")
+                for index, (old_item, new_item) in enumerate(zip(old, new))
+            )
+        elif type(old) is not type(new) or old != new:
+            changed.append(pointer)
+    return changed
+
+
+def get_patch_pointers(patch: Sequence[Mapping[str, Any]]) -> Iterator[str]:
+    """Return pointers of the subtrees changed by the JSON Patch."""
+    for operation in patch:
+        op = operation["op"]
+        if op == "test":
+            continue
+        paths = [operation["path"]]
+        if op == "move":
+            paths.append(operation["from"])
+        for path in paths:
+            parts = get_parts(path)
+            if (
+                op in ("add", "remove", "move")
+                and parts
+                and (parts[-1] == "-" or parts[-1].isdigit())
+            ):
+                # indices of the following array items shift
+                parts = parts[:-1]
+            yield get_pointer(parts)
+
+
+def apply_patch(document: Any, patch: Sequence[Mapping[str, Any]]) -> Any:
+    """Apply the JSON Patch and return the patched document.
+
+    The document is not modified. Containers on the changed paths are
+    copied, other subtrees are shared with the document.
+    """
+    for operation in patch:
+        try:
+            document = _apply_operation(document, operation)
+        except LookupError as exc:
+            raise ValueError(
+                f"Can not apply JSON Patch operation: {operation!r}"
+            ) from exc
+    return document
+
+
+def _apply_operation(document: Any, operation: Mapping[str, Any]) -> Any:
+    op = operation.get("op")
+    parts = get_parts(operation["path"])
+    if op == "add":
+        return _add(document, parts, operation["value"])
+    if op == "remove":
+        return _remove(document, parts)
+    if op == "replace":
+        if not parts:
+            return operation["value"]
+        return _add(_remove(document, parts), parts, operation["value"])
+    if op in ("move", "copy"):
+        from_parts = get_parts(operation["from"])
+        value = resolve_pointer(document, from_parts)
+        if op == "move":
+            document = _remove(document, from_parts)
+        else:
+            value = deepcopy(value)
+        return _add(document, parts, value)
+    if op == "test":
+        if resolve_pointer(document, parts) != operation["value"]:
+            raise ValueError(
+                f"JSON Patch test failed at {operation['path']!r}"
+            )
+        return document
+    raise ValueError(f"Unknown JSON Patch operation: {op!r}")
+
+
+def _add(node: Any, parts: Sequence[str], value: Any) -> Any:
+    if not parts:
+        return value
+    part, rest = parts[0], parts[1:]
+    if isinstance(node, Mapping):
+        mapping_copy = dict(node)
+        mapping_copy[part] = _add(node[part], rest, value) if rest else value
+        return mapping_copy
+    if isinstance(node, list):
+        list_copy = list(node)
+        if rest:
+            index = _get_index(node, part)
+            list_copy[index] = _add(node[index], rest, value)
+        elif part == "-":
+            list_copy.append(value)
+        else:
+            list_copy.insert(_get_index(node, part, end=True), value)
+        return list_copy
+    raise KeyError(part)
+
+
+def _remove(node: Any, parts: Sequence[str]) -> Any:
+    if not parts:
+        raise ValueError("JSON Patch can not remove the whole document")
+    part, rest = parts[0], parts[1:]
+    if isinstance(node, Mapping):
+        mapping_copy = dict(node)
+        if rest:
+            mapping_copy[part] = _remove(node[part], rest)
+        else:
+            del mapping_copy[part]
+        return mapping_copy
+    if isinstance(node, list):
+        list_copy = list(node)
+        index = _get_index(node, part)
+        if rest:
+            list_copy[index] = _remove(node[index], rest)
+        else:
+            del list_copy[index]
+        return list_copy
+    raise KeyError(part)
+
+
+def _get_index(node: list[Any], part: str, end: bool = False) -> int:
+    if not part.isdigit():
+        raise IndexError(part)
+    index = int(part)
+    if index > len(node) or (index == len(node) and not end):
+        raise IndexError(part)
+    return index
@@ -1,13 +1,17 @@
 import string
+from collections import OrderedDict
 from collections.abc import Callable
 from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
 from functools import partial
+from time import monotonic
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
+from urllib.parse import urljoin
 
+from jsonschema import validators as jsonschema_validators
 from jsonschema._format import FormatChecker
 from jsonschema.exceptions import SchemaError
 from jsonschema.exceptions import ValidationError
@@ -22,7 +26,17 @@ from openapi_schema_validator import oas32_format_checker
 from openapi_schema_validator.validators import OAS30Validator
 from openapi_schema_validator.validators import OAS31Validator
 from openapi_schema_validator.validators import OAS32Validator
+from referencing import Registry
 
+from openapi_spec_validator.schemas.backend import get_validator_backend
+from openapi_spec_validator.schemas.backend.jsonschema_rs import (
+    create_schema_checker as create_jsonschema_rs_schema_checker,
+)
+from openapi_spec_validator.schemas.utils import get_meta_schema_content
+from openapi_spec_validator.validation.caches import CacheInfo
+from openapi_spec_validator.validation.caches import get_subschema_digest
+from openapi_spec_validator.validation.caches import get_subschema_result_cache
+from openapi_spec_validator.validation.exceptions import DeadlineExceeded
 from openapi_spec_validator.validation.exceptions import (
     DuplicateOperationIDError,
 )
@@ -34,33 +48,285 @@ from openapi_spec_validator.validation.exceptions import (
 from openapi_spec_validator.validation.exceptions import (
     UnresolvableParameterError,
 )
+from openapi_spec_validator.validation.pointers import get_pointer
+from openapi_spec_validator.validation.tracing import TracedSpan
 
 if TYPE_CHECKING:
     from openapi_spec_validator.validation.registries import (
         KeywordValidatorRegistry,
     )
 
+# OAS dialects supported by OAS validators, with metaschemas of their
+# vocabularies
+OPENAPI_DIALECT_VERSIONS = (
+    (OAS31Validator, "3.1"),
+    (OAS32Validator, "3.2"),
+)
+
+
+def get_openapi_meta_schemas() -> Iterator[tuple[str, Any]]:
+    """Iterate over (URI, contents) pairs of OAS metaschemas.
+
+    JSON Schema metaschemas are known to both backends already.
+    """
+    for validator_cls, version in OPENAPI_DIALECT_VERSIONS:
+        yield validator_cls.META_SCHEMA["$id"], validator_cls.META_SCHEMA
+        meta_schema = get_meta_schema_content(version)
+        yield meta_schema["$id"], meta_schema
+
+
+def get_base_uri(resolver: Any) -> str:
+    """Return the URI references are resolved against by the resolver.
+
+    Neither referencing nor jsonschema-path expose it publicly, so this is
+    the only place reading it.
+    """
+    return cast(str, resolver._base_uri)
+
+
+def _check_schema(meta_schema_validator: Validator, schema: Any) -> None:
+    for error in meta_schema_validator.iter_errors(schema):
+        raise SchemaError.create_from(error)
+
+
+# compiled metaschema checks by backend, validator class and
+# format checker, shared by all spec validators
+_schema_checkers: dict[
+    tuple[str, type[Validator], FormatChecker | None],
+    Callable[[Any], None],
+] = {}
+
+
+def get_schema_checker(
+    validator_cls: type[Validator],
+    format_checker: FormatChecker | None = None,
+    backend: str = "jsonschema",
+) -> Callable[[Any], None]:
+    """Return a compiled metaschema check for the validator class.
+
+    Same as ``validator_cls.check_schema`` but the metaschema validator is
+    created once per backend, validator class and format checker.
+    """
+    key = (backend, validator_cls, format_checker)
+    try:
+        return _schema_checkers[key]
+    except KeyError:
+        schema_checker = _create_schema_checker(
+            validator_cls, format_checker, backend
+        )
+        return _schema_checkers.setdefault(key, schema_checker)
+
+
+def _create_schema_checker(
+    validator_cls: type[Validator],
+    format_checker: FormatChecker | None = None,
+    backend: str = "jsonschema",
+) -> Callable[[Any], None]:
+    if backend == "jsonschema-rs":
+        # jsonschema-rs checks standard formats used by metaschemas
+        return create_jsonschema_rs_schema_checker(
+            dict(validator_cls.META_SCHEMA), get_openapi_meta_schemas()
+        )
+
+    # class validating the metaschema, not a spec dialect lookup
+    meta_schema_validator_cls = jsonschema_validators.validator_for(
+        validator_cls.META_SCHEMA, default=validator_cls
+    )
+    # same default as check_schema of OAS validators
+    if format_checker is None:
+        format_checker = validator_cls.FORMAT_CHECKER
+    # JSON Schema metaschemas are added by jsonschema
+    meta_schema_validator = meta_schema_validator_cls(
+        validator_cls.META_SCHEMA,
+        format_checker=format_checker,
+        registry=Registry().with_contents(get_openapi_meta_schemas()),
+    )
+    return partial(_check_schema, meta_schema_validator)
+
+
+def _iter_nested_schema_values(schema_value: Any) -> Iterator[Any]:
+    """Iterate over the schema and the nested schemas it traverses.
+
+    Only object schemas are yielded, each once, in a fixed order.
+    """
+    seen: set[int] = set()
+    stack = [schema_value]
+    while stack:
+        value = stack.pop()
+        if not isinstance(value, Mapping) or id(value) in seen:
+            continue
+        seen.add(id(value))
+        yield value
+
+        nested: list[Any] = []
+        for kw in ("allOf", "anyOf", "oneOf"):
+            if isinstance(value.get(kw), list):
+                nested.extend(value[kw])
+        nested.append(value.get("not"))
+        nested.append(value.get("items"))
+        if isinstance(value.get("properties"), Mapping):
+            nested.extend(value["properties"].values())
+        stack.extend(reversed(nested))
+
 
 class KeywordValidator:
     def __init__(self, registry: "KeywordValidatorRegistry"):
         self.registry = registry
 
+    def reset(self) -> None:
+        """Reset state collected while validating a spec."""
+
+    def check_deadline(self, node: SchemaPath) -> None:
+        """Stop validation at the node if the deadline has passed."""
+        deadline = self.registry.deadline
+        if deadline is not None and monotonic() >= deadline:
+            raise DeadlineExceeded(node.parts)
+
+    def start_span(self, keyword: str, node: SchemaPath) -> TracedSpan | None:
+        """Start a span of the node if validation is traced."""
+        tracer = self.registry.tracer
+        if tracer is None:
+            return None
+        return TracedSpan(tracer, keyword, get_pointer(node.parts))
+
+    def _get_ref_target_uri(self, node: SchemaPath) -> str | None:
+        """Return target URI if the unresolved node is a reference."""
+        if not node.parts:
+            return None
+
+        # parent is resolved already while traversing down to the node
+        with node.parent.resolve() as resolved_parent:
+            parent_value = resolved_parent.contents
+            part = node.parts[-1]
+            if isinstance(parent_value, Mapping):
+                value = parent_value.get(part)
+            elif isinstance(part, int) and 0 <= part < len(parent_value):
+                value = parent_value[part]
+            else:
+                return None
+            if not isinstance(value, Mapping):
+                return None
+            ref = value.get("$ref")
+            if not isinstance(ref, str):
+                return None
+            return urljoin(get_base_uri(resolved_parent.resolver), ref)
+
+    def report_referenced_error(
+        self,
+        target_uri: str | None,
+        referrer: SchemaPath,
+        err: ValidationError,
+    ) -> bool:
+        """Check if an error of a reference target should be yielded.
+
+        Errors are deduplicated by class, target, message, path and the
+        schema they were raised for. Duplicates only add the referrer to
+        ``referrers`` of the error reported first. Errors already reported
+        for a nested reference target are passed through.
+        """
+        if target_uri is None or getattr(err, "referrers", None):
+            return True
+
+        reported = self.registry.reported_errors.setdefault(target_uri, {})
+        pointer = get_pointer(referrer.parts)
+        key = (
+            type(err),
+            err.message,
+            tuple(err.absolute_path),
+            self._get_error_schema_id(),
+        )
+        first = reported.get(key)
+        if first is None:
+            # other errors are wrapped later, keeping the list
+            err.referrers = [pointer]
+            reported[key] = err
+            return True
+        if first.referrers[-1] != pointer:
+            first.referrers.append(pointer)
+        return False
+
+    def _get_error_schema_id(self) -> int | None:
+        # innermost schema being validated while the error is yielded
+        schema_validator = cast(
+            "SchemaValidator | None", self.registry.get("schema")
+        )
+        if schema_validator is None or not schema_validator.schema_stack:
+            return None
+        return schema_validator.schema_stack[-1][0]
+
+    def add_referrer(self, target_uri: str, referrer: SchemaPath) -> None:
+        """Add the referrer to errors reported for the reference target."""
+        pointer = get_pointer(referrer.parts)
+        for err in self.registry.reported_errors.get(target_uri, {}).values():
+            if err.referrers[-1] != pointer:
+                err.referrers.append(pointer)
+
 
 class ValueValidator(KeywordValidator):
     value_validator_cls: Callable[..., Validator] = NotImplemented
     value_validator_format_checker: FormatChecker = NotImplemented
+    # maximum number of value validators kept in cache
+    value_validators_cache_maxsize = 128
+
+    def __init__(self, registry: "KeywordValidatorRegistry"):
+        super().__init__(registry)
+        # value validators cache by resolved schema identity
+        # (schema id, base URI) -> (schema, value validator);
+        # the schema reference keeps its id from being reused
+        self._value_validators: OrderedDict[
+            tuple[int, str], tuple[Any, Validator]
+        ] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def reset(self) -> None:
+        # value validators are bound to the resolver of the spec
+        self._value_validators.clear()
 
     def __call__(
         self, schema: SchemaPath, value: Any
     ) -> Iterator[ValidationError]:
         with schema.resolve() as resolved:
-            value_validator = self.value_validator_cls(
-                resolved.contents,
-                _resolver=resolved.resolver,
-                format_checker=self.value_validator_format_checker,
+            value_validator = self._get_value_validator(
+                resolved.contents, resolved.resolver
             )
             yield from value_validator.iter_errors(value)
 
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self._cache_hits,
+            self._cache_misses,
+            self.value_validators_cache_maxsize,
+            len(self._value_validators),
+        )
+
+    def _get_value_validator(
+        self, schema_value: Any, resolver: Any
+    ) -> Validator:
+        # refs are resolved against the base URI; the registry only grows
+        # and retrieves missing resources while validating a spec, so it
+        # is not part of the key and the cache is cleared between specs
+        key = (id(schema_value), get_base_uri(resolver))
+        cached = self._value_validators.get(key)
+        if cached is not None:
+            self._cache_hits += 1
+            self._value_validators.move_to_end(key)
+            return cached[1]
+
+        self._cache_misses += 1
+        value_validator = self.value_validator_cls(
+            schema_value,
+            _resolver=resolver,
+            format_checker=self.value_validator_format_checker,
+        )
+        if self.value_validators_cache_maxsize > 0:
+            self._value_validators[key] = (schema_value, value_validator)
+            if len(self._value_validators) > (
+                self.value_validators_cache_maxsize
+            ):
+                self._value_validators.popitem(last=False)
+        return value_validator
+
 
 class OpenAPIV30ValueValidator(ValueValidator):
     value_validator_cls = OAS30Validator
@@ -80,12 +346,29 @@ class OpenAPIV32ValueValidator(ValueValidator):
 class SchemaValidator(KeywordValidator):
     def __init__(self, registry: "KeywordValidatorRegistry"):
         super().__init__(registry)
+        # backend of metaschema checks
+        self.schema_checker_backend = get_validator_backend()
+        # results of identical subschemas, shared by all spec validators
+        self.subschema_cache = get_subschema_result_cache()
+        self.reset()
 
+    def reset(self) -> None:
         # recursion/visit dedupe registry
-        self.visited_schema_ids: list[int] | None = []
+        self.visited_schema_ids: set[int] | None = set()
         # meta-schema-check dedupe registry
         # to avoid validating the same schema multiple times
-        self.meta_checked_schema_ids: list[int] | None = []
+        self.meta_checked_schema_ids: set[int] | None = set()
+        # $ref target index (target URI -> resolved schema id)
+        # to skip resolving already validated reference targets
+        self.ref_target_ids: dict[str, int] | None = {}
+        # $ref target referrers registry (target URI -> referrers)
+        self.ref_target_referrers: dict[str, list[SchemaPath]] | None = {}
+        # stack of schemas being validated, innermost last, as
+        # (schema id, visiting) pairs; visiting is False while the schema
+        # is meta-checked and True while its keywords are traversed
+        self.schema_stack: list[tuple[int, bool]] = []
+        # collected property names registry (resolved schema id -> names)
+        self.collected_properties: dict[int, frozenset[str]] | None = {}
 
     @property
     def default_validator(self) -> ValueValidator:
@@ -93,24 +376,68 @@ class SchemaValidator(KeywordValidator):
 
     def _collect_properties(self, schema: SchemaPath) -> set[str]:
         """Return *all* property names reachable from this schema."""
-        props: set[str] = set()
+        props, _ = self._collect_schema_properties(schema, {})
+        return set(props)
+
+    def _collect_schema_properties(
+        self, schema: SchemaPath, collecting: dict[int, int]
+    ) -> tuple[frozenset[str], int]:
+        """Return property names reachable from the schema.
+
+        ``collecting`` maps ids of the schemas being collected to their
+        depth. Together with the properties the lowest depth of a schema
+        being collected that is reachable back from this schema is
+        returned. Properties are memoized only if it is not lower than
+        the schema depth, as the schemas of a reference cycle are
+        complete only once the outermost of them is collected.
+        """
+        assert self.collected_properties is not None
+
+        depth = len(collecting)
+        schema_value = schema.read_value()
+        if not isinstance(schema_value, Mapping):
+            return frozenset(), depth
+        schema_id = id(schema_value)
+        cached = self.collected_properties.get(schema_id)
+        if cached is not None:
+            return cached, depth
+        if schema_id in collecting:
+            return frozenset(), collecting[schema_id]
+
+        subschemas: list[SchemaPath] = []
+        for kw in ("allOf", "anyOf", "oneOf"):
+            if kw in schema_value:
+                subschemas.extend(schema / kw)
+        for kw in ("items", "not"):
+            if kw in schema_value:
+                subschemas.append(schema / kw)
 
-        if "properties" in schema:
+        props: set[str] = set()
+        if "properties" in schema_value:
             schema_props = (schema / "properties").keys()
             props.update(cast(Sequence[str], schema_props))
 
-        for kw in ("allOf", "anyOf", "oneOf"):
-            if kw in schema:
-                for sub in schema / kw:
-                    props.update(self._collect_properties(sub))
-
-        if "items" in schema:
-            props.update(self._collect_properties(schema / "items"))
+        lowest_depth = depth
+        collecting[schema_id] = depth
+        try:
+            for sub in subschemas:
+                sub_props, sub_depth = self._collect_schema_properties(
+                    sub, collecting
+                )
+                props.update(sub_props)
+                lowest_depth = min(lowest_depth, sub_depth)
+        finally:
+            del collecting[schema_id]
 
-        if "not" in schema:
-            props.update(self._collect_properties(schema / "not"))
+        result = frozenset(props)
+        if lowest_depth >= depth:
+            self.collected_properties[schema_id] = result
+        return result, lowest_depth
 
-        return props
+    def get_referrers(self, target_uri: str) -> list[SchemaPath]:
+        """Return schemas referencing the given target URI."""
+        assert self.ref_target_referrers is not None
+        return self.ref_target_referrers.get(target_uri, [])
 
     def _get_schema_checker(
         self, schema: SchemaPath, schema_value: Any
@@ -118,12 +445,31 @@ class SchemaValidator(KeywordValidator):
         raise NotImplementedError
 
     def _validate_schema_meta(
-        self, schema: SchemaPath, schema_value: Any
+        self, schema: SchemaPath, schema_value: Any, digest: str | None = None
     ) -> OpenAPIValidationError | None:
         try:
             schema_checker = self._get_schema_checker(schema, schema_value)
         except ValueError as exc:
             return OpenAPIValidationError(str(exc))
+        if digest is None:
+            return self._check_schema_meta(schema_checker, schema_value)
+
+        # checkers are created once per process, so they key the results
+        key = ("meta", schema_checker, digest)
+        cached = self.subschema_cache.get(key)
+        if cached is None:
+            cached = (self._check_schema_meta(schema_checker, schema_value),)
+            self.subschema_cache.set(key, cached)
+        (err,) = cached
+        if err is None:
+            return None
+        return cast(
+            OpenAPIValidationError, OpenAPIValidationError.create_from(err)
+        )
+
+    def _check_schema_meta(
+        self, schema_checker: Callable[[Any], None], schema_value: Any
+    ) -> OpenAPIValidationError | None:
         try:
             schema_checker(schema_value)
         except (SchemaError, ValidationError) as err:
@@ -138,30 +484,148 @@ class SchemaValidator(KeywordValidator):
         require_properties: bool = True,
         meta_checked: bool = False,
     ) -> Iterator[ValidationError]:
+        assert self.ref_target_ids is not None
+        assert self.ref_target_referrers is not None
+        assert self.meta_checked_schema_ids is not None
+        assert self.visited_schema_ids is not None
+        self.check_deadline(schema)
+
+        target_uri = self._get_ref_target_uri(schema)
+        if target_uri is not None:
+            self.ref_target_referrers.setdefault(target_uri, []).append(schema)
+            target_id = self.ref_target_ids.get(target_uri)
+            if (
+                target_id is not None
+                and target_id in self.visited_schema_ids
+                and (meta_checked or target_id in self.meta_checked_schema_ids)
+            ):
+                self.add_referrer(target_uri, schema)
+                return
+
         schema_value = schema.read_value()
         if not isinstance(schema_value, (Mapping, bool)):
-            yield OpenAPIValidationError(
+            err = OpenAPIValidationError(
                 f"{schema_value!r} is not of type 'object', 'boolean'"
             )
+            if self.report_referenced_error(target_uri, schema, err):
+                yield err
             return
 
+        # resolved nodes are owned by the spec accessor and its registry,
+        # so their ids stay stable for the whole validation run
         schema_id = id(schema_value)
-        if not meta_checked:
-            assert self.meta_checked_schema_ids is not None
-            if schema_id not in self.meta_checked_schema_ids:
-                self.meta_checked_schema_ids.append(schema_id)
-                err = self._validate_schema_meta(schema, schema_value)
-                if err is not None:
-                    yield err
-                    return
+        if target_uri is not None:
+            self.ref_target_ids[target_uri] = schema_id
+        span = self.start_span("schema", schema)
+        self.schema_stack.append((schema_id, False))
+        try:
+            digest = None
+            if not meta_checked:
+                if schema_id not in self.meta_checked_schema_ids:
+                    self.meta_checked_schema_ids.add(schema_id)
+                    if self.subschema_cache.maxsize > 0:
+                        digest = get_subschema_digest(schema_value)
+                    meta_err = self._validate_schema_meta(
+                        schema, schema_value, digest and digest[0]
+                    )
+                    if meta_err is not None:
+                        if self.report_referenced_error(
+                            target_uri, schema, meta_err
+                        ):
+                            yield meta_err
+                        return
+
+            if schema_id in self.visited_schema_ids:
+                return
+            self.visited_schema_ids.add(schema_id)
+
+            # boolean schemas have no keywords to traverse
+            if not isinstance(schema_value, Mapping):
+                return
+
+            self.schema_stack[-1] = (schema_id, True)
+            if digest is not None and not digest[1]:
+                errors = self._iter_cached_keyword_errors(
+                    schema, schema_value, require_properties, digest[0]
+                )
+            else:
+                errors = self._iter_keyword_errors(
+                    schema, schema_value, require_properties
+                )
+            # no nested generator, references can be deeply chained
+            for keyword_err in errors:
+                if self.report_referenced_error(
+                    target_uri, schema, keyword_err
+                ):
+                    yield keyword_err
+        finally:
+            self.schema_stack.pop()
+            if span is not None:
+                span.end()
+
+    def _iter_cached_keyword_errors(
+        self,
+        schema: SchemaPath,
+        schema_value: Mapping[str, Any],
+        require_properties: bool,
+        digest: str,
+    ) -> Iterator[ValidationError]:
+        """Traverse keywords of a schema without references.
 
+        Errors of an identical schema traversed before are yielded again
+        instead, together with the nested schemas they were raised for,
+        if none of the nested schemas were visited yet.
+        """
         assert self.visited_schema_ids is not None
-        if schema_id in self.visited_schema_ids:
+        nested_ids = [
+            id(value) for value in _iter_nested_schema_values(schema_value)
+        ]
+        # the schema itself is visited already
+        cacheable = self.visited_schema_ids.isdisjoint(nested_ids[1:])
+        key = (
+            "keywords",
+            type(self),
+            type(self.default_validator),
+            require_properties,
+            digest,
+        )
+        cached = self.subschema_cache.get(key) if cacheable else None
+        if cached is not None:
+            self.visited_schema_ids.update(nested_ids)
+            for err, index, visiting in cached:
+                self.schema_stack.append((nested_ids[index], visiting))
+                try:
+                    yield type(err).create_from(err)
+                finally:
+                    self.schema_stack.pop()
             return
-        self.visited_schema_ids.append(schema_id)
 
-        nested_properties = []
-        if "allOf" in schema:
+        indexes = {
+            schema_id: index for index, schema_id in enumerate(nested_ids)
+        }
+        records = []
+        for err in self._iter_keyword_errors(
+            schema, schema_value, require_properties
+        ):
+            schema_id, visiting = self.schema_stack[-1]
+            index = indexes.get(schema_id)
+            if index is None:
+                cacheable = False
+            records.append((err, index, visiting))
+            yield err
+        if cacheable:
+            self.subschema_cache.set(key, tuple(records))
+
+    def _iter_keyword_errors(
+        self,
+        schema: SchemaPath,
+        schema_value: Mapping[str, Any],
+        require_properties: bool,
+    ) -> Iterator[ValidationError]:
+        # keyword lookups below use the resolved value read above
+        # rather than probing the schema path node again
+        nested_properties: set[str] = set()
+        if "allOf" in schema_value:
             all_of = schema / "allOf"
             for inner_schema in all_of:
                 yield from self(
@@ -169,11 +633,11 @@ class SchemaValidator(KeywordValidator):
                     require_properties=False,
                     meta_checked=True,
                 )
-                nested_properties += list(
-                    self._collect_properties(inner_schema)
-                )
+                # only needed to check required properties below
+                if require_properties:
+                    nested_properties |= self._collect_properties(inner_schema)
 
-        if "anyOf" in schema:
+        if "anyOf" in schema_value:
             any_of = schema / "anyOf"
             for inner_schema in any_of:
                 yield from self(
@@ -182,7 +646,7 @@ class SchemaValidator(KeywordValidator):
                     meta_checked=True,
                 )
 
-        if "oneOf" in schema:
+        if "oneOf" in schema_value:
             one_of = schema / "oneOf"
             for inner_schema in one_of:
                 yield from self(
@@ -191,7 +655,7 @@ class SchemaValidator(KeywordValidator):
                     meta_checked=True,
                 )
 
-        if "not" in schema:
+        if "not" in schema_value:
             not_schema = schema / "not"
             yield from self(
                 not_schema,
@@ -199,7 +663,7 @@ class SchemaValidator(KeywordValidator):
                 meta_checked=True,
             )
 
-        if "items" in schema:
+        if "items" in schema_value:
             array_schema = schema / "items"
             yield from self(
                 array_schema,
@@ -207,8 +671,10 @@ class SchemaValidator(KeywordValidator):
                 meta_checked=True,
             )
 
-        if "properties" in schema:
+        properties: Sequence[str] = []
+        if "properties" in schema_value:
             props = schema / "properties"
+            properties = cast(Sequence[str], props.keys())
             for _, prop_schema in props.items():
                 yield from self(
                     prop_schema,
@@ -216,29 +682,20 @@ class SchemaValidator(KeywordValidator):
                     meta_checked=True,
                 )
 
-        required = (
-            "required" in schema and (schema / "required").read_value() or []
-        )
-        properties = (
-            "properties" in schema and (schema / "properties").keys() or []
-        )
-        if "allOf" in schema:
+        if "allOf" in schema_value and require_properties:
+            required = schema_value.get("required") or []
             extra_properties = list(
-                set(required) - set(properties) - set(nested_properties)
-            )
-        else:
-            extra_properties = []
-
-        if extra_properties and require_properties:
-            yield ExtraParametersError(
-                f"Required list has not defined properties: {extra_properties}"
+                set(required) - set(properties) - nested_properties
             )
+            if extra_properties:
+                yield ExtraParametersError(
+                    "Required list has not defined properties: "
+                    f"{extra_properties}"
+                )
 
-        if "default" in schema:
+        if "default" in schema_value:
             default_value = (schema / "default").read_value()
-            nullable_value = False
-            if "nullable" in schema:
-                nullable_value = (schema / "nullable").read_value()
+            nullable_value = schema_value.get("nullable", False)
             if default_value is not None or nullable_value is not True:
                 yield from self.default_validator(schema, default_value)
 
@@ -249,9 +706,8 @@ class OpenAPIV30SchemaValidator(SchemaValidator):
     def _get_schema_checker(
         self, schema: SchemaPath, schema_value: Any
     ) -> Callable[[Any], None]:
-        return cast(
-            Callable[[Any], None],
-            self.schema_validator_cls.check_schema,
+        return get_schema_checker(
+            self.schema_validator_cls, backend=self.schema_checker_backend
         )
 
 
@@ -261,11 +717,15 @@ class OpenAPIV31SchemaValidator(SchemaValidator):
 
     def __init__(self, registry: "KeywordValidatorRegistry"):
         super().__init__(registry)
-        self._default_jsonschema_dialect_id: str | None = None
         self._validator_classes_by_dialect: dict[
             str, type[Validator] | None
         ] = {}
 
+    def reset(self) -> None:
+        super().reset()
+        # spec specific, unlike validator classes by dialect
+        self._default_jsonschema_dialect_id: str | None = None
+
     def _get_schema_checker(
         self, schema: SchemaPath, schema_value: Any
     ) -> Callable[[Any], None]:
@@ -278,9 +738,10 @@ class OpenAPIV31SchemaValidator(SchemaValidator):
         if validator_cls is None:
             raise ValueError(f"Unknown JSON Schema dialect: {dialect_id!r}")
 
-        return partial(
-            validator_cls.check_schema,
-            format_checker=self.schema_validator_format_checker,
+        return get_schema_checker(
+            validator_cls,
+            self.schema_validator_format_checker,
+            backend=self.schema_checker_backend,
         )
 
     def _get_schema_dialect_id(
@@ -357,7 +818,13 @@ class SchemasValidator(KeywordValidator):
         return cast(SchemaValidator, self.registry["schema"])
 
     def __call__(self, schemas: SchemaPath) -> Iterator[ValidationError]:
-        for _, schema in schemas.items():
+        spec_filter = self.registry.spec_filter
+        for name, schema in schemas.items():
+            assert isinstance(name, str)
+            if spec_filter is not None and not (
+                spec_filter.is_component_selected("schemas", name)
+            ):
+                continue
             yield from self.schema_validator(schema)
 
 
@@ -367,6 +834,14 @@ class ParameterValidator(KeywordValidator):
         return cast(SchemaValidator, self.registry["schema"])
 
     def __call__(self, parameter: SchemaPath) -> Iterator[ValidationError]:
+        target_uri = self._get_ref_target_uri(parameter)
+        for err in self._iter_parameter_errors(parameter):
+            if self.report_referenced_error(target_uri, parameter, err):
+                yield err
+
+    def _iter_parameter_errors(
+        self, parameter: SchemaPath
+    ) -> Iterator[ValidationError]:
         if "schema" in parameter:
             schema = parameter / "schema"
             yield from self.schema_validator(schema)
@@ -377,8 +852,10 @@ class OpenAPIV2ParameterValidator(ParameterValidator):
     def default_validator(self) -> ValueValidator:
         return cast(ValueValidator, self.registry["default"])
 
-    def __call__(self, parameter: SchemaPath) -> Iterator[ValidationError]:
-        yield from super().__call__(parameter)
+    def _iter_parameter_errors(
+        self, parameter: SchemaPath
+    ) -> Iterator[ValidationError]:
+        yield from super()._iter_parameter_errors(parameter)
 
         if "default" in parameter:
             # only possible in swagger 2.0
@@ -478,8 +955,10 @@ class ResponsesValidator(KeywordValidator):
 class OperationValidator(KeywordValidator):
     def __init__(self, registry: "KeywordValidatorRegistry"):
         super().__init__(registry)
+        self.reset()
 
-        self.operation_ids_registry: list[str] | None = []
+    def reset(self) -> None:
+        self.operation_ids_registry: set[str] | None = set()
 
     @property
     def responses_validator(self) -> ResponsesValidator:
@@ -497,49 +976,54 @@ class OperationValidator(KeywordValidator):
         path_parameters: SchemaPath | None,
     ) -> Iterator[ValidationError]:
         assert self.operation_ids_registry is not None
+        self.check_deadline(operation)
+        span = self.start_span("operation", operation)
+        try:
+            if "operationId" in operation:
+                operation_id_value = (operation / "operationId").read_value()
+                if (
+                    operation_id_value is not None
+                    and operation_id_value in self.operation_ids_registry
+                ):
+                    yield DuplicateOperationIDError(
+                        f"Operation ID '{operation_id_value}' for "
+                        f"'{name}' in '{url}' is not unique"
+                    )
+                self.operation_ids_registry.add(operation_id_value)
 
-        if "operationId" in operation:
-            operation_id_value = (operation / "operationId").read_value()
-            if (
-                operation_id_value is not None
-                and operation_id_value in self.operation_ids_registry
-            ):
-                yield DuplicateOperationIDError(
-                    f"Operation ID '{operation_id_value}' for "
-                    f"'{name}' in '{url}' is not unique"
-                )
-            self.operation_ids_registry.append(operation_id_value)
-
-        if "responses" in operation:
-            responses = operation / "responses"
-            yield from self.responses_validator(responses)
+            if "responses" in operation:
+                responses = operation / "responses"
+                yield from self.responses_validator(responses)
 
-        names = []
+            names = []
 
-        parameters = None
-        if "parameters" in operation:
-            parameters = operation / "parameters"
-            yield from self.parameters_validator(parameters)
-            names += list(self._get_path_param_names(parameters))
+            parameters = None
+            if "parameters" in operation:
+                parameters = operation / "parameters"
+                yield from self.parameters_validator(parameters)
+                names += list(self._get_path_param_names(parameters))
 
-        if path_parameters is not None:
-            names += list(self._get_path_param_names(path_parameters))
+            if path_parameters is not None:
+                names += list(self._get_path_param_names(path_parameters))
 
-        all_params = set(names)
-        url_params = set(self._get_path_params_from_url(url))
+            all_params = set(names)
+            url_params = set(self._get_path_params_from_url(url))
 
-        for path in sorted(url_params):
-            if path not in all_params:
-                yield UnresolvableParameterError(
-                    f"Path parameter '{path}' for '{name}' operation in '{url}' was not resolved"
-                )
+            for path in sorted(url_params):
+                if path not in all_params:
+                    yield UnresolvableParameterError(
+                        f"Path parameter '{path}' for '{name}' operation in '{url}' was not resolved"
+                    )
 
-        for path in sorted(all_params):
-            if path not in url_params:
-                yield UnresolvableParameterError(
-                    f"Path parameter '{path}' for '{name}' operation in '{url}' was not resolved"
-                )
-        return
+            for path in sorted(all_params):
+                if path not in url_params:
+                    yield UnresolvableParameterError(
+                        f"Path parameter '{path}' for '{name}' operation in '{url}' was not resolved"
+                    )
+            return
+        finally:
+            if span is not None:
+                span.end()
 
     def _get_path_param_names(self, params: SchemaPath) -> Iterator[str]:
         for param in params:
@@ -575,19 +1059,25 @@ class PathValidator(KeywordValidator):
     def __call__(
         self, url: str, path_item: SchemaPath
     ) -> Iterator[ValidationError]:
-        parameters = None
-        if "parameters" in path_item:
-            parameters = path_item / "parameters"
-            yield from self.parameters_validator(parameters)
-
-        for field_name, operation in path_item.items():
-            assert isinstance(field_name, str)
-            if field_name not in self.OPERATIONS:
-                continue
+        self.check_deadline(path_item)
+        span = self.start_span("path", path_item)
+        try:
+            parameters = None
+            if "parameters" in path_item:
+                parameters = path_item / "parameters"
+                yield from self.parameters_validator(parameters)
 
-            yield from self.operation_validator(
-                url, field_name, operation, parameters
-            )
+            for field_name, operation in path_item.items():
+                assert isinstance(field_name, str)
+                if field_name not in self.OPERATIONS:
+                    continue
+
+                yield from self.operation_validator(
+                    url, field_name, operation, parameters
+                )
+        finally:
+            if span is not None:
+                span.end()
 
 
 class OpenAPIV32PathValidator(PathValidator):
@@ -596,28 +1086,37 @@ class OpenAPIV32PathValidator(PathValidator):
     def __call__(
         self, url: str, path_item: SchemaPath
     ) -> Iterator[ValidationError]:
-        parameters = None
-        if "parameters" in path_item:
-            parameters = path_item / "parameters"
-            yield from self.parameters_validator(parameters)
-
-        for field_name, operation in path_item.items():
-            assert isinstance(field_name, str)
-            if field_name in self.OPERATIONS:
-                yield from self.operation_validator(
-                    url, field_name, operation, parameters
-                )
-                continue
-
-            if field_name == "additionalOperations":
-                for operation_name, additional_operation in operation.items():
-                    assert isinstance(operation_name, str)
+        self.check_deadline(path_item)
+        span = self.start_span("path", path_item)
+        try:
+            parameters = None
+            if "parameters" in path_item:
+                parameters = path_item / "parameters"
+                yield from self.parameters_validator(parameters)
+
+            for field_name, operation in path_item.items():
+                assert isinstance(field_name, str)
+                if field_name in self.OPERATIONS:
                     yield from self.operation_validator(
-                        url,
+                        url, field_name, operation, parameters
+                    )
+                    continue
+
+                if field_name == "additionalOperations":
+                    for (
                         operation_name,
                         additional_operation,
-                        parameters,
-                    )
+                    ) in operation.items():
+                        assert isinstance(operation_name, str)
+                        yield from self.operation_validator(
+                            url,
+                            operation_name,
+                            additional_operation,
+                            parameters,
+                        )
+        finally:
+            if span is not None:
+                span.end()
 
 
 class PathsValidator(KeywordValidator):
@@ -626,8 +1125,13 @@ class PathsValidator(KeywordValidator):
         return cast(PathValidator, self.registry["path"])
 
     def __call__(self, paths: SchemaPath) -> Iterator[ValidationError]:
+        spec_filter = self.registry.spec_filter
         for url, path_item in paths.items():
             assert isinstance(url, str)
+            if spec_filter is not None and not (
+                spec_filter.is_path_selected(url)
+            ):
+                continue
             yield from self.path_validator(url, path_item)
 
 
@@ -711,14 +1215,23 @@ class RootValidator(KeywordValidator):
         return cast(ComponentsValidator, self.registry["components"])
 
     def __call__(self, spec: SchemaPath) -> Iterator[ValidationError]:
+        self.check_deadline(spec)
+        span = self.start_span("__root__", spec)
+        try:
+            yield from self.iter_tags_errors(spec)
+
+            if "paths" in spec:
+                paths = spec / "paths"
+                yield from self.paths_validator(paths)
+            if "components" in spec:
+                components = spec / "components"
+                yield from self.components_validator(components)
+        finally:
+            if span is not None:
+                span.end()
+
+    def iter_tags_errors(self, spec: SchemaPath) -> Iterator[ValidationError]:
         if "tags" in spec and "tags" in self.registry.keyword_validators:
             tags = spec / "tags"
             tags_validator = cast(Any, self.registry["tags"])
             yield from tags_validator(tags)
-
-        if "paths" in spec:
-            paths = spec / "paths"
-            yield from self.paths_validator(paths)
-        if "components" in spec:
-            components = spec / "components"
-            yield from self.components_validator(components)
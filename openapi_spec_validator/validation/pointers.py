@@ -0,0 +1,115 @@
+"""OpenAPI spec validator validation pointers module."""
+
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+from urllib.parse import unquote
+
+
+def escape_part(part: str | int) -> str:
+    """Escape a reference token of a JSON pointer."""
+    return str(part).replace("~", "~0").replace("/", "~1")
+
+
+def get_pointer(parts: Iterable[str | int]) -> str:
+    """Return JSON pointer of the given path parts."""
+    return "".join(f"/{escape_part(part)}" for part in parts)
+
+
+def unescape_part(part: str) -> str:
+    """Unescape a reference token of a JSON pointer."""
+    return part.replace("~1", "/").replace("~0", "~")
+
+
+def get_parts(pointer: str) -> list[str]:
+    """Return path parts of the given JSON pointer."""
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {pointer!r}")
+    return [unescape_part(part) for part in pointer[1:].split("/")]
+
+
+def resolve_pointer(document: Any, parts: Sequence[str]) -> Any:
+    """Return the document node at the given path parts.
+
+    Raises LookupError if there is no such node.
+    """
+    node = document
+    for part in parts:
+        if isinstance(node, Mapping):
+            node = node[part]
+        elif isinstance(node, list):
+            if not part.isdigit():
+                raise IndexError(part)
+            node = node[int(part)]
+        else:
+            raise KeyError(part)
+    return node
+
+
+def get_dependencies(
+    document: Any,
+    pointer: str,
+    refs_cache: dict[str, frozenset[str] | None],
+    strict: bool = True,
+) -> frozenset[str] | None:
+    """Return pointers of the subtree and its local references.
+
+    Returns None if the subtree has references that are not local JSON
+    pointers or changes their base URI. Such references are skipped
+    instead if not ``strict``.
+    """
+    dependencies: set[str] = set()
+    stack = [pointer]
+    while stack:
+        pointer = stack.pop()
+        if pointer in dependencies:
+            continue
+        dependencies.add(pointer)
+        try:
+            refs = refs_cache[pointer]
+        except KeyError:
+            refs = refs_cache[pointer] = get_refs(document, pointer, strict)
+        if refs is None:
+            return None
+        stack.extend(refs)
+    return frozenset(dependencies)
+
+
+def get_refs(
+    document: Any, pointer: str, strict: bool = True
+) -> frozenset[str] | None:
+    """Return pointers of local references in the subtree.
+
+    Returns None if the subtree has references that are not local JSON
+    pointers or changes their base URI. Such references are skipped
+    instead if not ``strict``.
+    """
+    try:
+        node = resolve_pointer(document, get_parts(pointer))
+    except LookupError:
+        # unresolvable, changes only if the pointer is added
+        return frozenset()
+
+    refs: set[str] = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Mapping):
+            if strict and ("$id" in node or "$dynamicRef" in node):
+                return None
+            if "$id" in node:
+                # references below are not relative to the document
+                continue
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                if ref == "#" or ref.startswith("#/"):
+                    refs.add(unquote(ref[1:]))
+                elif strict:
+                    return None
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return frozenset(refs)
@@ -24,3 +24,9 @@ class SupportsValidation(Protocol):
         base_uri: str = "",
         spec_url: str | None = None,
     ) -> None: ...
+
+
+class ValidationTracer(Protocol):
+    def start(self, keyword: str, pointer: str) -> None: ...
+
+    def end(self, keyword: str, pointer: str, seconds: float) -> None: ...
@@ -1,7 +1,13 @@
 from collections import defaultdict
 from collections.abc import Mapping
 
+from jsonschema.exceptions import ValidationError
+
+from openapi_spec_validator.validation.filters import SpecFilter
 from openapi_spec_validator.validation.keywords import KeywordValidator
+from openapi_spec_validator.validation.protocols import ValidationTracer
+from openapi_spec_validator.validation.timings import KeywordTimings
+from openapi_spec_validator.validation.timings import TimedKeywordValidator
 
 
 class KeywordValidatorRegistry(defaultdict[str, KeywordValidator]):
@@ -10,10 +16,42 @@ class KeywordValidatorRegistry(defaultdict[str, KeywordValidator]):
     ):
         super().__init__()
         self.keyword_validators = keyword_validators
+        # time.monotonic() value to stop validation at, if any
+        self.deadline: float | None = None
+        # paths and components to validate, all if not set
+        self.spec_filter: SpecFilter | None = None
+        # errors reported for reference targets
+        # (target URI -> (error class, message, path, schema id) -> error)
+        self.reported_errors: dict[
+            str,
+            dict[
+                tuple[type, str, tuple[str | int, ...], int | None],
+                ValidationError,
+            ],
+        ] = {}
+        # timings of created keyword validators, if recorded
+        self.timings: KeywordTimings | None = None
+        # tracer notified of validation spans, if traced
+        self.tracer: ValidationTracer | None = None
 
     def __missing__(self, keyword: str) -> KeywordValidator:
         if keyword not in self.keyword_validators:
             raise KeyError(keyword)
         cls = self.keyword_validators[keyword]
-        self[keyword] = cls(self)
+        keyword_validator = cls(self)
+        if self.timings is not None:
+            keyword_validator = TimedKeywordValidator(
+                self,
+                keyword_validator,
+                self.timings,
+                self.timings.get_timing(keyword),
+            )
+        self[keyword] = keyword_validator
         return self[keyword]
+
+    def reset(self) -> None:
+        """Reset state of created keyword validators to validate a new spec."""
+        self.deadline = None
+        self.reported_errors = {}
+        for keyword_validator in self.values():
+            keyword_validator.reset()
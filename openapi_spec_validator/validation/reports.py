@@ -0,0 +1,86 @@
+"""OpenAPI spec validator validation reports module."""
+
+from collections.abc import Iterator
+from typing import Any
+
+from jsonschema.exceptions import ValidationError
+
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from openapi_spec_validator.validation.pointers import get_parts
+
+
+class ErrorRecord:
+    """Compact record of a validation error.
+
+    Unlike the error, the record keeps no references to the spec.
+    ``pointer`` is the JSON pointer of the spec location the error was
+    raised for, if known, and ``keyword`` the failed JSON Schema keyword,
+    if any.
+    """
+
+    __slots__ = ("error_cls", "message", "pointer", "keyword")
+
+    def __init__(
+        self,
+        error_cls: type[OpenAPIValidationError],
+        message: str,
+        pointer: str | None = None,
+        keyword: str | None = None,
+    ):
+        self.error_cls = error_cls
+        self.message = message
+        self.pointer = pointer
+        self.keyword = keyword
+
+    @classmethod
+    def create_from(
+        cls, error: ValidationError, pointer: str | None = None
+    ) -> "ErrorRecord":
+        error_cls = OpenAPIValidationError
+        if isinstance(error, OpenAPIValidationError):
+            error_cls = type(error)
+        keyword = error.validator if isinstance(error.validator, str) else None
+        return cls(error_cls, error.message, pointer, keyword)
+
+    @property
+    def code(self) -> str:
+        return self.error_cls.__name__
+
+    def to_error(self) -> OpenAPIValidationError:
+        """Create a validation error from the record."""
+        kwargs: dict[str, Any] = {}
+        if self.keyword is not None:
+            kwargs["validator"] = self.keyword
+        if self.pointer is not None:
+            kwargs["path"] = get_parts(self.pointer)
+        return self.error_cls(self.message, **kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}"
+            f"({self.code}, {self.pointer!r}, {self.message!r})"
+        )
+
+
+class ValidationReport:
+    """Errors of a spec validation as compact records."""
+
+    __slots__ = ("records",)
+
+    def __init__(self, records: list[ErrorRecord]):
+        self.records = records
+
+    @property
+    def valid(self) -> bool:
+        return not self.records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[ErrorRecord]:
+        return iter(self.records)
+
+    def iter_errors(self) -> Iterator[OpenAPIValidationError]:
+        """Iterate over validation errors created from the records."""
+        for record in self.records:
+            yield record.to_error()
@@ -0,0 +1,309 @@
+"""OpenAPI spec validator validation shards module."""
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import chain
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+from jsonschema.exceptions import ValidationError
+from jsonschema_path.paths import SchemaPath
+from jsonschema_path.typing import Schema
+from referencing.exceptions import Unresolvable
+
+from openapi_spec_validator.validation.exceptions import (
+    DuplicateOperationIDError,
+)
+from openapi_spec_validator.validation.exceptions import (
+    UnresolvableWorkerError,
+)
+from openapi_spec_validator.validation.keywords import KeywordValidator
+from openapi_spec_validator.validation.keywords import OperationValidator
+from openapi_spec_validator.validation.keywords import PathValidator
+from openapi_spec_validator.validation.keywords import SchemaValidator
+from openapi_spec_validator.validation.pointers import escape_part
+
+if TYPE_CHECKING:
+    from openapi_spec_validator.validation.registries import (
+        KeywordValidatorRegistry,
+    )
+    from openapi_spec_validator.validation.types import SpecValidatorType
+    from openapi_spec_validator.validation.validators import SpecValidator
+
+# number of shards per worker, to even out uneven shard costs
+SHARDS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Contiguous slice of paths and component schemas in document order."""
+
+    index: int
+    urls: tuple[str, ...] = ()
+    schema_names: tuple[str, ...] = ()
+
+    def iter_parts(self) -> Iterator[tuple[str, ...]]:
+        """Iterate over path parts of the shard paths and schemas."""
+        for url in self.urls:
+            yield ("paths", url)
+        for name in self.schema_names:
+            yield ("components", "schemas", name)
+
+
+@dataclass(frozen=True)
+class OperationMarker:
+    """Marks the position of an operation with an operationId."""
+
+    url: str
+    name: str
+    operation_id: Any
+
+
+@dataclass(frozen=True)
+class ShardError:
+    """Error raised in a shard with the schema it was raised for.
+
+    ``schema_key`` is the JSON pointer of the innermost schema being
+    validated when the error was raised, if any. ``visiting`` tells whether
+    the schema was traversed (True) or meta-checked (False) at that time.
+    """
+
+    error: ValidationError
+    schema_key: str | None = None
+    visiting: bool = False
+
+
+@dataclass
+class ShardResult:
+    index: int
+    items: list[ShardError | OperationMarker] = field(default_factory=list)
+    visited_keys: set[str] = field(default_factory=set)
+    meta_checked_keys: set[str] = field(default_factory=set)
+
+
+class OperationMarkerValidator(KeywordValidator):
+    """Yields an operation marker before validating the operation."""
+
+    def __init__(
+        self,
+        registry: "KeywordValidatorRegistry",
+        operation_validator: OperationValidator,
+    ):
+        super().__init__(registry)
+        self.operation_validator = operation_validator
+
+    def reset(self) -> None:
+        self.operation_validator.reset()
+
+    def __call__(
+        self,
+        url: str,
+        name: str,
+        operation: SchemaPath,
+        path_parameters: SchemaPath | None,
+    ) -> Iterator[ValidationError | OperationMarker]:
+        if "operationId" in operation:
+            operation_id = (operation / "operationId").read_value()
+            if operation_id is not None:
+                yield OperationMarker(url, name, operation_id)
+
+        yield from self.operation_validator(
+            url, name, operation, path_parameters
+        )
+
+
+def get_shards(spec: Schema, shards_count: int) -> list[Shard] | None:
+    """Split paths and component schemas into contiguous shards.
+
+    Returns None if the spec structure can not be sharded.
+    """
+    paths = spec.get("paths", {})
+    components = spec.get("components", {})
+    if not isinstance(paths, Mapping) or not isinstance(components, Mapping):
+        return None
+    schemas = components.get("schemas", {})
+    if not isinstance(schemas, Mapping):
+        return None
+
+    items = [("path", url) for url in paths]
+    items += [("schema", name) for name in schemas]
+    if not items:
+        return []
+
+    shards_count = max(1, min(shards_count, len(items)))
+    size, rest = divmod(len(items), shards_count)
+    shards = []
+    start = 0
+    for index in range(shards_count):
+        end = start + size + (1 if index < rest else 0)
+        chunk = items[start:end]
+        shards.append(
+            Shard(
+                index=index,
+                urls=tuple(key for kind, key in chunk if kind == "path"),
+                schema_names=tuple(
+                    key for kind, key in chunk if kind == "schema"
+                ),
+            )
+        )
+        start = end
+    return shards
+
+
+def get_pointers(spec: Schema) -> dict[int, str]:
+    """Map ids of the spec container nodes to their JSON pointers."""
+    pointers: dict[int, str] = {}
+    stack: list[tuple[Any, str]] = [(spec, "")]
+    while stack:
+        node, pointer = stack.pop()
+        if isinstance(node, Mapping):
+            pointers.setdefault(id(node), pointer)
+            for key, value in node.items():
+                if isinstance(value, (Mapping, list)):
+                    stack.append((value, f"{pointer}/{escape_part(key)}"))
+        elif isinstance(node, list):
+            pointers.setdefault(id(node), pointer)
+            for index, value in enumerate(node):
+                if isinstance(value, (Mapping, list)):
+                    stack.append((value, f"{pointer}/{index}"))
+    return pointers
+
+
+def validate_shard(
+    validator_cls: "SpecValidatorType",
+    spec: Schema,
+    base_uri: str,
+    shard: Shard,
+    pointers: Mapping[int, str],
+) -> ShardResult:
+    """Validate shard paths and component schemas with fresh state."""
+    validator = validator_cls(spec, base_uri=base_uri)
+    return run_shard(validator, shard, pointers)
+
+
+def run_shard(
+    validator: "SpecValidator", shard: Shard, pointers: Mapping[int, str]
+) -> ShardResult:
+    """Validate shard paths and component schemas with the validator.
+
+    The validator keyword validators registry must have fresh or reset
+    state.
+    """
+    registry = validator.keyword_validators_registry
+    path_validator = cast(PathValidator, registry["path"])
+    schema_validator = cast(SchemaValidator, registry["schema"])
+    if not isinstance(registry["operation"], OperationMarkerValidator):
+        registry["operation"] = OperationMarkerValidator(
+            registry, cast(OperationValidator, registry["operation"])
+        )
+
+    # clone with parts so keys are not split on the path separator
+    spec_path = validator.schema_path
+    errors = chain(
+        chain.from_iterable(
+            path_validator(url, spec_path._clone_with_parts(("paths", url)))
+            for url in shard.urls
+        ),
+        chain.from_iterable(
+            schema_validator(
+                spec_path._clone_with_parts(("components", "schemas", name))
+            )
+            for name in shard.schema_names
+        ),
+    )
+
+    result = ShardResult(index=shard.index)
+    for item in cast(Iterator[ValidationError | OperationMarker], errors):
+        if isinstance(item, OperationMarker):
+            result.items.append(item)
+            continue
+
+        schema_key = None
+        visiting = False
+        if schema_validator.schema_stack:
+            schema_id, visiting = schema_validator.schema_stack[-1]
+            schema_key = pointers.get(schema_id)
+        result.items.append(ShardError(item, schema_key, visiting))
+
+    assert schema_validator.visited_schema_ids is not None
+    assert schema_validator.meta_checked_schema_ids is not None
+    result.visited_keys = {
+        pointers[schema_id]
+        for schema_id in schema_validator.visited_schema_ids
+        if schema_id in pointers
+    }
+    result.meta_checked_keys = {
+        pointers[schema_id]
+        for schema_id in schema_validator.meta_checked_schema_ids
+        if schema_id in pointers
+    }
+    return result
+
+
+def merge_shard_results(
+    results: Iterable[ShardResult],
+) -> Iterator[ValidationError]:
+    """Merge shard results in document order.
+
+    Errors of schemas already validated by an earlier shard are dropped
+    and duplicate operationIds across shards are reported, so the merged
+    stream matches the errors of a sequential run.
+    """
+    visited_keys: set[str] = set()
+    meta_checked_keys: set[str] = set()
+    operation_ids: set[Any] = set()
+    for result in results:
+        shard_operation_ids: set[Any] = set()
+        for item in result.items:
+            if isinstance(item, OperationMarker):
+                # duplicates within a shard are reported by the shard
+                if (
+                    item.operation_id in operation_ids
+                    and item.operation_id not in shard_operation_ids
+                ):
+                    yield DuplicateOperationIDError(
+                        f"Operation ID '{item.operation_id}' for "
+                        f"'{item.name}' in '{item.url}' is not unique"
+                    )
+                shard_operation_ids.add(item.operation_id)
+                continue
+
+            if item.schema_key is not None:
+                seen_keys = (
+                    visited_keys if item.visiting else meta_checked_keys
+                )
+                if item.schema_key in seen_keys:
+                    continue
+            yield item.error
+
+        visited_keys |= result.visited_keys
+        meta_checked_keys |= result.meta_checked_keys
+        operation_ids |= shard_operation_ids
+
+
+# worker process state set up by init_shard_worker
+_worker_context: (
+    tuple["SpecValidatorType", Schema, str, dict[int, str]] | None
+) = None
+
+
+def init_shard_worker(
+    validator_cls: "SpecValidatorType", spec: Schema, base_uri: str
+) -> None:
+    """Keep the spec in the worker process to validate its shards."""
+    global _worker_context
+    _worker_context = (validator_cls, spec, base_uri, get_pointers(spec))
+
+
+def validate_shard_in_worker(shard: Shard) -> ShardResult:
+    assert _worker_context is not None
+    validator_cls, spec, base_uri, pointers = _worker_context
+    try:
+        return validate_shard(validator_cls, spec, base_uri, shard, pointers)
+    except Unresolvable as exc:
+        # resolution state of the error can not be pickled
+        raise UnresolvableWorkerError.create_from(exc) from None
@@ -0,0 +1,127 @@
+"""OpenAPI spec validator validation timings module."""
+
+from collections.abc import Iterator
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Any
+
+from openapi_spec_validator.validation.keywords import KeywordValidator
+
+if TYPE_CHECKING:
+    from openapi_spec_validator.validation.registries import (
+        KeywordValidatorRegistry,
+    )
+
+
+class KeywordTiming:
+    """Calls, errors and time of a keyword validator.
+
+    ``total_seconds`` includes time spent in other keyword validators
+    called by it, ``self_seconds`` does not. Time of recursive calls is
+    counted once.
+    """
+
+    __slots__ = ("calls", "errors", "total_seconds", "self_seconds", "active")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.self_seconds = 0.0
+        # calls being resumed, to not count recursive calls twice
+        self.active = 0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "self_seconds": self.self_seconds,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(calls={self.calls}, "
+            f"errors={self.errors}, total_seconds={self.total_seconds:.6f}, "
+            f"self_seconds={self.self_seconds:.6f})"
+        )
+
+
+class KeywordTimings:
+    """Timings of keyword validators by keyword."""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, KeywordTiming] = {}
+        # time spent in keyword validators called by the resumed ones
+        self.child_seconds: list[float] = []
+
+    def __getitem__(self, keyword: str) -> KeywordTiming:
+        return self.timings[keyword]
+
+    def get_timing(self, keyword: str) -> KeywordTiming:
+        timing = self.timings.get(keyword)
+        if timing is None:
+            timing = self.timings[keyword] = KeywordTiming()
+        return timing
+
+    def clear(self) -> None:
+        self.timings.clear()
+
+    def as_dict(self) -> dict[str, dict[str, int | float]]:
+        """Timings by keyword, most self time first."""
+        timings = sorted(
+            self.timings.items(),
+            key=lambda item: item[1].self_seconds,
+            reverse=True,
+        )
+        return {keyword: timing.as_dict() for keyword, timing in timings}
+
+
+class TimedKeywordValidator(KeywordValidator):
+    """Records calls, errors and time of a keyword validator.
+
+    Validators are generators, so the time of every resumption is
+    measured. Other attributes are read from the keyword validator.
+    """
+
+    def __init__(
+        self,
+        registry: "KeywordValidatorRegistry",
+        keyword_validator: KeywordValidator,
+        timings: KeywordTimings,
+        timing: KeywordTiming,
+    ):
+        super().__init__(registry)
+        self.keyword_validator = keyword_validator
+        self.timings = timings
+        self.timing = timing
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.keyword_validator, name)
+
+    def reset(self) -> None:
+        self.keyword_validator.reset()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        timing = self.timing
+        child_seconds = self.timings.child_seconds
+        timing.calls += 1
+        errors = self.keyword_validator(*args, **kwargs)  # type: ignore
+        while True:
+            timing.active += 1
+            child_seconds.append(0.0)
+            start = perf_counter()
+            try:
+                err = next(errors)
+            except StopIteration:
+                return
+            finally:
+                seconds = perf_counter() - start
+                timing.self_seconds += seconds - child_seconds.pop()
+                timing.active -= 1
+                if not timing.active:
+                    timing.total_seconds += seconds
+                if child_seconds:
+                    child_seconds[-1] += seconds
+            timing.errors += 1
+            yield err
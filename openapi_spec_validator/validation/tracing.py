@@ -0,0 +1,99 @@
+"""OpenAPI spec validator validation tracing module."""
+
+from dataclasses import dataclass
+from time import perf_counter
+
+from openapi_spec_validator.validation.protocols import ValidationTracer
+
+
+class TracedSpan:
+    """Span of a spec part validated by a keyword validator.
+
+    The tracer is notified when the span starts and ends.
+    """
+
+    __slots__ = ("tracer", "keyword", "pointer", "started")
+
+    def __init__(self, tracer: ValidationTracer, keyword: str, pointer: str):
+        self.tracer = tracer
+        self.keyword = keyword
+        self.pointer = pointer
+        tracer.start(keyword, pointer)
+        self.started = perf_counter()
+
+    def end(self) -> None:
+        seconds = perf_counter() - self.started
+        self.tracer.end(self.keyword, self.pointer, seconds)
+
+
+@dataclass
+class RecordedSpan:
+    keyword: str
+    pointer: str
+    # number of spans open when the span started
+    depth: int
+    # not set until the span ends
+    seconds: float | None = None
+
+
+class SpanRecorder:
+    """Validation tracer keeping spans in memory, in order of start."""
+
+    def __init__(self) -> None:
+        self.spans: list[RecordedSpan] = []
+        self._open_spans: list[RecordedSpan] = []
+
+    def start(self, keyword: str, pointer: str) -> None:
+        span = RecordedSpan(keyword, pointer, len(self._open_spans))
+        self.spans.append(span)
+        self._open_spans.append(span)
+
+    def end(self, keyword: str, pointer: str, seconds: float) -> None:
+        # spans of abandoned validations can end in any order
+        for index in range(len(self._open_spans) - 1, -1, -1):
+            span = self._open_spans[index]
+            if span.keyword == keyword and span.pointer == pointer:
+                del self._open_spans[index]
+                span.seconds = seconds
+                return
+
+    def get_spans(self, keyword: str | None = None) -> list[RecordedSpan]:
+        if keyword is None:
+            return list(self.spans)
+        return [span for span in self.spans if span.keyword == keyword]
+
+    def clear(self) -> None:
+        self.spans.clear()
+        self._open_spans.clear()
+
+
+class SpanStack:
+    """Validation tracer keeping pointers of the open spans.
+
+    The tracer, if any, is notified of the spans too.
+    """
+
+    def __init__(self, tracer: ValidationTracer | None = None):
+        self.tracer = tracer
+        self.open_spans: list[tuple[str, str]] = []
+
+    def start(self, keyword: str, pointer: str) -> None:
+        self.open_spans.append((keyword, pointer))
+        if self.tracer is not None:
+            self.tracer.start(keyword, pointer)
+
+    def end(self, keyword: str, pointer: str, seconds: float) -> None:
+        # spans of abandoned validations can end in any order
+        for index in range(len(self.open_spans) - 1, -1, -1):
+            if self.open_spans[index] == (keyword, pointer):
+                del self.open_spans[index]
+                break
+        if self.tracer is not None:
+            self.tracer.end(keyword, pointer, seconds)
+
+    def get_pointer(self, keywords: tuple[str, ...]) -> str | None:
+        """Return pointer of the innermost open span of the keywords."""
+        for keyword, pointer in reversed(self.open_spans):
+            if keyword in keywords:
+                return pointer
+        return None
@@ -4,14 +4,23 @@ import logging
 import warnings
 from collections.abc import Iterator
 from collections.abc import Mapping
-from functools import lru_cache
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from itertools import islice
+from time import monotonic
 from typing import cast
 
 from jsonschema.exceptions import ValidationError
 from jsonschema.protocols import Validator
 from jsonschema_path.handlers import default_handlers
 from jsonschema_path.paths import SchemaPath
+from jsonschema_path.typing import ResolverHandlers
 
+from openapi_spec_validator.schemas import get_validator_backend
 from openapi_spec_validator.schemas import openapi_v2_schema_validator
 from openapi_spec_validator.schemas import openapi_v30_schema_validator
 from openapi_spec_validator.schemas import openapi_v31_schema_validator
@@ -19,15 +28,50 @@ from openapi_spec_validator.schemas import openapi_v32_schema_validator
 from openapi_spec_validator.schemas.types import AnySchema
 from openapi_spec_validator.settings import OpenAPISpecValidatorSettings
 from openapi_spec_validator.validation import keywords
+from openapi_spec_validator.validation.caches import RecordingHandler
+from openapi_spec_validator.validation.caches import ResultCache
+from openapi_spec_validator.validation.decorators import caches_per_instance
+from openapi_spec_validator.validation.decorators import clear_instance_cache
 from openapi_spec_validator.validation.decorators import unwraps_iter
 from openapi_spec_validator.validation.decorators import wraps_cached_iter
 from openapi_spec_validator.validation.decorators import wraps_errors
+from openapi_spec_validator.validation.exceptions import DeadlineExceeded
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from openapi_spec_validator.validation.exceptions import (
+    UnresolvableWorkerError,
+)
+from openapi_spec_validator.validation.exceptions import ValidationTimeoutError
+from openapi_spec_validator.validation.filters import SpecFilter
+from openapi_spec_validator.validation.pointers import get_pointer
+from openapi_spec_validator.validation.protocols import ValidationTracer
 from openapi_spec_validator.validation.registries import (
     KeywordValidatorRegistry,
 )
+from openapi_spec_validator.validation.reports import ErrorRecord
+from openapi_spec_validator.validation.reports import ValidationReport
+from openapi_spec_validator.validation.shards import SHARDS_PER_WORKER
+from openapi_spec_validator.validation.shards import Shard
+from openapi_spec_validator.validation.shards import ShardResult
+from openapi_spec_validator.validation.shards import get_pointers
+from openapi_spec_validator.validation.shards import get_shards
+from openapi_spec_validator.validation.shards import init_shard_worker
+from openapi_spec_validator.validation.shards import merge_shard_results
+from openapi_spec_validator.validation.shards import validate_shard
+from openapi_spec_validator.validation.shards import validate_shard_in_worker
+from openapi_spec_validator.validation.timings import KeywordTimings
+from openapi_spec_validator.validation.tracing import SpanStack
 
 log = logging.getLogger(__name__)
 
+EXECUTORS = {"process", "thread"}
+
+
+def check_max_errors(max_errors: int) -> None:
+    if max_errors < 1:
+        raise ValueError(
+            f"Invalid max_errors: {max_errors!r}. Expected a positive number."
+        )
+
 
 class SpecValidator:
     resolver_handlers = default_handlers
@@ -42,6 +86,12 @@ class SpecValidator:
         schema: AnySchema,
         base_uri: str = "",
         spec_url: str | None = None,
+        workers: int | None = None,
+        executor: str = "process",
+        include: Sequence[str] | None = None,
+        exclude: Sequence[str] | None = None,
+        timings: bool = False,
+        tracer: ValidationTracer | None = None,
     ) -> None:
         if spec_url is not None:
             warnings.warn(
@@ -50,31 +100,90 @@ class SpecValidator:
             )
             base_uri = spec_url
         self.base_uri = base_uri
+        if executor not in EXECUTORS:
+            raise ValueError(
+                f"Unknown executor: {executor!r}. "
+                "Expected one of: process, thread."
+            )
+        self.workers = workers
+        self.executor = executor
+        self.spec_filter: SpecFilter | None = None
+        if include is not None or exclude:
+            self.spec_filter = SpecFilter(
+                tuple(include) if include is not None else None,
+                tuple(exclude or ()),
+            )
+
+        # calls, errors and time of keyword validators, if recorded
+        self.keyword_timings: KeywordTimings | None = None
+        if timings:
+            self.keyword_timings = KeywordTimings()
+        # notified of root, path, operation and schema validation spans
+        self.tracer = tracer
 
+        # result cache needs to know retrieved documents,
+        # so it is used only when the schema path is created here
+        self.result_cache: ResultCache | None = None
+        self.retrieved_documents: dict[str, str] = {}
         if isinstance(schema, SchemaPath):
             self.schema_path = schema
             self.schema = schema.read_value()
         else:
             settings = OpenAPISpecValidatorSettings()
+            handlers: ResolverHandlers = self.resolver_handlers
+            if settings.result_cache_dir is not None:
+                self.result_cache = ResultCache(
+                    settings.result_cache_dir,
+                    settings.result_cache_maxsize,
+                )
+                handlers = {
+                    scheme: RecordingHandler(handler, self.retrieved_documents)
+                    for scheme, handler in handlers.items()
+                }
             self.schema = schema
             self.schema_path = SchemaPath.from_dict(
                 self.schema,
                 base_uri=self.base_uri,
-                handlers=self.resolver_handlers,
+                handlers=handlers,
                 resolved_cache_maxsize=settings.resolved_cache_maxsize,
             )
+        # paths and components to validate
+        self.selected_schema = self.schema
+        if self.spec_filter is not None:
+            self.selected_schema = self.spec_filter.select(self.schema)
 
-        self.keyword_validators_registry = KeywordValidatorRegistry(
-            self.keyword_validators
-        )
+        self.keyword_validators_registry = self._create_registry()
+
+    def _create_registry(self) -> KeywordValidatorRegistry:
+        registry = KeywordValidatorRegistry(self.keyword_validators)
+        registry.spec_filter = self.spec_filter
+        registry.timings = self.keyword_timings
+        registry.tracer = self.tracer
+        return registry
 
     def validate(self) -> None:
         for err in self.iter_errors():
             raise err
 
     def is_valid(self) -> bool:
-        error = next(self.iter_errors(), None)
-        return error is None
+        """Check if the spec is valid.
+
+        The metaschema validation only checks validity, without creating
+        errors, and semantic checks stop at the first error. The result
+        is not cached and cached errors are not used.
+        """
+        if self.result_cache is not None or (
+            self.workers is not None and self.workers > 1
+        ):
+            error = next(self.iter_errors(), None)
+            return error is None
+
+        if not self.schema_validator.is_valid(self.selected_schema):
+            return False
+        # fresh validation state, errors may be iterated later
+        registry = self._create_registry()
+        root_validator = cast(keywords.RootValidator, registry["__root__"])
+        return next(root_validator(self.schema_path), None) is None
 
     @property
     def root_validator(self) -> keywords.RootValidator:
@@ -83,14 +192,262 @@ class SpecValidator:
             self.keyword_validators_registry["__root__"],
         )
 
+    def clear_cache(self) -> None:
+        """Drop cached errors and validation state to release memory."""
+        clear_instance_cache(self, "_iter_cached_errors")
+        self.keyword_validators_registry = self._create_registry()
+
+    def iter_errors(
+        self,
+        max_errors: int | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[ValidationError]:
+        """Iterate over validation errors.
+
+        With ``max_errors`` at most that many errors are yielded. Errors
+        are generated lazily, so the spec is traversed only until the
+        last of them is found.
+
+        With ``timeout`` validation stops once the given number of seconds
+        has passed since the call. Errors found by then are followed by a
+        ``ValidationTimeoutError`` listing the parts that were not checked.
+        Such runs start with fresh validation state and are not cached.
+        """
+        if timeout is None:
+            errors = self._iter_cached_errors()
+        else:
+            errors = self._iter_deadline_errors(monotonic() + timeout)
+        if max_errors is None:
+            return errors
+        check_max_errors(max_errors)
+        return islice(errors, max_errors)
+
+    def report(self, max_errors: int | None = None) -> ValidationReport:
+        """Validate the spec and return a compact report of its errors.
+
+        Errors are kept as records of their class, spec location, keyword
+        and message, and validation errors are created from them only on
+        demand. Reports are not cached; the spec is validated
+        sequentially with fresh validation state.
+        """
+        if max_errors is not None:
+            check_max_errors(max_errors)
+        records = islice(self._iter_error_records(), max_errors)
+        return ValidationReport(list(records))
+
+    def _iter_error_records(self) -> Iterator[ErrorRecord]:
+        for err in self.schema_validator.iter_errors(self.selected_schema):
+            yield ErrorRecord.create_from(err, get_pointer(err.absolute_path))
+
+        registry = self._create_registry()
+        # pointers of the paths and operations being validated
+        span_stack = SpanStack(registry.tracer)
+        registry.tracer = span_stack
+        root_validator = cast(keywords.RootValidator, registry["__root__"])
+        pointers: dict[int, str] | None = None
+        for err in root_validator(self.schema_path):
+            pointer = None
+            # not created if the spec has no schemas
+            schema_validator = cast(
+                keywords.SchemaValidator | None, registry.get("schema")
+            )
+            if schema_validator is not None and schema_validator.schema_stack:
+                if pointers is None:
+                    pointers = get_pointers(self.schema)
+                schema_id, _ = schema_validator.schema_stack[-1]
+                schema_pointer = pointers.get(schema_id)
+                if schema_pointer is not None:
+                    parts = list(err.path)
+                    if not isinstance(err, OpenAPIValidationError):
+                        # errors of default values
+                        parts.insert(0, "default")
+                    pointer = schema_pointer + get_pointer(parts)
+            if pointer is None:
+                pointer = span_stack.get_pointer(("operation", "path"))
+            yield ErrorRecord.create_from(err, pointer)
+
     @unwraps_iter
-    @lru_cache(maxsize=None)
+    @caches_per_instance
     @wraps_cached_iter
+    def _iter_cached_errors(self) -> Iterator[ValidationError]:
+        if self.result_cache is not None:
+            return self._iter_result_cache_errors(self.result_cache)
+        return self._iter_errors()
+
+    def _iter_result_cache_errors(
+        self, result_cache: ResultCache
+    ) -> Iterator[ValidationError]:
+        validator_cls = type(self)
+        key = result_cache.get_key(
+            self.schema,
+            f"{validator_cls.__module__}.{validator_cls.__qualname__}",
+            get_validator_backend(),
+            self.base_uri,
+            repr(self.spec_filter),
+        )
+        errors = result_cache.get(
+            key, self.resolver_handlers, self.selected_schema
+        )
+        if errors is None:
+            # complete results are stored, even of runs stopped early
+            errors = list(self._iter_errors())
+            result_cache.set(
+                key, self.retrieved_documents, errors, self.selected_schema
+            )
+        yield from errors
+
+    def _iter_deadline_errors(
+        self, deadline: float
+    ) -> Iterator[ValidationError]:
+        registry = self._create_registry()
+        registry.deadline = deadline
+        return self._iter_errors(registry)
+
     @wraps_errors
-    def iter_errors(self) -> Iterator[ValidationError]:
-        yield from self.schema_validator.iter_errors(self.schema)
+    def _iter_errors(
+        self, registry: KeywordValidatorRegistry | None = None
+    ) -> Iterator[ValidationError]:
+        if registry is None:
+            registry = self.keyword_validators_registry
+        try:
+            if self.workers is not None and self.workers > 1:
+                yield from self._iter_sharded_errors(self.workers, registry)
+                return
+
+            yield from self.schema_validator.iter_errors(self.selected_schema)
+
+            root_validator = cast(keywords.RootValidator, registry["__root__"])
+            yield from root_validator(self.schema_path)
+        except DeadlineExceeded as exc:
+            yield self._get_timeout_error(
+                self._get_unchecked_pointers(exc.parts)
+            )
+
+    def _iter_sharded_errors(
+        self, workers: int, registry: KeywordValidatorRegistry
+    ) -> Iterator[ValidationError]:
+        root_validator = cast(keywords.RootValidator, registry["__root__"])
+        shards = get_shards(self.selected_schema, workers * SHARDS_PER_WORKER)
+        if not shards:
+            yield from self.schema_validator.iter_errors(self.selected_schema)
+            if shards is None:
+                yield from root_validator(self.schema_path)
+            else:
+                yield from root_validator.iter_tags_errors(self.schema_path)
+            return
+
+        executor, futures = self._submit_shards(shards, workers)
+        # shards not validated by the deadline
+        unchecked_shards: list[Shard] = []
+        try:
+            # metaschema validation runs while shards are validated
+            yield from self.schema_validator.iter_errors(self.selected_schema)
+            yield from root_validator.iter_tags_errors(self.schema_path)
+            yield from merge_shard_results(
+                self._iter_shard_results(
+                    shards, futures, registry.deadline, unchecked_shards
+                )
+            )
+            if unchecked_shards:
+                yield self._get_timeout_error(
+                    [
+                        get_pointer(parts)
+                        for shard in unchecked_shards
+                        for parts in shard.iter_parts()
+                    ]
+                )
+        finally:
+            # do not wait for shards still running after the deadline
+            executor.shutdown(wait=not unchecked_shards, cancel_futures=True)
+
+    def _iter_shard_results(
+        self,
+        shards: list[Shard],
+        futures: list[Future[ShardResult]],
+        deadline: float | None,
+        unchecked_shards: list[Shard],
+    ) -> Iterator[ShardResult]:
+        for shard, future in zip(shards, futures):
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - monotonic())
+            try:
+                yield future.result(timeout=timeout)
+            except FuturesTimeoutError:
+                unchecked_shards.extend(shards[shard.index :])
+                return
+            except UnresolvableWorkerError as exc:
+                raise exc.restore() from None
+
+    def _get_unchecked_pointers(
+        self, parts: tuple[str | int, ...]
+    ) -> list[str]:
+        """Return pointers of parts not checked when stopped at the parts.
+
+        Paths and component schemas are validated in document order, so
+        the ones following the part validation was stopped at are not
+        checked either.
+        """
+        if parts[:1] == ("paths",) and len(parts) > 1:
+            urls = list(self.selected_schema["paths"])
+            pointers = [
+                get_pointer(("paths", url))
+                for url in urls[urls.index(parts[1]) :]
+            ]
+            if "components" in self.schema:
+                pointers.append(get_pointer(("components",)))
+            return pointers
+
+        if parts[:2] == ("components", "schemas") and len(parts) > 2:
+            names = list(self.selected_schema["components"]["schemas"])
+            return [
+                get_pointer(("components", "schemas", name))
+                for name in names[names.index(parts[2]) :]
+            ]
 
-        yield from self.root_validator(self.schema_path)
+        return [get_pointer(parts)]
+
+    def _get_timeout_error(
+        self, unchecked: list[str]
+    ) -> ValidationTimeoutError:
+        message = "Validation deadline exceeded, not checked: " + ", ".join(
+            repr(pointer) for pointer in unchecked[:3]
+        )
+        if len(unchecked) > 3:
+            message += f" and {len(unchecked) - 3} more"
+        return ValidationTimeoutError(message, unchecked=unchecked)
+
+    def _submit_shards(
+        self, shards: list[Shard], workers: int
+    ) -> tuple[Executor, list[Future[ShardResult]]]:
+        validator_cls = type(self)
+        base_uri = self.schema_path.base_uri
+        if self.executor == "thread":
+            # every shard owns its validation state,
+            # threads only share the read-only spec and pointers
+            pointers = get_pointers(self.schema)
+            thread_executor = ThreadPoolExecutor(max_workers=workers)
+            return thread_executor, [
+                thread_executor.submit(
+                    validate_shard,
+                    validator_cls,
+                    self.schema,
+                    base_uri,
+                    shard,
+                    pointers,
+                )
+                for shard in shards
+            ]
+
+        process_executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_shard_worker,
+            initargs=(validator_cls, self.schema, base_uri),
+        )
+        return process_executor, [
+            process_executor.submit(validate_shard_in_worker, shard)
+            for shard in shards
+        ]
 
 
 class OpenAPIV2SpecValidator(SpecValidator):
@@ -5,14 +5,26 @@ Benchmark suite for openapi-spec-validator performance testing.
 Usage:
     python runner.py --output results.json
     python runner.py --profile  # Generates profile data
+    python runner.py --scaling 1000 5000 10000 40000  # Schema count scaling
+    python runner.py --workers 8 --executor thread  # Sharded validation
+    python runner.py --memory 10000  # RSS while validating many specs
+    python runner.py --allof-chains 10 50  # Deep allOf inheritance chains
+    python runner.py --is-valid  # is_valid() compared to the first error
+    python runner.py --load  # Spec loading, YAML and JSON
+    python runner.py --load-memory 200  # Peak RSS reading a 200 MB spec
 """
 
 import argparse
 import cProfile
 import gc
 import json
+import os
 import pstats
+import resource
 import statistics
+import subprocess
+import sys
+import tempfile
 import time
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -21,12 +33,14 @@ from io import StringIO
 from pathlib import Path
 from typing import Any
 
+from jsonschema_path.handlers import all_urls_handler
 from jsonschema_path.typing import Schema
 
 from openapi_spec_validator import schemas
 from openapi_spec_validator import validate
 from openapi_spec_validator.readers import read_from_filename
 from openapi_spec_validator.settings import OpenAPISpecValidatorSettings
+from openapi_spec_validator.shortcuts import get_validator_cls
 
 
 @dataclass
@@ -106,13 +120,224 @@ def get_spec_version(spec: Schema) -> str:
     return "unknown"
 
 
-def run_once(spec: Schema) -> float:
+def run_once(
+    spec: Schema,
+    workers: int | None = None,
+    executor: str = "process",
+) -> float:
     """Run validation once and return elapsed time."""
     t0 = time.perf_counter()
-    validate(spec)
+    if workers is None:
+        validate(spec)
+    else:
+        validator_cls = get_validator_cls(spec)
+        validator_cls(spec, workers=workers, executor=executor).validate()
     return time.perf_counter() - t0
 
 
+def is_gil_enabled() -> bool:
+    """Check if the GIL is enabled (always on standard CPython builds)."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    if check is None:
+        return True
+    return bool(check())
+
+
+def get_rss_kb() -> int:
+    """Current resident set size, peak RSS if not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def benchmark_memory(count: int, samples: int = 10) -> dict[str, Any]:
+    """Validate many specs in one process and sample RSS.
+
+    RSS should stay flat once warmed up, validators and their cached
+    errors are released together with the validator.
+    """
+    print(f"⚡ Validating {count} specs in one process...")
+    step = max(1, count // samples)
+    rss_kb: list[int] = []
+    t0 = time.perf_counter()
+    for i in range(count):
+        spec = generate_synthetic_spec(10, 5)
+        spec["info"]["title"] = f"Memory API {i}"
+        validate(spec)
+        if (i + 1) % step == 0:
+            gc.collect()
+            rss_kb.append(get_rss_kb())
+            print(f"   {i + 1:>8} specs: RSS {rss_kb[-1] / 1024:.1f} MiB")
+    seconds = time.perf_counter() - t0
+
+    warm_rss_kb = rss_kb[min(1, len(rss_kb) - 1)]
+    growth_kb = rss_kb[-1] - warm_rss_kb
+    print(
+        "   RSS growth after warmup: {:.1f} MiB ({:.2f}s)".format(
+            growth_kb / 1024, seconds
+        )
+    )
+    return {
+        "specs_count": count,
+        "seconds": seconds,
+        "rss_kb": rss_kb,
+        "rss_growth_kb": growth_kb,
+    }
+
+
+def benchmark_is_valid(
+    spec: Schema,
+    spec_name: str = "spec",
+    repeats: int = 7,
+    warmup: int = 2,
+) -> dict[str, Any]:
+    """Compare ``is_valid()`` with taking the first of validation errors.
+
+    ``is_valid()`` only checks validity in the metaschema validation,
+    without creating errors, and skips the per instance error cache.
+    """
+    print(f"⚡ Checking validity of {spec_name} spec...")
+    validator_cls = get_validator_cls(spec)
+
+    def first_error() -> bool:
+        return next(validator_cls(spec).iter_errors(), None) is None
+
+    def is_valid() -> bool:
+        return validator_cls(spec).is_valid()
+
+    checks = {"first_error": first_error, "is_valid": is_valid}
+    result: dict[str, Any] = {"spec_name": spec_name}
+    for name, check in checks.items():
+        for _ in range(warmup):
+            check()
+        seconds: list[float] = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            result["valid"] = check()
+            seconds.append(time.perf_counter() - t0)
+        result[f"{name}_median_s"] = statistics.median(seconds)
+    result["speedup"] = result["first_error_median_s"] / (
+        result["is_valid_median_s"]
+    )
+    print(
+        "   valid: {}, first error {:.4f}s, is_valid {:.4f}s, x{:.2f}".format(
+            result["valid"],
+            result["first_error_median_s"],
+            result["is_valid_median_s"],
+            result["speedup"],
+        )
+    )
+    return result
+
+
+def benchmark_load(
+    spec_files: list[Path],
+    repeats: int = 7,
+    warmup: int = 2,
+) -> list[dict[str, Any]]:
+    """Compare reading spec files with loading them through URL handlers.
+
+    Every spec is also converted to JSON, to measure the JSON fast path.
+    """
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for spec_file in spec_files:
+            spec, _ = read_from_filename(str(spec_file))
+            json_file = Path(tmp_dir) / f"{spec_file.stem}.json"
+            json_file.write_text(json.dumps(spec))
+            for path in (spec_file, json_file):
+                print(f"⚡ Loading {path.name}...")
+                uri = path.absolute().as_uri()
+                loaders = {
+                    "url_handler": lambda: all_urls_handler(uri),
+                    "read_from_filename": lambda: read_from_filename(
+                        str(path)
+                    ),
+                }
+                result: dict[str, Any] = {
+                    "spec_name": path.name,
+                    "spec_size_kb": path.stat().st_size / 1024,
+                }
+                for name, load in loaders.items():
+                    for _ in range(warmup):
+                        load()
+                    seconds: list[float] = []
+                    for _ in range(repeats):
+                        t0 = time.perf_counter()
+                        load()
+                        seconds.append(time.perf_counter() - t0)
+                    result[f"{name}_median_s"] = statistics.median(seconds)
+                result["speedup"] = result["url_handler_median_s"] / (
+                    result["read_from_filename_median_s"]
+                )
+                print(
+                    "   url handler {:.4f}s, read_from_filename {:.4f}s, "
+                    "x{:.2f}".format(
+                        result["url_handler_median_s"],
+                        result["read_from_filename_median_s"],
+                        result["speedup"],
+                    )
+                )
+                results.append(result)
+    return results
+
+
+LOAD_MEMORY_CODE = """
+import json, resource, sys, time
+from openapi_spec_validator import readers
+reader = getattr(readers, sys.argv[1])
+base_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+spec, _ = reader(sys.argv[2])
+seconds = time.perf_counter() - t0
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"base_kb": base_kb, "peak_kb": peak_kb, "seconds": seconds}))
+"""
+
+
+def benchmark_load_memory(
+    size_mb: int,
+    readers: tuple[str, ...] = ("read_from_filename", "read_from_mmap"),
+) -> list[dict[str, Any]]:
+    """Compare peak RSS of readers on a generated JSON spec.
+
+    Every reader runs in a new process, so its peak RSS is not affected
+    by the spec generation or other readers.
+    """
+    # a synthetic path takes about 350 bytes of indented JSON
+    paths = max(1, size_mb * 1024 * 1024 // 350)
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        spec_file = Path(tmp_dir) / "openapi.json"
+        print(f"⚡ Generating {size_mb} MB spec ({paths} paths)...")
+        with open(spec_file, "w") as f:
+            json.dump(generate_synthetic_spec(paths, 1000), f, indent=2)
+        size_kb = spec_file.stat().st_size / 1024
+        for reader in readers:
+            print(f"⚡ Reading with {reader}...")
+            output = subprocess.run(
+                [sys.executable, "-c", LOAD_MEMORY_CODE, reader, spec_file],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = {"reader": reader, "spec_size_kb": size_kb}
+            result.update(json.loads(output))
+            result["growth_kb"] = result["peak_kb"] - result["base_kb"]
+            print(
+                "   peak RSS {:.1f} MiB, growth {:.1f} MiB ({:.2f}s)".format(
+                    result["peak_kb"] / 1024,
+                    result["growth_kb"] / 1024,
+                    result["seconds"],
+                )
+            )
+            results.append(result)
+    return results
+
+
 def benchmark_spec_file(
     spec_path: Path,
     repeats: int = 7,
@@ -140,6 +365,8 @@ def benchmark_spec(
     profile: str | None = None,
     spec_name: str = "spec",
     spec_size_kb: float = 0,
+    workers: int | None = None,
+    executor: str = "process",
 ) -> BenchResult:
     """Benchmark a single OpenAPI spec."""
     try:
@@ -155,7 +382,7 @@ def benchmark_spec(
 
         # Warmup
         for _ in range(warmup):
-            run_once(spec)
+            run_once(spec, workers=workers, executor=executor)
 
         pr: cProfile.Profile | None = None
         if profile:
@@ -166,7 +393,7 @@ def benchmark_spec(
         # Actual benchmark
         seconds: list[float] = []
         for _ in range(repeats):
-            seconds.append(run_once(spec))
+            seconds.append(run_once(spec, workers=workers, executor=executor))
 
         if profile:
             assert pr is not None
@@ -262,6 +489,150 @@ def generate_synthetic_spec(
     }
 
 
+def generate_scaling_spec(
+    schemas: int,
+    version: str = "3.0.0",
+) -> dict[str, Any]:
+    """Generate synthetic OpenAPI spec with many inline schemas.
+
+    Every component schema contributes several inline subschemas and
+    references a shared base schema, so the number of schemas visited
+    grows linearly with ``schemas`` without building deep ``$ref`` chains.
+    """
+    schemas_obj: dict[str, Any] = {
+        "Base": {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}},
+        },
+    }
+    for i in range(schemas):
+        schemas_obj[f"Schema{i}"] = {
+            "allOf": [
+                {"$ref": "#/components/schemas/Base"},
+                {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {
+                        "name": {"type": "string", "default": f"name{i}"},
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                        },
+                        "meta": {
+                            "type": "object",
+                            "properties": {
+                                "created": {
+                                    "type": "string",
+                                    "format": "date-time",
+                                },
+                            },
+                        },
+                    },
+                },
+            ],
+        }
+
+    return {
+        "openapi": version,
+        "info": {
+            "title": f"Scaling API ({schemas} schemas)",
+            "version": "1.0.0",
+        },
+        "paths": {},
+        "components": {"schemas": schemas_obj},
+    }
+
+
+def generate_allof_chains_spec(
+    chains: int,
+    depth: int = 10,
+    version: str = "3.0.0",
+) -> dict[str, Any]:
+    """Generate synthetic OpenAPI spec with deep ``allOf`` inheritance.
+
+    Every chain level extends the previous level and a mixin, which
+    extends the previous level too, so properties of a level are
+    reachable through many ``allOf`` routes.
+    """
+    schemas_obj: dict[str, Any] = {}
+    for c in range(chains):
+        schemas_obj[f"Chain{c}Level0"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer"}},
+        }
+        for d in range(1, depth):
+            parent = f"#/components/schemas/Chain{c}Level{d - 1}"
+            schemas_obj[f"Chain{c}Mixin{d}"] = {
+                "allOf": [
+                    {"$ref": parent},
+                    {
+                        "type": "object",
+                        "properties": {f"mixin{d}": {"type": "string"}},
+                    },
+                ],
+            }
+            schemas_obj[f"Chain{c}Level{d}"] = {
+                "allOf": [
+                    {"$ref": parent},
+                    {"$ref": f"#/components/schemas/Chain{c}Mixin{d}"},
+                    {
+                        "type": "object",
+                        "required": ["id", f"mixin{d}", f"level{d}"],
+                        "properties": {f"level{d}": {"type": "string"}},
+                    },
+                ],
+            }
+
+    return {
+        "openapi": version,
+        "info": {
+            "title": f"allOf chains API ({chains} chains, {depth} levels)",
+            "version": "1.0.0",
+        },
+        "paths": {},
+        "components": {"schemas": schemas_obj},
+    }
+
+
+def get_allof_chains_specs_iterator(
+    chain_counts: list[int],
+) -> Iterator[tuple[dict[str, Any], str, float]]:
+    """Iterator over specs with 10 level allOf chains."""
+    for chain_count in chain_counts:
+        spec = generate_allof_chains_spec(chain_count)
+        yield spec, f"allof_chains_{chain_count}", 0
+
+
+def get_scaling_specs_iterator(
+    schema_counts: list[int],
+) -> Iterator[tuple[dict[str, Any], str, float]]:
+    """Iterator over scaling specs with increasing schema counts."""
+    for schema_count in schema_counts:
+        spec = generate_scaling_spec(schema_count)
+        yield spec, f"scaling_{schema_count}", 0
+
+
+def print_scaling_summary(results: list[dict[str, Any]]) -> None:
+    """Print time per schema, which stays flat when scaling is linear."""
+    print("\n📈 Scaling summary (time per schema should stay flat):")
+    baseline: float | None = None
+    for result in results:
+        if not result["success"] or not result["schemas_count"]:
+            continue
+        per_schema = result["median_s"] / result["schemas_count"]
+        if baseline is None:
+            baseline = per_schema
+        print(
+            "   {:>8} schemas: {:.4f}s, {:.1f}µs/schema, x{:.2f}".format(
+                result["schemas_count"],
+                result["median_s"],
+                per_schema * 1e6,
+                per_schema / baseline,
+            )
+        )
+
+
 def get_synthetic_specs_iterator(
     configs: list[tuple[int, int, str]],
 ) -> Iterator[tuple[dict[str, Any], str, float]]:
@@ -299,6 +670,53 @@ def main():
     parser.add_argument(
         "--no-gc", action="store_true", help="Disable GC during benchmark"
     )
+    parser.add_argument(
+        "--scaling",
+        type=int,
+        nargs="+",
+        metavar="SCHEMAS",
+        help="Benchmark scaling specs with the given schema counts.",
+    )
+    parser.add_argument(
+        "--allof-chains",
+        type=int,
+        nargs="+",
+        metavar="CHAINS",
+        help="Benchmark specs with the given counts of 10 level allOf chains.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Validate paths and component schemas in a worker pool.",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=("process", "thread"),
+        default="process",
+        help="Worker pool executor used with --workers.",
+    )
+    parser.add_argument(
+        "--memory",
+        type=int,
+        metavar="SPECS",
+        help="Sample RSS while validating the given number of specs.",
+    )
+    parser.add_argument(
+        "--is-valid",
+        action="store_true",
+        help="Compare is_valid() with taking the first validation error.",
+    )
+    parser.add_argument(
+        "--load",
+        action="store_true",
+        help="Compare reading spec files with loading them by URL.",
+    )
+    parser.add_argument(
+        "--load-memory",
+        type=int,
+        metavar="MB",
+        help="Compare peak RSS of readers on a spec of the given size.",
+    )
     parser.add_argument("--output", type=str, help="Output JSON file path")
     parser.add_argument(
         "--profile", type=str, help="Profile file path (cProfile)"
@@ -311,6 +729,43 @@ def main():
     print("Spec schema validator backend selection:")
     print(f"  Configured backend mode: {settings.schema_validator_backend}")
     print(f"  Effective backend: {schemas.get_validator_backend()}")
+    print(f"  GIL enabled: {is_gil_enabled()}")
+    if args.workers is not None:
+        print(f"  Workers: {args.workers} ({args.executor})")
+
+    if args.memory:
+        output = {"memory": benchmark_memory(args.memory)}
+        print(json.dumps(output, indent=2))
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+            print(f"\n💾 Results saved to {args.output}")
+        return
+
+    if args.load_memory:
+        output = {"load_memory": benchmark_load_memory(args.load_memory)}
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+            print(f"\n💾 Results saved to {args.output}")
+        return
+
+    if args.load:
+        spec_files = args.specs or sorted(
+            (Path(__file__).parent / "specs").glob("*.yaml")
+        )
+        output = {
+            "load": benchmark_load(
+                spec_files,
+                repeats=max(args.repeats, 3),
+                warmup=args.warmup,
+            )
+        }
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+            print(f"\n💾 Results saved to {args.output}")
+        return
 
     # Benchmark custom specs
     if args.specs:
@@ -319,6 +774,16 @@ def main():
         )
         spec_iterator = get_specs_iterator(args.specs)
 
+    # Scaling specs for schema count growth
+    elif args.scaling:
+        print(f"\n🔍 Testing with scaling specs {args.scaling}")
+        spec_iterator = get_scaling_specs_iterator(args.scaling)
+
+    # Specs with deep allOf inheritance chains
+    elif args.allof_chains:
+        print(f"\n🔍 Testing with allOf chains specs {args.allof_chains}")
+        spec_iterator = get_allof_chains_specs_iterator(args.allof_chains)
+
     # Synthetic specs for stress testing
     else:
         print("\n🔍 Testing with synthetic specs")
@@ -332,11 +797,24 @@ def main():
 
     # Iterate over provided specs
     for spec, spec_name, spec_size_kb in spec_iterator:
+        if args.is_valid:
+            results.append(
+                benchmark_is_valid(
+                    spec,
+                    spec_name=spec_name,
+                    repeats=args.repeats,
+                    warmup=args.warmup,
+                )
+            )
+            continue
+
         result = benchmark_spec(
             spec,
             repeats=args.repeats,
             warmup=args.warmup,
             no_gc=args.no_gc,
+            workers=args.workers,
+            executor=args.executor,
             profile=args.profile,
             spec_name=spec_name,
             spec_size_kb=spec_size_kb,
@@ -358,10 +836,16 @@ def main():
             "repeats": args.repeats,
             "warmup": args.warmup,
             "no_gc": args.no_gc,
+            "workers": args.workers,
+            "executor": args.executor,
+            "gil_enabled": is_gil_enabled(),
         },
         "results": results,
     }
 
+    if args.scaling and not args.is_valid:
+        print_scaling_summary(results)
+
     print(f"\n📊 Summary: {len(results)} specs benchmarked")
     print(json.dumps(output, indent=2))
 
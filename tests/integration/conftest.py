@@ -6,6 +6,8 @@ import pytest
 from jsonschema_path.handlers.file import FilePathHandler
 from jsonschema_path.handlers.urllib import UrllibHandler
 
+from openapi_spec_validator.validation import caches as caches_module
+
 
 def spec_file_url(spec_file, schema="file"):
     directory = path.abspath(path.dirname(__file__))
@@ -36,3 +38,9 @@ def factory():
         spec_from_file=spec_from_file,
         spec_from_url=spec_from_url,
     )
+
+
+@pytest.fixture(autouse=True)
+def subschema_result_cache(monkeypatch):
+    # process wide, so created again from settings for every test
+    monkeypatch.setattr(caches_module, "_subschema_result_cache", None)
@@ -286,6 +286,115 @@ openapi: 3.0.0
     assert "stdin: 2 validation errors found" in out
 
 
+def test_max_errors_limits_validation_errors(capsys):
+    spec_io = StringIO(
+        """
+openapi: 3.0.0
+"""
+    )
+
+    testargs = [
+        "--validation-errors",
+        "all",
+        "--max-errors",
+        "1",
+        "--schema",
+        "3.0.0",
+        "-",
+    ]
+    with mock.patch("openapi_spec_validator.__main__.sys.stdin", spec_io):
+        with pytest.raises(SystemExit):
+            main(testargs)
+
+    out, err = capsys.readouterr()
+    assert not err
+    assert "stdin: Validation Error: [1]" in out
+    assert "stdin: Validation Error: [2]" not in out
+    assert "stdin: 1 validation errors found (--max-errors reached)" in out
+
+
+def test_max_errors_invalid(capsys):
+    testargs = ["--max-errors", "0", "-"]
+    with pytest.raises(SystemExit) as exc_info:
+        main(testargs)
+
+    assert exc_info.value.code == 2
+    out, err = capsys.readouterr()
+    assert "argument --max-errors: expected a positive number" in err
+
+
+def test_only_validates_matching_paths(capsys):
+    spec_io = StringIO(
+        """
+openapi: 3.0.0
+info:
+  title: Only API
+  version: 1.0.0
+paths:
+  /pets:
+    get:
+      responses:
+        "200":
+          description: OK
+  /tags:
+    get:
+      parameters:
+        - name: limit
+          in: query
+          schema:
+            type: integer
+            default: ten
+      responses:
+        "200":
+          description: OK
+"""
+    )
+
+    testargs = ["--only", "/pets", "--schema", "3.0.0", "-"]
+    with mock.patch("openapi_spec_validator.__main__.sys.stdin", spec_io):
+        main(testargs)
+
+    out, err = capsys.readouterr()
+    assert not err
+    assert "stdin: OK" in out
+
+
+def test_timings_printed_after_validation_error(capsys):
+    spec_io = StringIO(
+        """
+openapi: 3.0.0
+info:
+  title: Timings API
+  version: 1.0.0
+paths:
+  /pets:
+    get:
+      parameters:
+        - name: limit
+          in: query
+          schema:
+            type: integer
+            default: ten
+      responses:
+        "200":
+          description: OK
+"""
+    )
+
+    testargs = ["--timings", "--schema", "3.0.0", "-"]
+    with mock.patch("openapi_spec_validator.__main__.sys.stdin", spec_io):
+        with pytest.raises(SystemExit):
+            main(testargs)
+
+    out, err = capsys.readouterr()
+    assert not err
+    validation_error, timings = out.split("stdin: Timings\n")
+    assert "stdin: Validation Error:" in validation_error
+    rows = {line.split()[0]: line.split()[1:] for line in timings.splitlines()}
+    assert rows["paths"][:2] == ["1", "1"]
+    assert rows["parameter"][:2] == ["1", "1"]
+
+
 def test_error_alias_controls_subschema_errors_and_warns(capsys):
     testargs = [
         "./tests/integration/data/v3.0/missing-description.yaml",
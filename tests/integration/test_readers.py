@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from openapi_spec_validator.readers import load_spec
+from openapi_spec_validator.readers import read_from_filename
+from openapi_spec_validator.readers import read_from_mmap
+
+
+class TestLoadSpec:
+    def test_json(self):
+        assert load_spec(b'\n {"responses": {"200": {}}}') == {
+            "responses": {"200": {}},
+        }
+
+    def test_json_with_bom(self):
+        assert load_spec(b'\xef\xbb\xbf{"a": 1}') == {"a": 1}
+        assert load_spec('\ufeff{"a": 1}') == {"a": 1}
+
+    def test_yaml(self):
+        assert load_spec("responses:\n  200:\n    created: 2024-01-01\n") == {
+            "responses": {"200": {"created": "2024-01-01"}},
+        }
+
+    def test_yaml_flow_mapping(self):
+        assert load_spec(b"{a: 1, 200: x}") == {"a": 1, "200": "x"}
+
+    def test_json_constant_read_as_yaml(self):
+        assert load_spec('{"a": NaN}') == {"a": "NaN"}
+
+
+class TestReadFromFilename:
+    def test_json_same_as_yaml(self, factory, tmp_path):
+        yaml_path = Path(__file__).parent / "data/v3.0/petstore.yaml"
+        yaml_spec, yaml_uri = read_from_filename(str(yaml_path))
+        json_path = tmp_path / "petstore.json"
+        json_path.write_text(json.dumps(yaml_spec, indent=2))
+
+        json_spec, json_uri = read_from_filename(str(json_path))
+
+        assert (
+            json_spec
+            == yaml_spec
+            == factory.spec_from_file("data/v3.0/petstore.yaml")
+        )
+        assert yaml_uri == yaml_path.absolute().as_uri()
+        assert json_uri == json_path.as_uri()
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(OSError):
+            read_from_filename(str(tmp_path / "missing.yaml"))
+
+
+class TestReadFromMmap:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '\n{"openapi": "3.0.0", "paths": {"/": {}}}',
+            '\ufeff{"a": [1, 2.5, null]}',
+            "openapi: 3.0.0\npaths:\n  /: {}\n",
+            "{a: 1, 200: x}",
+            "",
+        ],
+    )
+    def test_same_as_read_from_filename(self, tmp_path, content):
+        spec_path = tmp_path / "openapi.yaml"
+        spec_path.write_text(content, encoding="utf-8")
+
+        result = read_from_mmap(str(spec_path))
+
+        assert result == read_from_filename(str(spec_path))
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(OSError):
+            read_from_mmap(str(tmp_path / "missing.yaml"))
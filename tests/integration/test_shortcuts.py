@@ -2,24 +2,28 @@ import importlib
 import os
 
 import pytest
+from referencing.exceptions import PointerToNowhere
 
 from openapi_spec_validator import OpenAPIV2SpecValidator
 from openapi_spec_validator import OpenAPIV3SpecValidator
 from openapi_spec_validator import OpenAPIV30SpecValidator
+from openapi_spec_validator import OpenAPIV31SpecValidator
 from openapi_spec_validator import OpenAPIV32SpecValidator
 from openapi_spec_validator import openapi_v2_spec_validator
 from openapi_spec_validator import openapi_v30_spec_validator
 from openapi_spec_validator import openapi_v32_spec_validator
 from openapi_spec_validator import schemas as schemas_module
-from openapi_spec_validator import shortcuts as shortcuts_module
 from openapi_spec_validator import validate
+from openapi_spec_validator import validate_many
 from openapi_spec_validator import validate_spec
 from openapi_spec_validator import validate_spec_url
 from openapi_spec_validator import validate_url
 from openapi_spec_validator.settings import RESOLVED_CACHE_MAXSIZE_DEFAULT
 from openapi_spec_validator.settings import OpenAPISpecValidatorSettings
+from openapi_spec_validator.validation import validators as validators_module
 from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
 from openapi_spec_validator.validation.exceptions import ValidatorDetectError
+from openapi_spec_validator.validation.exceptions import WorkerError
 
 
 class TestValidateSpec:
@@ -32,7 +36,7 @@ class TestValidateSpec:
 
 def test_validate_uses_resolved_cache_maxsize_env(monkeypatch):
     captured: dict[str, int] = {}
-    original_from_dict = shortcuts_module.SchemaPath.from_dict
+    original_from_dict = validators_module.SchemaPath.from_dict
     spec = {
         "openapi": "3.0.0",
         "info": {"title": "Test API", "version": "0.0.1"},
@@ -45,7 +49,7 @@ def test_validate_uses_resolved_cache_maxsize_env(monkeypatch):
 
     monkeypatch.setenv("OPENAPI_SPEC_VALIDATOR_RESOLVED_CACHE_MAXSIZE", "256")
     monkeypatch.setattr(
-        shortcuts_module.SchemaPath,
+        validators_module.SchemaPath,
         "from_dict",
         classmethod(fake_from_dict),
     )
@@ -57,7 +61,7 @@ def test_validate_uses_resolved_cache_maxsize_env(monkeypatch):
 
 def test_validate_uses_default_resolved_cache_on_invalid_env(monkeypatch):
     captured: dict[str, int] = {}
-    original_from_dict = shortcuts_module.SchemaPath.from_dict
+    original_from_dict = validators_module.SchemaPath.from_dict
     spec = {
         "openapi": "3.0.0",
         "info": {"title": "Test API", "version": "0.0.1"},
@@ -70,7 +74,7 @@ def test_validate_uses_default_resolved_cache_on_invalid_env(monkeypatch):
 
     monkeypatch.setenv("OPENAPI_SPEC_VALIDATOR_RESOLVED_CACHE_MAXSIZE", "-1")
     monkeypatch.setattr(
-        shortcuts_module.SchemaPath,
+        validators_module.SchemaPath,
         "from_dict",
         classmethod(fake_from_dict),
     )
@@ -248,6 +252,115 @@ class TestLocalValidatev32Spec:
             validate_spec(spec, validator=openapi_v32_spec_validator)
 
 
+class TestValidateMany:
+    def local_test_suite_file_path(self, test_file):
+        directory = os.path.abspath(os.path.dirname(__file__))
+        return os.path.join(directory, test_file)
+
+    @pytest.fixture
+    def specs(self, factory):
+        return [
+            self.local_test_suite_file_path("data/v3.0/petstore.yaml"),
+            factory.spec_from_file("data/v3.1/petstore.yaml"),
+            self.local_test_suite_file_path("data/v3.0/empty.yaml"),
+            {},
+            self.local_test_suite_file_path("data/missing.yaml"),
+        ]
+
+    def assert_results(self, results, specs):
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert [result.ok for result in results] == [
+            True,
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert results[0].source == specs[0]
+        assert results[0].validator_cls is OpenAPIV30SpecValidator
+        assert results[0].validate_seconds > 0
+        assert results[1].source is None
+        assert results[1].validator_cls is OpenAPIV31SpecValidator
+        assert results[2].exception is None
+        assert results[2].errors
+        assert isinstance(results[3].exception, ValidatorDetectError)
+        assert isinstance(results[4].exception, OSError)
+        assert results[4].validator_cls is None
+
+    def test_sequential(self, specs):
+        results = list(validate_many(specs))
+
+        self.assert_results(results, specs)
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_workers(self, specs, executor):
+        results = list(validate_many(specs, workers=2, executor=executor))
+
+        results.sort(key=lambda result: result.index)
+        self.assert_results(results, specs)
+
+    def test_cls(self, specs):
+        results = list(validate_many(specs[:2], cls=OpenAPIV30SpecValidator))
+
+        assert results[0].ok
+        assert results[1].validator_cls is OpenAPIV30SpecValidator
+
+    def test_unknown_executor(self, specs):
+        with pytest.raises(ValueError, match="Unknown executor"):
+            list(validate_many(specs, workers=2, executor="fiber"))
+
+    @pytest.fixture
+    def unresolvable_spec(self):
+        return {
+            "openapi": "3.0.0",
+            "info": {"title": "Unresolvable API"},
+            "paths": {
+                "/pets": {
+                    "get": {
+                        "responses": {
+                            "default": {
+                                "$ref": "#/components/responses/Missing"
+                            },
+                        },
+                    },
+                },
+            },
+        }
+
+    def test_unresolvable_sequential(self, specs, unresolvable_spec):
+        results = list(validate_many([unresolvable_spec, specs[1]]))
+
+        assert isinstance(results[0].exception, PointerToNowhere)
+        assert len(results[0].errors) == 1
+        assert results[1].ok
+
+    def test_unresolvable_process(self, specs, unresolvable_spec):
+        results = list(validate_many([unresolvable_spec, specs[1]], workers=2))
+
+        results.sort(key=lambda result: result.index)
+        exception = results[0].exception
+        assert isinstance(exception, WorkerError)
+        assert exception.exc_type == (
+            "referencing.exceptions.PointerToNowhere"
+        )
+        assert "'/components/responses/Missing' does not exist" in (
+            exception.message
+        )
+        assert [record.code for record in exception.records] == [
+            "OpenAPIValidationError"
+        ]
+        assert results[1].ok
+
+    def test_max_errors(self, specs):
+        (result,) = validate_many(specs[2:3], max_errors=1)
+
+        assert len(result.errors) == 1
+
+    def test_max_errors_invalid(self, specs):
+        with pytest.raises(ValueError, match="Invalid max_errors"):
+            list(validate_many(specs, max_errors=0))
+
+
 @pytest.mark.network
 class TestRemoteValidatev2SpecUrl:
     REMOTE_SOURCE_URL = (
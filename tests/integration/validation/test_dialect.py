@@ -78,7 +78,9 @@ def test_meta_check_error_stops_further_schema_traversal():
     errors = list(OpenAPIV31SpecValidator(spec).iter_errors())
 
     assert len(errors) == 1
-    assert "is not valid under any of the given schemas" in errors[0].message
+    assert "is not valid under any of the" in errors[0].message
+    assert list(errors[0].path) == ["type"]
+    assert errors[0].validator == "anyOf"
 
 
 def test_boolean_schema_uses_root_json_schema_dialect():
@@ -0,0 +1,164 @@
+import pytest
+
+from openapi_spec_validator import OpenAPIV30SpecValidator
+from openapi_spec_validator import OpenAPIV31SpecValidator
+from openapi_spec_validator import SpecValidationEngine
+from openapi_spec_validator.validation.exceptions import (
+    DuplicateOperationIDError,
+)
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from openapi_spec_validator.validation.exceptions import ValidationTimeoutError
+
+
+def make_spec(operation_ids, default=None):
+    paths = {
+        f"/pets/{i}": {
+            "get": {
+                "operationId": operation_id,
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                    },
+                },
+            },
+        }
+        for i, operation_id in enumerate(operation_ids)
+    }
+    name_schema = {"type": "string"}
+    if default is not None:
+        name_schema["default"] = default
+    return {
+        "openapi": "3.1.0",
+        "info": {
+            "title": "Engine API",
+            "version": "1.0.0",
+        },
+        "paths": paths,
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {
+                        "name": name_schema,
+                    },
+                },
+            },
+        },
+    }
+
+
+class TestSpecValidationEngine:
+    @pytest.fixture
+    def engine(self):
+        return SpecValidationEngine(OpenAPIV31SpecValidator)
+
+    def test_valid(self, engine, factory):
+        spec_path = "data/v3.1/petstore.yaml"
+        spec_dict = factory.spec_from_file(spec_path)
+        base_uri = factory.spec_file_url(spec_path)
+
+        engine.validate(spec_dict, base_uri=base_uri)
+
+        assert engine.is_valid(spec_dict, base_uri=base_uri)
+
+    def test_errors_match_spec_validator(self, engine):
+        spec = make_spec(["getPet", "getPet"], default=1)
+
+        errors = list(engine.iter_errors(spec))
+
+        expected = list(OpenAPIV31SpecValidator(spec).iter_errors())
+        assert [type(err) for err in errors] == [type(err) for err in expected]
+        assert [err.message for err in errors] == [
+            err.message for err in expected
+        ]
+
+    def test_state_is_reset_between_runs(self, engine):
+        spec = make_spec(["getPet"], default=1)
+
+        first_errors = list(engine.iter_errors(spec))
+        second_errors = list(engine.iter_errors(spec))
+
+        assert len(first_errors) == 1
+        assert [err.message for err in second_errors] == [
+            err.message for err in first_errors
+        ]
+
+    def test_keyword_validators_are_reused(self, engine):
+        engine.validate(make_spec(["getPet"]))
+        registry = engine._registries[0]
+        schema_validator = registry["schema"]
+
+        engine.validate(make_spec(["getPet"]))
+
+        assert engine._registries == [registry]
+        assert registry["schema"] is schema_validator
+
+    def test_shared_schema_with_reference(self, engine):
+        # same schema object in both specs, resolved against each spec
+        pet_schema = {
+            "type": "object",
+            "properties": {
+                "name": {"$ref": "#/components/schemas/Name"},
+            },
+            "default": {"name": "Tom"},
+        }
+        specs = [make_spec(["getPet"]), make_spec(["getPet"])]
+        for spec, name_type in zip(specs, ["string", "integer"]):
+            spec["components"]["schemas"]["Name"] = {"type": name_type}
+            spec["components"]["schemas"]["Pet"] = pet_schema
+
+        assert list(engine.iter_errors(specs[0])) == []
+        errors = list(engine.iter_errors(specs[1]))
+
+        assert [err.message for err in errors] == [
+            "'Tom' is not of type 'integer'"
+        ]
+
+    def test_interleaved_runs(self, engine):
+        errors = engine.iter_errors(make_spec(["getPet", "getPet"]))
+        other_errors = engine.iter_errors(make_spec(["getPet"], default=1))
+
+        err = next(errors)
+        other_err = next(other_errors)
+
+        assert isinstance(err, DuplicateOperationIDError)
+        assert other_err.message == "1 is not of type 'string'"
+        assert list(errors) == []
+        assert list(other_errors) == []
+
+    def test_max_errors(self, engine):
+        spec = make_spec(["getPet", "getPet", "getPet"], default=1)
+
+        errors = list(engine.iter_errors(spec, max_errors=2))
+
+        assert [type(err) for err in errors] == [
+            DuplicateOperationIDError,
+            DuplicateOperationIDError,
+        ]
+        assert len(engine._registries) == 1
+        assert len(list(engine.iter_errors(spec))) == 3
+
+    def test_timeout(self, engine):
+        spec = make_spec(["getPet", "getPet"], default=1)
+
+        errors = list(engine.iter_errors(spec, timeout=0))
+
+        assert [type(err) for err in errors] == [ValidationTimeoutError]
+        assert engine._registries[0].deadline is None
+        assert len(list(engine.iter_errors(spec))) == 2
+
+    def test_validate_raises(self, engine):
+        spec = make_spec(["getPet"], default=1)
+
+        with pytest.raises(OpenAPIValidationError):
+            engine.validate(spec)
+
+        assert not engine.is_valid(spec)
+        assert len(engine._registries) == 1
+
+    def test_other_version(self):
+        engine = SpecValidationEngine(OpenAPIV30SpecValidator)
+        spec = make_spec(["getPet"])
+        spec["openapi"] = "3.0.3"
+
+        assert engine.is_valid(spec)
@@ -567,10 +567,10 @@ class TestSpecValidatorIterErrors:
         errors_list = list(errors)
         assert len(errors_list) == 1
         assert errors_list[0].__class__ == OpenAPIValidationError
-        assert (
-            "'string' is not of type 'object', 'boolean'"
-            in errors_list[0].message
-        )
+        assert "string" in errors_list[0].message
+        assert "is not of type" in errors_list[0].message
+        assert list(errors_list[0].path) == ["properties", "name"]
+        assert errors_list[0].validator == "type"
 
     @pytest.mark.parametrize(
         "component_schema",
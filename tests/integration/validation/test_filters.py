@@ -0,0 +1,105 @@
+import pytest
+
+from openapi_spec_validator.validation.filters import SpecFilter
+
+
+class TestSpecFilter:
+    @pytest.mark.parametrize(
+        "include,expected",
+        [
+            (None, True),
+            (("/pets/{petId}",), True),
+            (("/pets/*",), True),
+            (("/tags",), False),
+            (("#/paths",), True),
+            (("#/paths/~1pets~1{petId}",), True),
+            (("#/paths/~1pets~1{petId}/get/responses",), True),
+            (("#/paths/~1pets",), False),
+            (("#",), True),
+            (("Pet",), False),
+        ],
+    )
+    def test_is_path_selected(self, include, expected):
+        spec_filter = SpecFilter(include)
+
+        assert spec_filter.is_path_selected("/pets/{petId}") is expected
+
+    @pytest.mark.parametrize(
+        "include,expected",
+        [
+            (("Pet",), True),
+            (("P*",), True),
+            (("Tag",), False),
+            (("#/components/schemas",), True),
+            (("#/components/schemas/Pet/properties/name",), True),
+            (("#/components/parameters",), False),
+            (("/Pet",), False),
+        ],
+    )
+    def test_is_component_selected(self, include, expected):
+        spec_filter = SpecFilter(include)
+
+        assert spec_filter.is_component_selected("schemas", "Pet") is expected
+
+    def test_exclude(self):
+        spec_filter = SpecFilter(exclude=("/pets/*", "Tag"))
+
+        assert not spec_filter.is_path_selected("/pets/{petId}")
+        assert spec_filter.is_path_selected("/tags")
+        assert not spec_filter.is_component_selected("schemas", "Tag")
+        assert spec_filter.is_component_selected("schemas", "Pet")
+
+    def test_select(self):
+        spec = {
+            "openapi": "3.0.3",
+            "paths": {"/pets": {}, "/tags": {}},
+            "components": {
+                "schemas": {"Pet": {}, "Tag": {}},
+                "parameters": {"limit": {}},
+            },
+        }
+        spec_filter = SpecFilter(("/pets", "Pet"))
+
+        assert spec_filter.select(spec) == {
+            "openapi": "3.0.3",
+            "paths": {"/pets": {}},
+            "components": {
+                "schemas": {"Pet": {}},
+                "parameters": {},
+            },
+        }
+        assert list(spec["paths"]) == ["/pets", "/tags"]
+
+    def test_select_referenced(self):
+        spec = {
+            "openapi": "3.0.3",
+            "paths": {
+                "/pets": {"$ref": "#/paths/~1animals"},
+                "/animals": {
+                    "parameters": [{"$ref": "#/components/parameters/limit"}],
+                },
+                "/tags": {},
+            },
+            "components": {
+                "schemas": {
+                    "Pet": {"$ref": "#/components/schemas/Tag/properties/id"},
+                    "Tag": {
+                        "properties": {"id": {}},
+                        "items": {"$ref": "#/components/schemas/Id"},
+                    },
+                    "Id": {},
+                    "Other": {},
+                },
+                "parameters": {
+                    "limit": {"schema": {"$ref": "#/components/schemas/Pet"}},
+                    "offset": {},
+                },
+            },
+        }
+        spec_filter = SpecFilter(("/pets",))
+
+        selected = spec_filter.select(spec)
+
+        assert list(selected["paths"]) == ["/pets", "/animals"]
+        assert list(selected["components"]["schemas"]) == ["Pet", "Tag", "Id"]
+        assert list(selected["components"]["parameters"]) == ["limit"]
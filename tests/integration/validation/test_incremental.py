@@ -0,0 +1,297 @@
+from copy import deepcopy
+
+import pytest
+
+from openapi_spec_validator import IncrementalSpecValidator
+from openapi_spec_validator import OpenAPIV30SpecValidator
+from openapi_spec_validator import OpenAPIV31SpecValidator
+from openapi_spec_validator.validation.exceptions import (
+    DuplicateOperationIDError,
+)
+from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from openapi_spec_validator.validation.incremental import apply_patch
+from openapi_spec_validator.validation.incremental import get_changed_pointers
+
+
+def make_spec():
+    return {
+        "openapi": "3.1.0",
+        "info": {
+            "title": "Incremental API",
+            "version": "1.0.0",
+        },
+        "paths": {
+            "/pets": {
+                "get": {
+                    "operationId": "listPets",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "$ref": "#/components/schemas/Pet",
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+            "/tags": {
+                "get": {
+                    "operationId": "listTags",
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                        },
+                    },
+                },
+            },
+        },
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                        },
+                    },
+                },
+                "Tag": {
+                    "type": "string",
+                },
+            },
+        },
+    }
+
+
+def get_errors(errors):
+    return [(type(error), error.message) for error in errors]
+
+
+def get_full_errors(spec, validator_cls=OpenAPIV31SpecValidator):
+    return get_errors(validator_cls(spec).iter_errors())
+
+
+class TestIncrementalSpecValidator:
+    @pytest.fixture
+    def validator(self):
+        return IncrementalSpecValidator(OpenAPIV31SpecValidator)
+
+    def test_validate(self, validator):
+        spec = make_spec()
+        spec["components"]["schemas"]["Pet"]["properties"]["name"][
+            "default"
+        ] = 1
+
+        state = validator.validate(spec)
+
+        assert get_errors(state.errors) == get_full_errors(spec)
+        assert get_errors(state.errors) == [
+            (OpenAPIValidationError, "1 is not of type 'string'")
+        ]
+        assert state.validated == [
+            "/paths/~1pets",
+            "/paths/~1tags",
+            "/components/schemas/Pet",
+            "/components/schemas/Tag",
+        ]
+
+    def test_revalidate_path(self, validator):
+        state = validator.validate(make_spec())
+        patch = [
+            {
+                "op": "add",
+                "path": "/paths/~1tags/get/parameters",
+                "value": [{"name": "limit", "in": "query"}],
+            },
+        ]
+
+        new_state = validator.revalidate(state, patch=patch)
+
+        assert new_state.validated == ["/paths/~1tags"]
+        assert get_errors(new_state.errors) == get_full_errors(new_state.spec)
+        assert len(new_state.errors) == 1
+
+    def test_revalidate_referenced_component(self, validator):
+        state = validator.validate(make_spec())
+        patch = [
+            {
+                "op": "add",
+                "path": "/components/schemas/Pet/properties/name/default",
+                "value": 1,
+            },
+        ]
+
+        new_state = validator.revalidate(state, patch=patch)
+
+        assert new_state.validated == [
+            "/paths/~1pets",
+            "/components/schemas/Pet",
+        ]
+        assert get_errors(new_state.errors) == [
+            (OpenAPIValidationError, "1 is not of type 'string'")
+        ]
+
+    def test_revalidate_fix(self, validator):
+        spec = make_spec()
+        spec["components"]["schemas"]["Pet"]["properties"]["name"][
+            "default"
+        ] = 1
+        state = validator.validate(spec)
+        patch = [
+            {
+                "op": "replace",
+                "path": "/components/schemas/Pet/properties/name/default",
+                "value": "Rex",
+            },
+        ]
+
+        new_state = validator.revalidate(state, patch=patch)
+
+        assert new_state.errors == []
+
+    def test_revalidate_spec(self, validator):
+        spec = make_spec()
+        state = validator.validate(spec)
+        new_spec = deepcopy(spec)
+        new_spec["components"]["schemas"]["Tag"]["default"] = 1
+
+        new_state = validator.revalidate(state, spec=new_spec)
+
+        assert new_state.validated == ["/components/schemas/Tag"]
+        assert get_errors(new_state.errors) == get_full_errors(new_spec)
+
+    def test_revalidate_unchanged_spec(self, validator):
+        spec = make_spec()
+        state = validator.validate(spec)
+
+        new_state = validator.revalidate(state, spec=deepcopy(spec))
+
+        assert new_state.validated == []
+        assert new_state.results == state.results
+
+    def test_revalidate_independent_keyword(self, validator):
+        state = validator.validate(make_spec())
+        patch = [
+            {"op": "replace", "path": "/info/title", "value": "Pets"},
+        ]
+
+        new_state = validator.revalidate(state, patch=patch)
+
+        assert new_state.validated == []
+        assert new_state.spec["info"]["title"] == "Pets"
+        assert state.spec["info"]["title"] == "Incremental API"
+
+    def test_revalidate_global_keyword(self, validator):
+        state = validator.validate(make_spec())
+        patch = [
+            {
+                "op": "add",
+                "path": "/jsonSchemaDialect",
+                "value": "https://json-schema.org/draft/2020-12/schema",
+            },
+        ]
+
+        new_state = validator.revalidate(state, patch=patch)
+
+        assert len(new_state.validated) == 4
+
+    def test_revalidate_added_and_removed_paths(self, validator):
+        state = validator.validate(make_spec())
+        patch = [
+            {"op": "remove", "path": "/paths/~1tags"},
+            {
+                "op": "copy",
+                "from": "/paths/~1pets",
+                "path": "/paths/~1cats",
+            },
+        ]
+
+        new_state = validator.revalidate(state, patch=patch)
+
+        assert new_state.validated == ["/paths/~1cats"]
+        assert list(new_state.results) == [
+            "/paths/~1pets",
+            "/paths/~1cats",
+            "/components/schemas/Pet",
+            "/components/schemas/Tag",
+        ]
+        assert get_errors(new_state.errors) == get_full_errors(new_state.spec)
+        assert get_errors(new_state.errors) == [
+            (
+                DuplicateOperationIDError,
+                "Operation ID 'listPets' for 'get' in '/cats' is not unique",
+            ),
+        ]
+
+    def test_revalidate_openapi_v30(self):
+        validator = IncrementalSpecValidator(OpenAPIV30SpecValidator)
+        spec = make_spec()
+        spec["openapi"] = "3.0.3"
+        state = validator.validate(spec)
+        patch = [
+            {
+                "op": "add",
+                "path": "/components/schemas/Tag/default",
+                "value": 1,
+            },
+        ]
+
+        new_state = validator.revalidate(state, patch=patch)
+
+        assert get_errors(new_state.errors) == get_full_errors(
+            new_state.spec, OpenAPIV30SpecValidator
+        )
+
+    def test_revalidate_both(self, validator):
+        spec = make_spec()
+        state = validator.validate(spec)
+
+        with pytest.raises(ValueError):
+            validator.revalidate(state, patch=[], spec=spec)
+
+
+class TestApplyPatch:
+    def test_operations(self):
+        document = {"a": [1, 2], "b": {"c": 3}}
+        patch = [
+            {"op": "add", "path": "/a/1", "value": 5},
+            {"op": "add", "path": "/a/-", "value": 6},
+            {"op": "remove", "path": "/a/0"},
+            {"op": "replace", "path": "/b/c", "value": 4},
+            {"op": "move", "from": "/b/c", "path": "/d"},
+            {"op": "copy", "from": "/a", "path": "/b/e"},
+            {"op": "test", "path": "/d", "value": 4},
+        ]
+
+        result = apply_patch(document, patch)
+
+        assert result == {"a": [5, 2, 6], "b": {"e": [5, 2, 6]}, "d": 4}
+        assert document == {"a": [1, 2], "b": {"c": 3}}
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            {"op": "remove", "path": "/missing"},
+            {"op": "add", "path": "/a/3", "value": 1},
+            {"op": "replace", "path": "/a/x", "value": 1},
+            {"op": "test", "path": "/a/0", "value": 2},
+            {"op": "invalid", "path": "/a"},
+            {"op": "add", "path": "a", "value": 1},
+        ],
+    )
+    def test_invalid(self, operation):
+        with pytest.raises(ValueError):
+            apply_patch({"a": [1]}, [operation])
+
+
+def test_get_changed_pointers():
+    old = {"a": [1, 2], "b": {"c": 1, "d/e": "x"}, "f": 1}
+    new = {"a": [1, 2, 3], "b": {"c": True, "d/e": "x"}, "g": 1}
+
+    changed = get_changed_pointers(old, new)
+
+    assert sorted(changed) == ["/a", "/b/c", "/f", "/g"]
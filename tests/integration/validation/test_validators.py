@@ -1,14 +1,28 @@
+import gc
+import json
+import os
+import pickle
+import threading
+import weakref
+from copy import deepcopy
+
 import pytest
 from jsonschema_path import SchemaPath
+from referencing.exceptions import PointerToNowhere
 from referencing.exceptions import Unresolvable
 
 from openapi_spec_validator import OpenAPIV2SpecValidator
 from openapi_spec_validator import OpenAPIV30SpecValidator
 from openapi_spec_validator import OpenAPIV31SpecValidator
 from openapi_spec_validator import OpenAPIV32SpecValidator
+from openapi_spec_validator.schemas.backend import get_validator_backend
 from openapi_spec_validator.settings import RESOLVED_CACHE_MAXSIZE_DEFAULT
+from openapi_spec_validator.validation import caches as caches_module
+from openapi_spec_validator.validation import keywords as keywords_module
 from openapi_spec_validator.validation import validators as validators_module
 from openapi_spec_validator.validation.exceptions import OpenAPIValidationError
+from openapi_spec_validator.validation.exceptions import ValidationTimeoutError
+from openapi_spec_validator.validation.tracing import SpanRecorder
 
 
 class TestLocalOpenAPIv2Validator:
@@ -69,6 +83,142 @@ class TestLocalOpenAPIv2Validator:
             OpenAPIV2SpecValidator(spec, base_uri=spec_url).validate()
 
 
+def make_shared_parameter_spec(paths_count, default=10):
+    return {
+        "swagger": "2.0",
+        "info": {
+            "title": "Shared API",
+            "version": "1.0.0",
+        },
+        "parameters": {
+            "limit": {
+                "name": "limit",
+                "in": "query",
+                "type": "integer",
+                "default": default,
+            },
+        },
+        "paths": {
+            f"/pets/{i}": {
+                "get": {
+                    "parameters": [
+                        {"$ref": "#/parameters/limit"},
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                        },
+                    },
+                },
+            }
+            for i in range(paths_count)
+        },
+    }
+
+
+def test_value_validators_cache():
+    spec = make_shared_parameter_spec(3, default="ten")
+    validator = OpenAPIV2SpecValidator(spec)
+
+    errors = list(validator.iter_errors())
+
+    assert [err.message for err in errors] == [
+        "'ten' is not of type 'integer'"
+    ]
+    assert errors[0].referrers == [
+        f"/paths/~1pets~1{i}/get/parameters/0" for i in range(3)
+    ]
+    default_validator = validator.keyword_validators_registry["default"]
+    assert default_validator.cache_info() == (2, 1, 128, 1)
+
+
+def test_shared_reference_target_errors_reported_once():
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Shared API", "version": "1.0.0"},
+        "components": {
+            "schemas": {
+                "Count": 1,
+                "First": {"$ref": "#/components/schemas/Count"},
+                "Second": {"$ref": "#/components/schemas/Count"},
+            },
+        },
+    }
+
+    errors = list(OpenAPIV31SpecValidator(spec).iter_errors())
+
+    shared_errors = [err for err in errors if err.referrers]
+    assert [err.message for err in shared_errors] == [
+        "1 is not of type 'object', 'boolean'"
+    ]
+    assert shared_errors[0].referrers == [
+        "/components/schemas/First",
+        "/components/schemas/Second",
+    ]
+
+
+def test_shared_reference_target_same_message_errors():
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Shared API", "version": "1.0.0"},
+        "components": {
+            "schemas": {
+                "First": {"$ref": "#/components/schemas/Tags"},
+                "Second": {"$ref": "#/components/schemas/Tags"},
+                "Tags": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "default": ["x", "x", 1, "x"],
+                },
+            },
+        },
+    }
+
+    errors = list(OpenAPIV31SpecValidator(spec).iter_errors())
+
+    assert [(err.message, list(err.absolute_path)) for err in errors] == [
+        ("'x' is not of type 'integer'", [0]),
+        ("'x' is not of type 'integer'", [1]),
+        ("'x' is not of type 'integer'", [3]),
+    ]
+    for err in errors:
+        assert err.referrers == [
+            "/components/schemas/First",
+            "/components/schemas/Second",
+        ]
+
+
+def test_is_valid_keeps_validation_state():
+    spec = make_shared_parameter_spec(2, default="ten")
+    validator = OpenAPIV2SpecValidator(spec)
+
+    assert not validator.is_valid()
+
+    errors = list(validator.iter_errors())
+    assert [err.message for err in errors] == [
+        "'ten' is not of type 'integer'"
+    ]
+    assert len(errors[0].referrers) == 2
+
+
+def test_value_validators_cache_eviction(monkeypatch):
+    spec = make_shared_parameter_spec(3)
+    spec["parameters"]["offset"] = {
+        "name": "offset",
+        "in": "query",
+        "type": "integer",
+        "default": 0,
+    }
+    for path_item in spec["paths"].values():
+        path_item["get"]["parameters"].append({"$ref": "#/parameters/offset"})
+    validator = OpenAPIV2SpecValidator(spec)
+    default_validator = validator.keyword_validators_registry["default"]
+    monkeypatch.setattr(default_validator, "value_validators_cache_maxsize", 1)
+
+    assert list(validator.iter_errors()) == []
+    assert default_validator.cache_info() == (0, 6, 1, 1)
+
+
 def test_spec_validator_uses_resolved_cache_maxsize_env(monkeypatch):
     captured: dict[str, int] = {}
     original_from_dict = validators_module.SchemaPath.from_dict
@@ -430,6 +580,105 @@ class TestLocalOpenAPIv32Validator:
         )
 
 
+def test_oas31_schema_checkers_are_shared(monkeypatch):
+    created = []
+    original_create = keywords_module._create_schema_checker
+
+    def create_schema_checker(*args):
+        created.append(args)
+        return original_create(*args)
+
+    monkeypatch.setattr(keywords_module, "_schema_checkers", {})
+    monkeypatch.setattr(
+        keywords_module, "_create_schema_checker", create_schema_checker
+    )
+    spec = {
+        "openapi": "3.1.0",
+        "info": {"title": "Test API", "version": "0.0.1"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                },
+                "Tag": {
+                    "$schema": "https://json-schema.org/draft/2020-12/schema",
+                    "type": "string",
+                },
+                "Error": {"type": "object", "required": 1},
+            },
+        },
+    }
+
+    errors = list(OpenAPIV31SpecValidator(spec).iter_errors())
+    other_errors = list(OpenAPIV31SpecValidator(spec).iter_errors())
+
+    assert len(errors) == len(other_errors) == 1
+    assert "is not of type" in errors[0].message
+    # one per dialect, created once for both spec validators
+    assert len(created) == 2
+
+
+def test_resolver_base_uri(tmp_path):
+    pet_path = tmp_path / "schemas" / "pet.json"
+    pet_path.parent.mkdir()
+    pet_path.write_text(json.dumps({"type": "object"}))
+    base_uri = (tmp_path / "openapi.json").as_uri()
+    spec = SchemaPath.from_dict(
+        {"components": {"schemas": {"Pet": {"$ref": "schemas/pet.json"}}}},
+        base_uri=base_uri,
+    )
+
+    with spec.resolve() as resolved:
+        assert keywords_module.get_base_uri(resolved.resolver) == base_uri
+    pet = spec / "components" / "schemas" / "Pet"
+    with pet.resolve() as resolved:
+        assert resolved.contents == {"type": "object"}
+        assert (
+            keywords_module.get_base_uri(resolved.resolver)
+            == pet_path.as_uri()
+        )
+
+
+def test_schema_checker_default_format_checker():
+    validator_cls = keywords_module.OAS30Validator
+
+    schema_checker = keywords_module.get_schema_checker(validator_cls)
+
+    meta_schema_validator = schema_checker.args[0]
+    assert meta_schema_validator.format_checker is validator_cls.FORMAT_CHECKER
+
+
+@pytest.mark.parametrize(
+    "spec_validator_cls,version",
+    [
+        (OpenAPIV31SpecValidator, "3.1.0"),
+        (OpenAPIV32SpecValidator, "3.2.0"),
+    ],
+)
+def test_oas_vocabulary_schema_checked(spec_validator_cls, version):
+    spec = {
+        "openapi": version,
+        "info": {"title": "Test API", "version": "0.0.1"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "discriminator": {"propertyName": 1},
+                },
+            },
+        },
+    }
+
+    errors = list(spec_validator_cls(spec).iter_errors())
+
+    assert len(errors) == 1
+    if get_validator_backend() == "jsonschema":
+        assert errors[0].message == "1 is not of type 'string'"
+
+
 def test_oas31_query_operation_is_not_semantically_traversed():
     spec = {
         "openapi": "3.1.0",
@@ -584,6 +833,839 @@ def test_oas2_oas3_duplicate_top_level_tags_are_invalid(spec, validator_cls):
     assert any(err.message == "Duplicate tag name 'pets'" for err in errors)
 
 
+def make_shared_reference_spec(paths_count: int) -> dict[str, object]:
+    paths = {}
+    for i in range(paths_count):
+        paths[f"/pets/{i}"] = {
+            "get": {
+                "responses": {
+                    "200": {
+                        "description": "ok",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "$ref": "#/components/schemas/Pet",
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        }
+    return {
+        "openapi": "3.0.3",
+        "info": {
+            "title": "Shared API",
+            "version": "1.0.0",
+        },
+        "paths": paths,
+        "components": {
+            "schemas": {
+                "Pet": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "default": 1,
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+def test_shared_reference_target_is_validated_once():
+    spec = make_shared_reference_spec(3)
+    validator = OpenAPIV30SpecValidator(spec)
+
+    errors = list(validator.iter_errors())
+
+    assert len(errors) == 1
+    assert errors[0].message == "1 is not of type 'string'"
+    schema_validator = validator.keyword_validators_registry["schema"]
+    referrers = schema_validator.get_referrers("#/components/schemas/Pet")
+    assert [str(referrer) for referrer in referrers] == [
+        f"paths#/pets/{i}#get#responses#200#content#application/json#schema"
+        for i in range(3)
+    ]
+
+
+def test_max_errors_stops_traversal():
+    spec = make_shared_reference_spec(10)
+    for i, path_item in enumerate(spec["paths"].values()):
+        media_type = path_item["get"]["responses"]["200"]["content"][
+            "application/json"
+        ]
+        media_type["schema"] = {"type": "integer", "default": f"limit{i}"}
+    validator = OpenAPIV30SpecValidator(spec)
+
+    errors = list(validator.iter_errors(max_errors=2))
+
+    assert [err.message for err in errors] == [
+        "'limit0' is not of type 'integer'",
+        "'limit1' is not of type 'integer'",
+    ]
+    schema_validator = validator.keyword_validators_registry["schema"]
+    assert len(schema_validator.visited_schema_ids) == 2
+    assert len(list(validator.iter_errors())) == 11
+
+
+def test_max_errors_invalid():
+    validator = OpenAPIV30SpecValidator(make_shared_reference_spec(1))
+
+    with pytest.raises(ValueError, match="Invalid max_errors: 0"):
+        validator.iter_errors(max_errors=0)
+
+
+class TestDeadline:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(validators_module, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(keywords_module, "monotonic", lambda: clock[0])
+        return clock
+
+    def test_deadline_exceeded(self, clock):
+        spec = make_shared_reference_spec(3)
+        validator = OpenAPIV30SpecValidator(spec)
+
+        errors = validator.iter_errors(timeout=10)
+        err = next(errors)
+        clock[0] = 10
+        timeout_err = next(errors)
+
+        assert err.message == "1 is not of type 'string'"
+        assert isinstance(timeout_err, ValidationTimeoutError)
+        assert timeout_err.unchecked == [
+            "/paths/~1pets~11",
+            "/paths/~1pets~12",
+            "/components",
+        ]
+        assert timeout_err.message == (
+            "Validation deadline exceeded, not checked: "
+            "'/paths/~1pets~11', '/paths/~1pets~12', '/components'"
+        )
+        assert list(errors) == []
+
+    def test_deadline_runs_are_not_cached(self, clock):
+        spec = make_shared_reference_spec(3)
+        validator = OpenAPIV30SpecValidator(spec)
+
+        errors = list(validator.iter_errors(timeout=0))
+
+        assert [type(err) for err in errors] == [ValidationTimeoutError]
+        assert errors[0].unchecked == [""]
+        assert len(list(validator.iter_errors(timeout=1))) == 1
+        assert len(list(validator.iter_errors())) == 1
+
+    def test_deadline_in_component_schemas(self, clock):
+        spec = make_shared_reference_spec(0)
+        schemas = spec["components"]["schemas"]
+        schemas["Tag"] = {"type": "string", "default": 1}
+        validator = OpenAPIV30SpecValidator(spec)
+
+        errors = validator.iter_errors(timeout=10)
+        next(errors)
+        clock[0] = 10
+
+        assert next(errors).unchecked == ["/components/schemas/Tag"]
+
+    def test_sharded_deadline(self, clock, monkeypatch):
+        released = threading.Event()
+
+        def validate_shard(*args):
+            released.wait()
+            return validators_module.ShardResult(args[3].index)
+
+        monkeypatch.setattr(
+            validators_module, "validate_shard", validate_shard
+        )
+        spec = make_shared_reference_spec(2)
+        validator = OpenAPIV30SpecValidator(spec, workers=2, executor="thread")
+
+        try:
+            errors = list(validator.iter_errors(timeout=0))
+        finally:
+            released.set()
+
+        assert [type(err) for err in errors] == [ValidationTimeoutError]
+        assert errors[0].unchecked == [
+            "/paths/~1pets~10",
+            "/paths/~1pets~11",
+            "/components/schemas/Pet",
+        ]
+
+
+class TestFilteredValidation:
+    @pytest.fixture
+    def spec(self):
+        spec = make_shared_reference_spec(3)
+        spec["components"]["schemas"]["Tag"] = {
+            "type": "string",
+            "default": 1,
+        }
+        # invalid structure, reported by the metaschema validation
+        spec["paths"]["/broken"] = {"get": {}}
+        return spec
+
+    def get_messages(self, spec, **kwargs):
+        validator = OpenAPIV30SpecValidator(spec, **kwargs)
+        return [err.message for err in validator.iter_errors()]
+
+    def test_include_path(self, spec):
+        messages = self.get_messages(
+            spec, include=["/pets/{petId}", "/pets/1"]
+        )
+
+        # referenced schema is validated too
+        assert messages == ["1 is not of type 'string'"]
+
+    def test_include_component(self, spec):
+        messages = self.get_messages(spec, include=["Tag"])
+
+        assert messages == ["1 is not of type 'string'"]
+        validator = OpenAPIV30SpecValidator(spec, include=["Tag"])
+        list(validator.iter_errors())
+        schema_validator = validator.keyword_validators_registry["schema"]
+        assert len(schema_validator.visited_schema_ids) == 1
+
+    def test_exclude(self, spec):
+        assert self.get_messages(spec, exclude=["/broken", "Tag"]) == [
+            "1 is not of type 'string'",
+        ]
+
+    def test_unfiltered(self, spec):
+        assert len(self.get_messages(spec)) == 3
+        (message,) = self.get_messages(spec, include=["/broken"])
+        assert "'responses' is a required property" in message.replace(
+            '"', "'"
+        )
+
+    def test_include_path_referenced_component(self, spec):
+        # invalid structure, reported by the metaschema validation
+        spec["components"]["parameters"] = {
+            "Limit": {"name": "limit", "in": "query", "required": "yes"},
+        }
+        spec["paths"]["/pets/0"]["get"]["parameters"] = [
+            {"$ref": "#/components/parameters/Limit"},
+        ]
+
+        assert self.get_messages(spec, include=["/pets/1"]) == [
+            "1 is not of type 'string'",
+        ]
+        messages = self.get_messages(spec, include=["/pets/0"])
+        assert len(messages) == 2
+        assert "Limit" in messages[0] or "limit" in messages[0]
+
+    def test_sharded(self, spec):
+        validator = OpenAPIV30SpecValidator(
+            spec, workers=2, executor="thread", include=["/pets/*"]
+        )
+
+        assert [err.message for err in validator.iter_errors()] == [
+            "1 is not of type 'string'",
+        ]
+
+
+def make_allof_chain_spec(depth, required):
+    schemas = {
+        "Level0": {
+            "type": "object",
+            "properties": {"level0": {"type": "string"}},
+        },
+    }
+    for i in range(1, depth):
+        schemas[f"Level{i}"] = {
+            "allOf": [
+                {"$ref": f"#/components/schemas/Level{i - 1}"},
+                {
+                    "type": "object",
+                    "properties": {f"level{i}": {"type": "string"}},
+                },
+            ],
+        }
+    schemas[f"Level{depth - 1}"]["required"] = required
+    return {
+        "openapi": "3.0.3",
+        "info": {
+            "title": "Chain API",
+            "version": "1.0.0",
+        },
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def test_allof_chain_properties_are_collected_once():
+    spec = make_allof_chain_spec(10, ["level0", "level9", "missing"])
+    validator = OpenAPIV30SpecValidator(spec)
+
+    errors = list(validator.iter_errors())
+
+    assert [err.message for err in errors] == [
+        "Required list has not defined properties: ['missing']",
+    ]
+    schema_validator = validator.keyword_validators_registry["schema"]
+    level0 = spec["components"]["schemas"]["Level0"]
+    assert schema_validator.collected_properties[id(level0)] == {"level0"}
+
+
+def test_allof_cycle_properties_are_collected():
+    spec = make_allof_chain_spec(3, ["level0", "level2", "missing"])
+    schemas = spec["components"]["schemas"]
+    schemas["Level0"]["allOf"] = [{"$ref": "#/components/schemas/Level1"}]
+
+    errors = list(OpenAPIV30SpecValidator(spec).iter_errors())
+
+    assert [err.message for err in errors] == [
+        "Required list has not defined properties: ['missing']",
+    ]
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_sharded_validation_matches_sequential_validation(executor):
+    spec = make_shared_reference_spec(8)
+    for i, path_item in enumerate(spec["paths"].values()):
+        path_item["get"]["operationId"] = f"getPet{i % 3}"
+
+    sequential_errors = list(OpenAPIV30SpecValidator(spec).iter_errors())
+    sharded_errors = list(
+        OpenAPIV30SpecValidator(
+            spec, workers=2, executor=executor
+        ).iter_errors()
+    )
+
+    assert [(type(err), err.message) for err in sharded_errors] == [
+        (type(err), err.message) for err in sequential_errors
+    ]
+    assert len(sharded_errors) == 6
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_sharded_validation_unresolvable_reference(executor, workers):
+    spec = make_shared_reference_spec(8)
+    spec["paths"]["/pets/7"]["get"]["responses"]["200"] = {
+        "$ref": "#/components/responses/Missing"
+    }
+    validator = OpenAPIV30SpecValidator(
+        spec, workers=workers, executor=executor
+    )
+
+    with pytest.raises(
+        PointerToNowhere, match="'/components/responses/Missing'"
+    ):
+        list(validator.iter_errors())
+
+
+def test_sharded_validation_valid(factory):
+    spec_path = "data/v3.0/petstore.yaml"
+    spec = factory.spec_from_file(spec_path)
+    spec_url = factory.spec_file_url(spec_path)
+
+    validator = OpenAPIV30SpecValidator(spec, base_uri=spec_url, workers=2)
+
+    assert validator.is_valid()
+
+
+def test_sharded_validation_unknown_executor():
+    spec = make_shared_reference_spec(1)
+
+    with pytest.raises(ValueError, match="Unknown executor"):
+        OpenAPIV30SpecValidator(spec, workers=2, executor="fiber")
+
+
+def test_spec_validator_is_released_after_validation():
+    spec = make_shared_reference_spec(2)
+    validator = OpenAPIV30SpecValidator(spec)
+    list(validator.iter_errors())
+    validator_ref = weakref.ref(validator)
+
+    del validator
+    gc.collect()
+
+    assert validator_ref() is None
+
+
+def test_spec_validator_clear_cache():
+    spec = make_shared_reference_spec(2)
+    validator = OpenAPIV30SpecValidator(spec)
+    errors = list(validator.iter_errors())
+    assert list(validator.iter_errors()) == errors
+
+    validator.clear_cache()
+
+    revalidated_errors = list(validator.iter_errors())
+    assert len(revalidated_errors) == 1
+    assert revalidated_errors[0] is not errors[0]
+    assert revalidated_errors[0].message == errors[0].message
+
+
+class TestKeywordTimings:
+    def test_not_recorded_by_default(self):
+        validator = OpenAPIV30SpecValidator(make_shared_reference_spec(1))
+
+        list(validator.iter_errors())
+
+        assert validator.keyword_timings is None
+
+    def test_recorded(self):
+        spec = make_shared_reference_spec(2)
+        validator = OpenAPIV30SpecValidator(spec, timings=True)
+
+        errors = list(validator.iter_errors())
+
+        assert len(errors) == 1
+        timings = validator.keyword_timings.as_dict()
+        assert timings["paths"]["calls"] == 1
+        assert timings["mediaType"]["calls"] == 2
+        assert timings["schema"]["calls"] == 3
+        assert timings["schema"]["errors"] == 1
+        assert timings["__root__"]["errors"] == 1
+        root_timing = validator.keyword_timings["__root__"]
+        assert 0 < root_timing.self_seconds <= root_timing.total_seconds
+        assert sum(
+            timing["self_seconds"] for timing in timings.values()
+        ) == pytest.approx(root_timing.total_seconds)
+        json.dumps(timings)
+
+    def test_report(self):
+        spec = make_shared_reference_spec(1)
+        validator = OpenAPIV30SpecValidator(spec, timings=True)
+
+        report = validator.report()
+
+        assert [record.pointer for record in report] == [
+            "/components/schemas/Pet/properties/name/default",
+        ]
+        assert validator.keyword_timings["schema"].calls == 2
+
+
+class TestTracing:
+    def test_spans(self):
+        spec = make_shared_reference_spec(2)
+        recorder = SpanRecorder()
+        validator = OpenAPIV30SpecValidator(spec, tracer=recorder)
+
+        errors = list(validator.iter_errors())
+
+        assert len(errors) == 1
+        media_type_pointer = (
+            "/paths/~1pets~10/get/responses/200/content/application~1json"
+        )
+        assert [
+            (span.keyword, span.pointer, span.depth) for span in recorder.spans
+        ] == [
+            ("__root__", "", 0),
+            ("path", "/paths/~1pets~10", 1),
+            ("operation", "/paths/~1pets~10/get", 2),
+            ("schema", f"{media_type_pointer}/schema", 3),
+            ("schema", f"{media_type_pointer}/schema/properties/name", 4),
+            ("path", "/paths/~1pets~11", 1),
+            ("operation", "/paths/~1pets~11/get", 2),
+            ("schema", "/components/schemas/Pet", 1),
+        ]
+        root_span = recorder.spans[0]
+        assert all(
+            0 <= span.seconds <= root_span.seconds for span in recorder.spans
+        )
+        assert len(recorder.get_spans("schema")) == 3
+
+    def test_spans_ended_on_max_errors(self):
+        spec = make_shared_reference_spec(2)
+        recorder = SpanRecorder()
+        validator = OpenAPIV30SpecValidator(spec, tracer=recorder)
+
+        assert len(list(validator.iter_errors(max_errors=1))) == 1
+        # cached errors keep the validation running until released
+        del validator
+        gc.collect()
+
+        assert all(span.seconds is not None for span in recorder.spans)
+
+
+class TestReport:
+    def test_valid(self):
+        spec = make_shared_reference_spec(1)
+        spec["components"]["schemas"]["Pet"]["properties"]["name"][
+            "default"
+        ] = "name"
+
+        report = OpenAPIV30SpecValidator(spec).report()
+
+        assert report.valid
+        assert len(report) == 0
+
+    def test_records(self):
+        spec = make_shared_reference_spec(2)
+        spec["paths"]["/pets/1"]["get"]["operationId"] = "getPet"
+        spec["paths"]["/pets/0"]["get"]["operationId"] = "getPet"
+        validator = OpenAPIV30SpecValidator(spec)
+
+        report = validator.report()
+
+        assert [
+            (record.code, record.pointer, record.keyword, record.message)
+            for record in report
+        ] == [
+            (
+                "OpenAPIValidationError",
+                "/components/schemas/Pet/properties/name/default",
+                "type",
+                "1 is not of type 'string'",
+            ),
+            (
+                "DuplicateOperationIDError",
+                "/paths/~1pets~11/get",
+                None,
+                "Operation ID 'getPet' for 'get' in '/pets/1' is not unique",
+            ),
+        ]
+        assert not hasattr(report.records[0], "__dict__")
+        assert [err.message for err in report.iter_errors()] == [
+            err.message for err in validator.iter_errors()
+        ]
+
+    def test_unresolvable_parameter_record(self):
+        spec = make_shared_reference_spec(1)
+        spec["paths"]["/pets/{petId}"] = spec["paths"].pop("/pets/0")
+
+        report = OpenAPIV30SpecValidator(spec).report()
+
+        assert [
+            (record.code, record.pointer) for record in report.records[1:]
+        ] == [
+            ("UnresolvableParameterError", "/paths/~1pets~1{petId}/get"),
+        ]
+
+    def test_metaschema_error(self):
+        spec = make_shared_reference_spec(1)
+        spec["components"]["schemas"]["Tag"] = {"type": "strin"}
+
+        report = OpenAPIV30SpecValidator(spec).report()
+
+        pointers = [record.pointer for record in report]
+        assert "/components/schemas/Tag" in pointers
+        assert not report.valid
+
+    def test_to_error(self):
+        report = OpenAPIV30SpecValidator(
+            make_shared_reference_spec(1)
+        ).report()
+
+        error = report.records[0].to_error()
+
+        assert type(error) is OpenAPIValidationError
+        assert error.message == "1 is not of type 'string'"
+        assert error.validator == "type"
+        assert list(error.path) == [
+            "components",
+            "schemas",
+            "Pet",
+            "properties",
+            "name",
+            "default",
+        ]
+
+    def test_max_errors(self):
+        spec = make_shared_reference_spec(1)
+        spec["components"]["schemas"]["Tag"] = {
+            "type": "string",
+            "default": 1,
+        }
+
+        report = OpenAPIV30SpecValidator(spec).report(max_errors=1)
+
+        assert len(report) == 1
+        with pytest.raises(ValueError):
+            OpenAPIV30SpecValidator(spec).report(max_errors=0)
+
+
+class TestResultCache:
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv(
+            "OPENAPI_SPEC_VALIDATOR_RESULT_CACHE_DIR", str(cache_dir)
+        )
+        return cache_dir
+
+    def test_errors_cached(self, cache_dir):
+        spec = make_shared_reference_spec(2)
+        errors = list(OpenAPIV30SpecValidator(spec).iter_errors())
+
+        validator = OpenAPIV30SpecValidator(spec)
+        cached_errors = list(validator.iter_errors())
+
+        assert len(list(cache_dir.glob("*.json"))) == 1
+        assert [err.message for err in cached_errors] == [
+            err.message for err in errors
+        ]
+        # validated from cache, keyword validators were not created
+        assert not validator.keyword_validators_registry
+
+    def test_spec_changed(self, cache_dir):
+        spec = make_shared_reference_spec(2)
+        assert not OpenAPIV30SpecValidator(spec).is_valid()
+
+        name_schema = spec["components"]["schemas"]["Pet"]["properties"][
+            "name"
+        ]
+        name_schema["default"] = "name"
+
+        assert OpenAPIV30SpecValidator(spec).is_valid()
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_external_document_changed(self, cache_dir, tmp_path):
+        pet_path = tmp_path / "pet.json"
+        pet_schema = {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "default": 1,
+                },
+            },
+        }
+        pet_path.write_text(json.dumps(pet_schema))
+        spec = make_shared_reference_spec(1)
+        media_type = spec["paths"]["/pets/0"]["get"]["responses"]["200"][
+            "content"
+        ]["application/json"]
+        media_type["schema"] = {"$ref": "pet.json"}
+        base_uri = (tmp_path / "openapi.json").as_uri()
+        errors = list(
+            OpenAPIV30SpecValidator(spec, base_uri=base_uri).iter_errors()
+        )
+        assert len(errors) == 2
+
+        pet_schema["properties"]["name"]["default"] = "name"
+        pet_path.write_text(json.dumps(pet_schema))
+        errors = list(
+            OpenAPIV30SpecValidator(spec, base_uri=base_uri).iter_errors()
+        )
+
+        assert len(errors) == 1
+
+    def test_equal_specs_share_entry(self, cache_dir):
+        spec = make_shared_reference_spec(2)
+        # the same responses object in both paths
+        responses = spec["paths"]["/pets/0"]["get"]["responses"]
+        spec["paths"]["/pets/1"]["get"]["responses"] = responses
+
+        other_spec = deepcopy(spec)
+        other_spec["paths"]["/pets/1"]["get"]["responses"] = deepcopy(
+            responses
+        )
+
+        OpenAPIV30SpecValidator(spec).is_valid()
+        OpenAPIV30SpecValidator(other_spec).is_valid()
+
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    @pytest.mark.parametrize(
+        "contents,other_contents",
+        [
+            ({200: "OK"}, {"200": "OK"}),
+            ({"tags": ("pet",)}, {"tags": ["pet"]}),
+            ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+        ],
+    )
+    def test_content_digest(self, contents, other_contents):
+        digest = caches_module.get_content_digest(contents)
+
+        assert digest == caches_module.get_content_digest(deepcopy(contents))
+        assert digest != caches_module.get_content_digest(other_contents)
+
+    def test_eviction(self, cache_dir, monkeypatch):
+        spec = make_shared_reference_spec(2)
+        OpenAPIV30SpecValidator(spec).is_valid()
+        (entry_path,) = cache_dir.glob("*.json")
+        entry_size = entry_path.stat().st_size
+        os.utime(entry_path, (0, 0))
+        monkeypatch.setenv(
+            "OPENAPI_SPEC_VALIDATOR_RESULT_CACHE_MAXSIZE",
+            str(entry_size * 3 // 2),
+        )
+
+        spec["info"]["title"] = "Other API"
+        OpenAPIV30SpecValidator(spec).is_valid()
+
+        entry_paths = list(cache_dir.glob("*.json"))
+        assert len(entry_paths) == 1
+        assert entry_paths != [entry_path]
+
+    def test_error_fields_cached(self, cache_dir):
+        spec = make_shared_reference_spec(2)
+        spec["info"]["version"] = 1
+        for path_item in spec["paths"].values():
+            path_item["get"]["operationId"] = "getPet"
+        errors = list(OpenAPIV30SpecValidator(spec).iter_errors())
+
+        cached_errors = list(OpenAPIV30SpecValidator(spec).iter_errors())
+
+        assert len(errors) == 3
+        assert [
+            (
+                type(err),
+                err.message,
+                list(err.path),
+                list(err.schema_path),
+                err.validator,
+                err.validator_value,
+                err.referrers,
+            )
+            for err in cached_errors
+        ] == [
+            (
+                type(err),
+                err.message,
+                list(err.path),
+                list(err.schema_path),
+                err.validator,
+                err.validator_value,
+                err.referrers,
+            )
+            for err in errors
+        ]
+        # taken from the spec
+        assert cached_errors[0].instance == 1
+        # default value
+        assert cached_errors[1].instance == 1
+
+    def test_root_error_entry_size(self, cache_dir):
+        spec = make_shared_reference_spec(200)
+        del spec["info"]
+        name_schema = spec["components"]["schemas"]["Pet"]["properties"][
+            "name"
+        ]
+        name_schema["default"] = "name"
+        OpenAPIV30SpecValidator(spec).is_valid()
+
+        (error,) = OpenAPIV30SpecValidator(spec).iter_errors()
+
+        (entry_path,) = cache_dir.glob("*.json")
+        assert error.instance is spec
+        # messages of jsonschema-rs include the instance
+        assert entry_path.stat().st_size < len(json.dumps(error.message)) + 500
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pickle.dumps(ValueError("not loaded")),
+            b"0" * 64 + b'\n{"documents": {}, "errors": []}',
+        ],
+    )
+    def test_invalid_entry(self, cache_dir, data):
+        spec = make_shared_reference_spec(2)
+        OpenAPIV30SpecValidator(spec).is_valid()
+        (entry_path,) = cache_dir.glob("*.json")
+        entry_path.write_bytes(data)
+
+        assert not OpenAPIV30SpecValidator(spec).is_valid()
+        assert entry_path.read_bytes() != data
+
+    def test_schema_path_not_cached(self, cache_dir):
+        spec = make_shared_reference_spec(2)
+        schema_path = SchemaPath.from_dict(spec)
+
+        assert not OpenAPIV30SpecValidator(schema_path).is_valid()
+        assert not cache_dir.exists()
+
+
+class TestSubschemaResultCache:
+    @pytest.fixture
+    def cache(self, monkeypatch):
+        cache = caches_module.SubschemaResultCache(1024)
+        monkeypatch.setattr(caches_module, "_subschema_result_cache", cache)
+        return cache
+
+    def get_errors(self, spec):
+        validator = OpenAPIV30SpecValidator(deepcopy(spec))
+        return [(type(err), err.message) for err in validator.iter_errors()]
+
+    def test_identical_subschemas_validated_once(self, cache):
+        spec = make_shared_reference_spec(1)
+        errors = self.get_errors(spec)
+        info = cache.cache_info()
+
+        assert self.get_errors(spec) == errors
+        assert errors == [
+            (OpenAPIValidationError, "1 is not of type 'string'")
+        ]
+        # metaschema check and keywords of the Pet schema
+        assert cache.cache_info().hits == info.hits + 2
+        assert cache.cache_info().currsize == info.currsize
+
+    def test_cached_errors_are_copied(self, cache):
+        spec = make_shared_reference_spec(1)
+        validator = OpenAPIV30SpecValidator(deepcopy(spec))
+        errors = list(validator.iter_errors())
+
+        cached_errors = list(OpenAPIV30SpecValidator(spec).iter_errors())
+
+        assert cached_errors[0] is not errors[0]
+        assert cached_errors[0].message == errors[0].message
+
+    def test_nested_schema_referenced(self, cache):
+        spec = make_shared_reference_spec(2)
+        media_type = spec["paths"]["/pets/1"]["get"]["responses"]["200"][
+            "content"
+        ]["application/json"]
+        media_type["schema"] = {
+            "$ref": "#/components/schemas/Pet/properties/name",
+        }
+        errors = self.get_errors(spec)
+
+        assert self.get_errors(spec) == errors
+        assert len(errors) == 1
+
+    def test_sharded(self, cache):
+        spec = make_shared_reference_spec(4)
+        spec["components"]["schemas"]["Tag"] = deepcopy(
+            spec["components"]["schemas"]["Pet"]
+        )
+        validator = OpenAPIV30SpecValidator(spec)
+        errors = [err.message for err in validator.iter_errors()]
+        sharded_validator = OpenAPIV30SpecValidator(
+            deepcopy(spec), workers=2, executor="thread"
+        )
+
+        sharded_errors = [
+            err.message for err in sharded_validator.iter_errors()
+        ]
+
+        assert sharded_errors == errors
+        assert len(errors) == 2
+
+    def test_disabled(self, monkeypatch):
+        cache = caches_module.SubschemaResultCache(0)
+        monkeypatch.setattr(caches_module, "_subschema_result_cache", cache)
+        spec = make_shared_reference_spec(1)
+
+        assert self.get_errors(spec) == self.get_errors(spec)
+        assert cache.cache_info() == (0, 0, 0, 0)
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(caches_module, "_subschema_result_cache", None)
+        monkeypatch.delenv(
+            "OPENAPI_SPEC_VALIDATOR_SUBSCHEMA_CACHE_MAXSIZE", raising=False
+        )
+
+        cache = caches_module.get_subschema_result_cache()
+
+        assert cache.maxsize == 0
+
+    def test_maxsize_env(self, monkeypatch):
+        monkeypatch.setattr(caches_module, "_subschema_result_cache", None)
+        monkeypatch.setenv(
+            "OPENAPI_SPEC_VALIDATOR_SUBSCHEMA_CACHE_MAXSIZE", "16"
+        )
+
+        assert caches_module.get_subschema_result_cache().maxsize == 16
+
+
 @pytest.mark.network
 class TestRemoteOpenAPIv30Validator:
     REMOTE_SOURCE_URL = (